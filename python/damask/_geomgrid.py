@@ -1,7 +1,7 @@
 import os
-import copy
+import tempfile
+import weakref
 import warnings
-import multiprocessing as mp
 from functools import partial
 import typing
 from typing import Optional, Union, TextIO, Sequence, Dict
@@ -28,6 +28,83 @@ def numba_njit_wrapper(**kwargs):
     return (lambda function: nb.njit(function) if nb else function)
 
 
+def _slabs(shape: IntSequence) -> typing.Iterator[slice]:
+    """Split first (x) dimension into slabs of about 2^22 entries."""
+    N_x = max(2**22//int(np.prod(shape[1:])),1)
+    return (slice(x,min(x+N_x,shape[0])) for x in range(0,shape[0],N_x))
+
+def _empty(shape: IntSequence,
+           dtype: np.dtype,
+           out_of_core: bool) -> np.ndarray:
+    """Allocate array in memory or as memory map of an anonymous temporary file."""
+    return np.memmap(tempfile.TemporaryFile(),dtype,'w+',shape=tuple(shape)) if out_of_core else \
+           np.empty(shape,dtype)
+
+def _file_backed(a: np.ndarray) -> bool:
+    """Array is a memory map of a file."""
+    return getattr(a,'_mmap',None) is not None
+
+def _copy(a: np.ndarray,
+          dtype: Optional[np.dtype] = None,
+          out_of_core: Optional[bool] = None) -> np.ndarray:
+    """Copy slab-wise, by default memory maps into memory maps of anonymous temporary files."""
+    b = _empty(a.shape,a.dtype if dtype is None else dtype,_file_backed(a) if out_of_core is None else out_of_core)
+    for x in _slabs(a.shape):
+        b[x] = a[x]
+    return b
+
+_transfer: 'weakref.WeakValueDictionary[int, np.ndarray]' = weakref.WeakValueDictionary()
+
+def _transferable(a: np.ndarray) -> np.ndarray:
+    """Mark new array without other references, GeomGrid takes it over without copy."""
+    _transfer[id(a)] = a
+    return a
+
+def _unique(a: np.ndarray) -> np.ndarray:
+    """Sorted unique values, evaluated slab-wise."""
+    return np.unique(np.concatenate([np.unique(a[s]) for s in _slabs(a.shape)]))
+
+def _coordinates0_point(cells: np.ndarray,
+                        size: np.ndarray,
+                        x: slice) -> np.ndarray:
+    """Cell center positions (undeformed) of a slab, shape (:,3)."""
+    c = [np.linspace(s/n*.5,s-s/n*.5,n) for s,n in zip(size,cells)]
+    return np.stack(np.meshgrid(c[0][x],c[1],c[2],indexing='ij'),axis=-1).reshape(-1,3)
+
+@numba_njit_wrapper()
+def _tainted_neighborhood(padded: np.ndarray,
+                          trigger: np.ndarray,
+                          offsets: np.ndarray,
+                          d: int) -> np.ndarray:
+    """Flag cells of a slab padded by d that see a different, triggering material ID at any offset."""
+    mask = np.zeros((padded.shape[0]-2*d,padded.shape[1]-2*d,padded.shape[2]-2*d),np.bool_)
+    for x in range(mask.shape[0]):
+        for y in range(mask.shape[1]):
+            for z in range(mask.shape[2]):
+                me = padded[x+d,y+d,z+d]
+                for o in range(offsets.shape[0]):
+                    i,j,k = x+offsets[o,0],y+offsets[o,1],z+offsets[o,2]
+                    if trigger[i,j,k] and padded[i,j,k] != me:
+                        mask[x,y,z] = True
+                        break
+    return mask
+
+def _promote(dtype: np.dtype,
+             values) -> np.dtype:
+    """Integer data type that can additionally hold the given integer values."""
+    v = np.asarray(values)
+    if not (np.issubdtype(dtype,np.integer) and np.issubdtype(v.dtype,np.integer)) or v.size == 0:
+        return np.dtype(dtype)
+    return np.result_type(dtype,np.min_scalar_type(v.min()),np.min_scalar_type(v.max()))
+
+def _compact(values: np.ndarray) -> np.dtype:
+    """Smallest unsigned data type (uint16 or uint32) for non-negative integer material IDs."""
+    v = np.asarray(values)
+    if not np.issubdtype(v.dtype,np.integer) or v.size == 0 or np.min(v) < 0 or (v_max := np.max(v)) >= 2**32:
+        return v.dtype
+    return np.dtype(np.uint16 if v_max < 2**16 else np.uint32)
+
+
 class GeomGrid:
     """
     Geometry definition for grid solvers.
@@ -36,6 +113,9 @@ class GeomGrid:
     files ('.vti' extension). A grid has a physical size, a coordinate origin,
     and contains the material ID (indexing an entry in 'material.yaml')
     as well as initial condition fields.
+
+    Material IDs keep their integer data type. Operations that introduce
+    new IDs promote it if needed, e.g. uint16 to uint32 or to a signed type.
     """
 
     def __init__(self,
@@ -84,7 +164,7 @@ class GeomGrid:
                f'cells:  {util.srepr(self.cells, " × ")}',
                f'size:   {util.srepr(self.size,  " × ")} m³',
                f'origin: {util.srepr(self.origin,"   ")} m',
-               f'# materials: {mat_N}' + ('' if mat_min == 0 and mat_max+1 == mat_N else
+               f'# materials: {mat_N}' + ('' if mat_min == 0 and mat_max == mat_N-1 else
                                           f' (min: {mat_min}, max: {mat_max})')
                ]+(['initial_conditions:']+[f'  - {f}' for f in self.initial_conditions] if self.initial_conditions else []))
 
@@ -96,7 +176,12 @@ class GeomGrid:
         Create deep copy.
 
         """
-        return copy.deepcopy(self)
+        return GeomGrid(material = self.material,
+                        size     = self.size,
+                        origin   = self.origin,
+                        initial_conditions = {k:_copy(v) for k,v in self.initial_conditions.items()},
+                        comments = self.comments,
+                       )
 
     copy = __copy__
 
@@ -132,14 +217,16 @@ class GeomGrid:
                  material: np.ndarray):
         if len(material.shape) != 3:
             raise ValueError(f'invalid material shape {material.shape}')
-        if material.dtype not in [np.float32,np.float64, np.int32,np.int64]:
+        if material.dtype not in [np.float32,np.float64, np.int32,np.int64, np.uint16,np.uint32]:
             raise TypeError(f'invalid material data type "{material.dtype}"')
 
-        self._material = np.copy(material)
+        dtype = np.dtype(np.int64) if material.dtype in [np.float32,np.float64] and \
+                all(np.all(material[x] == material[x].astype(np.int64).astype(float)) for x in _slabs(material.shape)) \
+                else material.dtype
+        if _transfer.pop(id(material),None) is not material or dtype != material.dtype:             # memory maps stay out-of-core
+            material = _copy(material,dtype)
 
-        if self.material.dtype in [np.float32,np.float64] and \
-           np.all(self.material == self.material.astype(np.int64).astype(float)):
-            self._material = self.material.astype(np.int64)
+        self._material: np.ndarray = material
 
 
     @property
@@ -193,7 +280,12 @@ class GeomGrid:
     @property
     def N_materials(self) -> int:
         """Number of (unique) material indices within grid."""
-        return np.unique(self.material).size
+        return _unique(self.material).size
+
+    @property
+    def out_of_core(self) -> bool:
+        """Material indices are memory-mapped from a file."""
+        return _file_backed(self.material)
 
 
     @staticmethod
@@ -482,6 +574,61 @@ class GeomGrid:
                        )
 
 
+    @staticmethod
+    def load_HDF5(fname: Union[str, Path],
+                  memmap: bool = False) -> 'GeomGrid':
+        """
+        Load from HDF5 file.
+
+        Parameters
+        ----------
+        fname : str or pathlib.Path
+            HDF5 file to read, as written by damask.GeomGrid.save_HDF5.
+        memmap : bool, optional
+            Memory-map material IDs and initial conditions (read-only)
+            instead of reading them into memory. Defaults to False.
+
+        Returns
+        -------
+        loaded : damask.GeomGrid
+            Grid-based geometry from file.
+
+        Notes
+        -----
+        Memory mapping allows to work with grids that do not fit into
+        memory. Operations on memory-mapped grids store their results as
+        memory maps of anonymous temporary files, which are placed in the
+        directory given by tempfile.gettempdir(). The file must not be
+        modified while the grid is in use.
+
+        canvas, mirror, flip, scale, renumber, substitute, clean,
+        add_primitive, vicinity_offset, copy, and save_HDF5 process the
+        data block-wise. rotate, sort, and assemble as well as save,
+        save_ASCII, show, and get_grain_boundaries need the complete
+        material IDs in memory.
+
+        """
+        with h5py.File(fname,'r') as f:
+            def read(dataset: h5py.Dataset) -> np.ndarray:
+                if not memmap: return dataset[()]
+                if (offset := dataset.id.get_offset()) is None:
+                    raise ValueError(f'dataset "{dataset.name}" is not contiguous and cannot be memory-mapped')
+                return np.memmap(fname,dataset.dtype,'r',offset=offset,shape=dataset.shape)
+
+            material = _transferable(read(f['material']))
+            ic = {k:read(v) for k,v in f['initial_conditions'].items()} if 'initial_conditions' in f else {}
+            size = f.attrs['size']
+            origin = f.attrs['origin']
+            comments = f.attrs['comments']
+
+        return GeomGrid(material = material,
+                        size     = size,
+                        origin   = origin,
+                        initial_conditions = ic,
+                        comments = comments.split('\n') if comments else None,
+                       )
+
+
     @staticmethod
     def from_table(table: Table,
                    coordinates: str,
@@ -521,19 +668,15 @@ class GeomGrid:
                        )
 
 
-    @staticmethod
-    def _find_closest_seed(seeds: np.ndarray,
-                           weights: np.ndarray,
-                           point: np.ndarray) -> np.integer:
-        return np.argmin(np.sum((np.broadcast_to(point,(len(seeds),3))-seeds)**2,axis=1) - weights)
-
     @staticmethod
     def from_Laguerre_tessellation(cells: IntSequence,
                                    size: FloatSequence,
                                    seeds: np.ndarray,
                                    weights: FloatSequence,
                                    material: Optional[IntSequence] = None,
-                                   periodic: bool = True):
+                                   periodic: bool = True,
+                                   out_of_core: bool = False,
+                                   compact: bool = False):
         """
         Create grid from Laguerre tessellation.
 
@@ -554,6 +697,12 @@ class GeomGrid:
             Defaults to None, in which case materials are consecutively numbered.
         periodic : bool, optional
             Assume grid to be periodic. Defaults to True.
+        out_of_core : bool, optional
+            Store material IDs as memory map of a temporary file.
+            Defaults to False.
+        compact : bool, optional
+            Store material IDs with the smallest sufficient unsigned
+            data type (uint16 or uint32). Defaults to False.
 
         Returns
         -------
@@ -561,27 +710,28 @@ class GeomGrid:
             Grid-based geometry from tessellation.
 
         """
-        weights_p: FloatSequence
-        if periodic:
-            weights_p = np.tile(weights,27)                                                         # Laguerre weights (1,2,3,1,2,3,...,1,2,3)
-            seeds_p = np.vstack((seeds  -np.array([size[0],0.,0.]),seeds,  seeds  +np.array([size[0],0.,0.])))
-            seeds_p = np.vstack((seeds_p-np.array([0.,size[1],0.]),seeds_p,seeds_p+np.array([0.,size[1],0.])))
-            seeds_p = np.vstack((seeds_p-np.array([0.,0.,size[2]]),seeds_p,seeds_p+np.array([0.,0.,size[2]])))
-        else:
-            weights_p = np.array(weights,float)
-            seeds_p   = seeds
-
-        coords = grid_filters.coordinates0_point(cells,size).reshape(-1,3)
-
-        pool = mp.Pool(int(os.environ.get('OMP_NUM_THREADS',4)))
-        result = pool.map_async(partial(GeomGrid._find_closest_seed,seeds_p,weights_p), coords)
-        pool.close()
-        pool.join()
-        material_ = np.array(result.get()).reshape(cells)
-
-        if periodic: material_ %= len(weights)
-
-        return GeomGrid(material = material_ if material is None else np.array(material)[material_],
+        weights_ = np.array(weights,float)
+        candidates = np.flatnonzero(weights_ > -np.inf)
+        lift = np.sqrt(np.max(weights_[candidates]) - weights_[candidates])                         # power distance as 4D distance
+        seeds_l = np.column_stack((np.asarray(seeds)[candidates],lift))
+        boxsize = np.append(size,2.*np.max(lift)+1.)                                                # no wrap-around along 4th dimension
+        tree = spatial.cKDTree(seeds_l,boxsize=boxsize) if periodic else \
+               spatial.cKDTree(seeds_l)
+
+        cells_ = np.array(cells,np.int64)
+        lookup = candidates if material is None else np.array(material)[candidates]
+        if compact: lookup = lookup.astype(_compact(lookup))
+        material_ = _empty(cells_,lookup.dtype,out_of_core)
+        for x in _slabs(cells_):
+            coords = np.column_stack((_coordinates0_point(cells_,np.array(size,float),x),
+                                      np.zeros(np.prod(material_[x].shape))))
+            try:
+                idx = tree.query(coords, workers = int(os.environ.get('OMP_NUM_THREADS',4)))[1]
+            except TypeError:
+                idx = tree.query(coords, n_jobs = int(os.environ.get('OMP_NUM_THREADS',4)))[1]      # scipy <1.6
+            material_[x] = lookup[idx].reshape(material_[x].shape)
+
+        return GeomGrid(material = _transferable(material_),
                         size     = size,
                         comments = util.execution_stamp('GeomGrid','from_Laguerre_tessellation'),
                        )
@@ -592,7 +742,9 @@ class GeomGrid:
                                   size: FloatSequence,
                                   seeds: np.ndarray,
                                   material: Optional[IntSequence] = None,
-                                  periodic: bool = True) -> 'GeomGrid':
+                                  periodic: bool = True,
+                                  out_of_core: bool = False,
+                                  compact: bool = False) -> 'GeomGrid':
         """
         Create grid from Voronoi tessellation.
 
@@ -610,6 +762,12 @@ class GeomGrid:
             Defaults to None, in which case materials are consecutively numbered.
         periodic : bool, optional
             Assume grid to be periodic. Defaults to True.
+        out_of_core : bool, optional
+            Store material IDs as memory map of a temporary file.
+            Defaults to False.
+        compact : bool, optional
+            Store material IDs with the smallest sufficient unsigned
+            data type (uint16 or uint32). Defaults to False.
 
         Returns
         -------
@@ -617,15 +775,22 @@ class GeomGrid:
             Grid-based geometry from tessellation.
 
         """
-        coords = grid_filters.coordinates0_point(cells,size).reshape(-1,3)
         tree = spatial.cKDTree(seeds,boxsize=size) if periodic else \
                spatial.cKDTree(seeds)
-        try:
-            material_ = tree.query(coords, workers = int(os.environ.get('OMP_NUM_THREADS',4)))[1]
-        except TypeError:
-            material_ = tree.query(coords, n_jobs = int(os.environ.get('OMP_NUM_THREADS',4)))[1]    # scipy <1.6
 
-        return GeomGrid(material = (material_ if material is None else np.array(material)[material_]).reshape(cells),
+        cells_ = np.array(cells,np.int64)
+        lookup = np.arange(len(seeds)) if material is None else np.array(material)
+        if compact: lookup = lookup.astype(_compact(lookup))
+        material_ = _empty(cells_,lookup.dtype,out_of_core)
+        for x in _slabs(cells_):
+            coords = _coordinates0_point(cells_,np.array(size,float),x)
+            try:
+                idx = tree.query(coords, workers = int(os.environ.get('OMP_NUM_THREADS',4)))[1]
+            except TypeError:
+                idx = tree.query(coords, n_jobs = int(os.environ.get('OMP_NUM_THREADS',4)))[1]      # scipy <1.6
+            material_[x] = lookup[idx].reshape(material_[x].shape)
+
+        return GeomGrid(material = _transferable(material_),
                         size     = size,
                         comments = util.execution_stamp('GeomGrid','from_Voronoi_tessellation'),
                        )
@@ -779,8 +944,11 @@ class GeomGrid:
             Compress with zlib algorithm. Defaults to True.
 
         """
+        material = self.material.flatten(order='F')
+        if material.dtype in [np.uint16,np.uint32]:                                                 # grid solver reads signed integers
+            material = material.astype(np.int32 if np.max(material,initial=0) < 2**31 else np.int64)
         v = VTK.from_image_data(self.cells,self.size,self.origin)\
-               .set('material',self.material.flatten(order='F'))
+               .set('material',material)
         for label,data in self.initial_conditions.items():
             v = v.set(label,data.flatten(order='F'))
         v.comments = self.comments
@@ -788,6 +956,32 @@ class GeomGrid:
         v.save(fname,parallel=False,compress=compress)
 
 
+    def save_HDF5(self,
+                  fname: Union[str, Path]):
+        """
+        Save as HDF5 file.
+
+        Material IDs and initial conditions are written block-wise
+        as uncompressed, contiguous datasets that can be memory-mapped
+        by damask.GeomGrid.load_HDF5.
+
+        Parameters
+        ----------
+        fname : str or pathlib.Path
+            Filename to write.
+
+        """
+        with h5py.File(fname,'w') as f:
+            f.attrs['size'] = self.size
+            f.attrs['origin'] = self.origin
+            f.attrs['comments'] = '\n'.join(self.comments)
+            for name,data in [('material',self.material)] \
+                            +[(f'initial_conditions/{k}',v) for k,v in self.initial_conditions.items()]:
+                dataset = f.create_dataset(name,shape=data.shape,dtype=data.dtype)
+                for x in _slabs(data.shape):
+                    dataset[x] = data[x]
+
+
     def save_ASCII(self,
                    fname: Union[str, TextIO]):
         """
@@ -875,7 +1069,9 @@ class GeomGrid:
         offset_ = np.array(offset,np.int64) if offset is not None else np.zeros(3,np.int64)
         cells_ = np.array(cells,np.int64) if cells is not None else self.cells
 
-        canvas = np.full(cells_,np.nanmax(self.material) + 1 if fill is None else fill,self.material.dtype)
+        fill_ = np.nanmax(self.material).item() + 1 if fill is None else fill
+        canvas = _empty(cells_,_promote(self.material.dtype,fill_),self.out_of_core)
+        canvas[...] = fill_
 
         LL = np.clip( offset_,           0,np.minimum(self.cells,     cells_+offset_))
         UR = np.clip( offset_+cells_,    0,np.minimum(self.cells,     cells_+offset_))
@@ -884,7 +1080,7 @@ class GeomGrid:
 
         canvas[ll[0]:ur[0],ll[1]:ur[1],ll[2]:ur[2]] = self.material[LL[0]:UR[0],LL[1]:UR[1],LL[2]:UR[2]]
 
-        return GeomGrid(material = canvas,
+        return GeomGrid(material = _transferable(canvas),
                         size     = self.size/self.cells*np.asarray(canvas.shape),
                         origin   = self.origin+offset_*self.size/self.cells,
                         comments = self.comments+[util.execution_stamp('GeomGrid','canvas')],
@@ -943,17 +1139,29 @@ class GeomGrid:
         if not set(directions).issubset(valid := ['x', 'y', 'z']):
             raise ValueError(f'invalid direction "{set(directions).difference(valid)}" specified')
 
-        limits: Sequence[Optional[int]] = [None,None] if reflect else [-2,0]
-        mat = self.material.copy()
-
-        if 'x' in directions:
-            mat = np.concatenate([mat,mat[limits[0]:limits[1]:-1,:,:]],0)
-        if 'y' in directions:
-            mat = np.concatenate([mat,mat[:,limits[0]:limits[1]:-1,:]],1)
-        if 'z' in directions:
-            mat = np.concatenate([mat,mat[:,:,limits[0]:limits[1]:-1]],2)
-
-        return GeomGrid(material = mat,
+        cells = self.cells.copy()
+        cells_ = np.where([d in directions for d in valid],2*cells if reflect else cells+np.maximum(cells-2,0),cells)
+        mat = _empty(cells_,self.material.dtype,self.out_of_core)
+        for x in _slabs(cells):
+            mat[x,:cells[1],:cells[2]] = self.material[x]
+
+        for axis in np.flatnonzero(cells_ > cells):                                                 # in place, slab by slab
+            N = cells_[axis]-cells[axis]
+            o = cells[axis]-1 if reflect else cells[axis]-2                                         # source of first new layer
+            src = [slice(0,c) for c in cells]
+            dst = [slice(0,c) for c in cells]
+            src[axis] = slice(o,o-N if o >= N else None,-1)
+            dst[axis] = slice(cells[axis],cells_[axis])
+            for x in _slabs([N if axis == 0 else cells[0]]+list(cells[1:])):
+                if axis == 0:
+                    src[0] = slice(o-x.start,o-x.stop if o >= x.stop else None,-1)
+                    dst[0] = slice(cells[0]+x.start,cells[0]+x.stop)
+                else:
+                    src[0] = dst[0] = x
+                mat[tuple(dst)] = mat[tuple(src)]
+            cells[axis] = cells_[axis]
+
+        return GeomGrid(material = _transferable(mat),
                         size     = self.size/self.cells*np.asarray(mat.shape),
                         origin   = self.origin,
                         comments = self.comments+[util.execution_stamp('GeomGrid','mirror')],
@@ -998,9 +1206,10 @@ class GeomGrid:
         if not set(directions).issubset(valid := ['x', 'y', 'z']):
             raise ValueError(f'invalid direction "{set(directions).difference(valid)}" specified')
 
-        mat = np.flip(self.material, [valid.index(d) for d in directions if d in valid])
+        mat = _empty(self.cells,self.material.dtype,self.out_of_core)
+        mat[...] = np.flip(self.material, [valid.index(d) for d in directions if d in valid])
 
-        return GeomGrid(material = mat,
+        return GeomGrid(material = _transferable(mat),
                         size     = self.size,
                         origin   = self.origin,
                         comments = self.comments+[util.execution_stamp('GeomGrid','flip')],
@@ -1040,21 +1249,27 @@ class GeomGrid:
         >>> g.rotate(damask.Rotation.from_axis_angle([0,0,1,180],degrees=True)) == g.flip('xy')
         True
 
+        Notes
+        -----
+        The rotation is evaluated in memory. For out-of-core grids,
+        the result is stored as memory map again.
+
         """
         material = self.material
+        fill_ = np.nanmax(self.material).item() + 1 if fill is None else fill
+        dtype = _promote(self.material.dtype,fill_)
         # These rotations are always applied in the reference coordinate system, i.e. (z,x,z) not (z,x',z'')
         # see https://www.cs.utexas.edu/~theshark/courses/cs354/lectures/cs354-14.pdf
         for angle,axes in zip(R.as_Euler_angles(degrees=True)[::-1], [(0,1),(1,2),(0,1)]):
             material_temp = ndimage.rotate(material,angle,axes,order=0,prefilter=False,
-                                           output=self.material.dtype,
-                                           cval=np.nanmax(self.material) + 1 if fill is None else fill)
+                                           output=dtype,cval=fill_)
             # avoid scipy interpolation errors for rotations close to multiples of 90°
             material = material_temp if np.prod(material_temp.shape) != np.prod(material.shape) else \
                        np.rot90(material,k=np.rint(angle/90.).astype(np.int64),axes=axes)
 
         origin = self.origin-(np.asarray(material.shape)-self.cells)*.5 * self.size/self.cells
 
-        return GeomGrid(material = material,
+        return GeomGrid(material = _transferable(_copy(material,out_of_core=True)) if self.out_of_core else material,
                         size     = self.size/self.cells*np.asarray(material.shape),
                         origin   = origin,
                         comments = self.comments+[util.execution_stamp('GeomGrid','rotate')],
@@ -1094,17 +1309,31 @@ class GeomGrid:
         # materials: 1
 
         """
-        orig = tuple(map(np.linspace,self.origin             + self.size/self.cells*.5,
-                                     self.origin + self.size - self.size/self.cells*.5,self.cells))
-        interpolator = partial(interpolate.RegularGridInterpolator,
-                               points=orig,method='nearest',bounds_error=False,fill_value=None)
-        new = grid_filters.coordinates0_point(cells,self.size,self.origin)
-
-        return GeomGrid(material = interpolator(values=self.material)(new).astype(int),
+        def nearest(i: int) -> np.ndarray:
+            """Index of nearest old cell center along axis i for new cell centers."""
+            points = [np.linspace(self.origin[i]              + self.size[i]/n*.5,
+                                  self.origin[i]+self.size[i] - self.size[i]/n*.5,n) for n in [self.cells[i],cells_[i]]]
+            return interpolate.RegularGridInterpolator(points[:1],np.arange(self.cells[i]),method='nearest',
+                                                       bounds_error=False,fill_value=None)(points[1][:,np.newaxis])\
+                                                       .astype(np.int64)
+
+        cells_ = np.array(cells,np.int64)
+        idx = [nearest(i) for i in range(3)]
+        material = _empty(cells_,
+                          self.material.dtype if np.issubdtype(self.material.dtype,np.integer) else np.dtype(np.int64),
+                          self.out_of_core)
+        ic = {k:_empty(tuple(cells_)+v.shape[3:],
+                       v.dtype if np.issubdtype(v.dtype,np.inexact) else np.dtype(np.float64),
+                       self.out_of_core) for k,v in self.initial_conditions.items()}
+        for x in _slabs(cells_):
+            material[x] = self.material[np.ix_(idx[0][x],idx[1],idx[2])]
+            for k,v in self.initial_conditions.items():
+                ic[k][x] = v[np.ix_(idx[0][x],idx[1],idx[2])]
+
+        return GeomGrid(material = _transferable(material),
                         size     = self.size,
                         origin   = self.origin,
-                        initial_conditions = {k: interpolator(values=v)(new)
-                                              for k,v in self.initial_conditions.items()},
+                        initial_conditions = ic,
                         comments = self.comments+[util.execution_stamp('GeomGrid','scale')],
                        )
 
@@ -1130,7 +1359,9 @@ class GeomGrid:
         flat = (idx if len(idx.shape)==3 else grid_filters.ravel_index(idx)).flatten(order='F')
         ic = {k: v.flatten(order='F')[flat].reshape(cells,order='F') for k,v in self.initial_conditions.items()}
 
-        return GeomGrid(material = self.material.flatten(order='F')[flat].reshape(cells,order='F'),
+        material = self.material.flatten(order='F')[flat].reshape(cells,order='F')
+
+        return GeomGrid(material = _transferable(_copy(material,out_of_core=True) if self.out_of_core else material),
                         size     = self.size,
                         origin   = self.origin,
                         initial_conditions = ic,
@@ -1138,19 +1369,31 @@ class GeomGrid:
                        )
 
 
-    def renumber(self) -> 'GeomGrid':
+    def renumber(self,
+                 compact: bool = False) -> 'GeomGrid':
         """
         Renumber sorted material indices as 0,...,N-1.
 
+        Parameters
+        ----------
+        compact : bool, optional
+            Store material IDs with the smallest sufficient unsigned
+            data type (uint16 or uint32). Defaults to False.
+
         Returns
         -------
         updated : damask.GeomGrid
             Updated grid-based geometry.
 
         """
-        _,renumbered = np.unique(self.material,return_inverse=True)
-
-        return GeomGrid(material = renumbered.reshape(self.cells),
+        unique = _unique(self.material)
+        dtype = _compact(np.array([len(unique)-1])) if compact else \
+                self.material.dtype if np.issubdtype(self.material.dtype,np.integer) else np.dtype(np.int64)
+        renumbered = _empty(self.cells,dtype,self.out_of_core)
+        for x in _slabs(self.cells):
+            renumbered[x] = np.searchsorted(unique,self.material[x])
+
+        return GeomGrid(material = _transferable(renumbered),
                         size     = self.size,
                         origin   = self.origin,
                         initial_conditions = self.initial_conditions,
@@ -1177,12 +1420,14 @@ class GeomGrid:
             Updated grid-based geometry.
 
         """
-        material = self.material.copy()
-        for f,t in zip(from_material if isinstance(from_material,(Sequence,np.ndarray)) else [from_material],
-                       to_material if isinstance(to_material,(Sequence,np.ndarray)) else [to_material]): # ToDo Python 3.10 has strict mode for zip
-            material[self.material==f] = t
-
-        return GeomGrid(material = material,
+        material = _empty(self.cells,_promote(self.material.dtype,to_material),self.out_of_core)
+        for x in _slabs(self.cells):
+            material[x] = self.material[x]
+            for f,t in zip(from_material if isinstance(from_material,(Sequence,np.ndarray)) else [from_material],
+                           to_material if isinstance(to_material,(Sequence,np.ndarray)) else [to_material]): # ToDo Python 3.10 has strict mode for zip
+                material[x][self.material[x]==f] = t
+
+        return GeomGrid(material = _transferable(material),
                         size     = self.size,
                         origin   = self.origin,
                         initial_conditions = self.initial_conditions,
@@ -1205,7 +1450,9 @@ class GeomGrid:
         sort_idx = np.argsort(from_ma)
         ma = np.unique(a)[sort_idx][np.searchsorted(from_ma,a,sorter = sort_idx)]
 
-        return GeomGrid(material = ma.reshape(self.cells,order='F'),
+        material = ma.reshape(self.cells,order='F')
+
+        return GeomGrid(material = _transferable(_copy(material,out_of_core=True) if self.out_of_core else material),
                         size     = self.size,
                         origin   = self.origin,
                         initial_conditions = self.initial_conditions,
@@ -1247,16 +1494,6 @@ class GeomGrid:
         If multiple material IDs are most frequent within a stencil, a random choice is taken.
 
         """
-        def most_frequent(stencil: np.ndarray,
-                          selection: Union[None,np.ndarray],
-                          rng: np.random.Generator):
-            me = stencil[stencil.size//2]
-            if selection is None or me in selection:
-                unique, counts = np.unique(stencil,return_counts=True)
-                return rng.choice(unique[counts==np.max(counts)])
-            else:
-                return me
-
         rng = np.random.default_rng(rng_seed)
 
         d = np.floor(distance).astype(np.int64)
@@ -1264,16 +1501,40 @@ class GeomGrid:
         xx,yy,zz = np.meshgrid(ext,ext,ext)
         footprint = xx**2+yy**2+zz**2 <= distance**2+distance*1e-8
         selection_ = None if selection is None else \
-                     np.setdiff1d(self.material,selection) if invert_selection else \
-                     np.intersect1d(self.material,selection)
-        material = ndimage.generic_filter(
-                                          self.material,
-                                          most_frequent,
-                                          footprint=footprint,
-                                          mode='wrap' if periodic else 'nearest',
-                                          extra_keywords=dict(selection=selection_,rng=rng),
-                                         ).astype(self.material.dtype)
-        return GeomGrid(material = material,
+                     np.setdiff1d(_unique(self.material),selection) if invert_selection else \
+                     np.intersect1d(_unique(self.material),selection)
+
+        offsets = np.argwhere(footprint)
+        material = _empty(self.cells,self.material.dtype,self.out_of_core)
+        for x in _slabs(list(self.cells[:2])+[self.cells[2]*len(offsets)*8]):                       # 2^19 stencil entries, C order for reproducible random choice
+            material[x] = self.material[x]
+            me = material[x].reshape(-1)                                                            # view, output is C-contiguous
+            todo = np.flatnonzero(np.ones_like(me,bool) if selection_ is None else np.isin(me,selection_))
+            if len(todo) == 0: continue
+
+            halo = np.arange(x.start-d,x.stop+d)                                                    # slab with d cells of halo
+            padded = np.pad(self.material[halo%self.cells[0] if periodic else np.clip(halo,0,self.cells[0]-1)],
+                            ((0,0),(d,d),(d,d)),mode='wrap' if periodic else 'edge')
+            stencils = np.stack([padded[i:i+x.stop-x.start,j:j+self.cells[1],k:k+self.cells[2]]
+                                 for i,j,k in offsets],axis=-1).reshape(-1,len(offsets))[todo]
+            stencils.sort(axis=1)
+
+            idx = np.arange(len(offsets))
+            first = np.ones_like(stencils,bool)
+            first[:,1:] = stencils[:,1:] != stencils[:,:-1]
+            last = np.ones_like(stencils,bool)
+            last[:,:-1] = first[:,1:]
+            counts = idx - np.maximum.accumulate(np.where(first,idx,0),axis=1) + 1                 # run length at last entry of run
+            most_frequent = last & (counts == np.max(counts,axis=1,keepdims=True))                  # candidates in ascending order
+
+            N_candidates = np.count_nonzero(most_frequent,axis=1)
+            tie = N_candidates > 1
+            choice = np.zeros_like(N_candidates)
+            choice[tie] = rng.integers(0,N_candidates[tie])                                         # same draws as per-cell choice
+            selected = np.argmax(most_frequent & (np.cumsum(most_frequent,axis=1) == choice[:,np.newaxis]+1),axis=1)
+            me[todo] = stencils[np.arange(len(todo)),selected]
+
+        return GeomGrid(material = _transferable(material),
                         size     = self.size,
                         origin   = self.origin,
                         initial_conditions = self.initial_conditions,
@@ -1352,21 +1613,25 @@ class GeomGrid:
         c = (np.array(center) + .5)*self.size/self.cells if np.issubdtype(np.array(center).dtype,   np.integer) else \
             (np.array(center) - self.origin)
 
-        coords = grid_filters.coordinates0_point(self.cells,self.size,
-                                          -(0.5*(self.size + (self.size/self.cells
-                                                              if np.issubdtype(np.array(center).dtype,np.integer) else
-                                                              0)) if periodic else c))
-        coords_rot = R.broadcast_to(tuple(self.cells))@coords
-
-        with np.errstate(all='ignore'):
-            mask = np.sum(np.power(np.abs(coords_rot)/r,2.0**np.array(exponent)),axis=-1) > 1.0
-
-        if periodic:                                                                                # translate back to center
-            mask = np.roll(mask,((c/self.size-0.5)*self.cells).round().astype(np.int64),(0,1,2))
-
-        return GeomGrid(material = np.where(np.logical_not(mask) if inverse else mask,
-                                        self.material,
-                                        np.nanmax(self.material)+1 if fill is None else fill),
+        origin = -(0.5*(self.size + (self.size/self.cells
+                                     if np.issubdtype(np.array(center).dtype,np.integer) else
+                                     0)) if periodic else c)
+        shift = ((c/self.size-0.5)*self.cells).round().astype(np.int64) if periodic else np.zeros(3,np.int64)
+        points = [np.linspace(origin[i]              + self.size[i]/self.cells[i]*.5,
+                              origin[i]+self.size[i] - self.size[i]/self.cells[i]*.5,
+                              self.cells[i])[(np.arange(self.cells[i])-shift[i])%self.cells[i]]     # translate back to center
+                  for i in range(3)]
+
+        fill_ = np.nanmax(self.material).item() + 1 if fill is None else fill
+        material = _empty(self.cells,_promote(self.material.dtype,fill_),self.out_of_core)
+        for x in _slabs(self.cells):
+            coords = np.stack(np.meshgrid(points[0][x],points[1],points[2],indexing='ij'),axis=-1)
+            coords_rot = R.broadcast_to(coords.shape[:-1])@coords
+            with np.errstate(all='ignore'):
+                mask = np.sum(np.power(np.abs(coords_rot)/r,2.0**np.array(exponent)),axis=-1) > 1.0
+            material[x] = np.where(np.logical_not(mask) if inverse else mask,self.material[x].astype(material.dtype),fill_)
+
+        return GeomGrid(material = _transferable(material),
                         size     = self.size,
                         origin   = self.origin,
                         initial_conditions = self.initial_conditions,
@@ -1409,35 +1674,39 @@ class GeomGrid:
             Updated grid-based geometry.
 
         """
-        @numba_njit_wrapper()
-        def tainted_neighborhood(stencil: np.ndarray,
-                                 selection: Optional[np.ndarray] = None):
-            me = stencil[stencil.size//2]
-            if selection is None:
-                return np.any(stencil != me)
-            elif not len(selection)==0:
-                for stencil_item in stencil:
-                    for selection_item in selection:
-                        if stencil_item==selection_item and selection_item!=me:
-                            return True
-            return False
         d = np.floor(distance).astype(np.int64)
         ext = np.linspace(-d,d,1+2*d,dtype=float),
         xx,yy,zz = np.meshgrid(ext,ext,ext)
         footprint = xx**2+yy**2+zz**2 <= distance**2+distance*1e-8
-        offset_ = np.nanmax(self.material)+1 if offset is None else offset
+        offset_ = np.nanmax(self.material).item()+1 if offset is None else offset
         selection_ = None if selection is None else \
-                     np.setdiff1d(self.material,selection) if invert_selection else \
-                     np.intersect1d(self.material,selection)
-
-        mask = ndimage.generic_filter(self.material,
-                                      tainted_neighborhood,
-                                      footprint=footprint,
-                                      mode='wrap' if periodic else 'nearest',
-                                      extra_keywords=dict(selection=selection_),
-                                     )
-
-        return GeomGrid(material = np.where(mask, self.material + offset_,self.material),
+                     np.setdiff1d(_unique(self.material),selection) if invert_selection else \
+                     np.intersect1d(_unique(self.material),selection)
+
+        offsets = np.array([o for o in np.argwhere(footprint) if np.any(o != d)],np.int64).reshape(-1,3)
+        dtype = _promote(self.material.dtype,[np.nanmin(self.material).item()+offset_,
+                                              np.nanmax(self.material).item()+offset_])
+        material = _empty(self.cells,dtype,self.out_of_core)
+        for x in _slabs(self.cells):
+            halo = np.arange(x.start-d,x.stop+d)                                                    # slab with d cells of halo
+            padded = np.pad(self.material[halo%self.cells[0] if periodic else np.clip(halo,0,self.cells[0]-1)],
+                            ((0,0),(d,d),(d,d)),mode='wrap' if periodic else 'edge')
+            trigger = None if selection_ is None else np.isin(padded,selection_)
+            me = padded[d:d+x.stop-x.start,d:d+self.cells[1],d:d+self.cells[2]]
+            if nb:                                                                                  # compiled loop avoids temporaries
+                mask = _tainted_neighborhood(padded,np.ones_like(padded,bool) if trigger is None else trigger,
+                                             offsets,d)
+            else:
+                mask = np.zeros(me.shape,bool)
+                for i,j,k in offsets:
+                    shifted = (slice(i,i+me.shape[0]),slice(j,j+me.shape[1]),slice(k,k+me.shape[2]))
+                    if trigger is None:
+                        mask |= padded[shifted] != me
+                    else:
+                        mask |= trigger[shifted] & (padded[shifted] != me)
+            material[x] = np.where(mask,me.astype(dtype)+offset_,me)
+
+        return GeomGrid(material = _transferable(material),
                         size     = self.size,
                         origin   = self.origin,
                         initial_conditions = self.initial_conditions,
@@ -1,22 +1,33 @@
 import re
+import json
 import fnmatch
 import os
 import copy
 import xml.etree.ElementTree as ET                                                                  # noqa
 import xml.dom.minidom
+import time
 import functools
+import itertools
+import contextlib
+import multiprocessing as mp
+import weakref
 from pathlib import Path
-from collections import defaultdict
-from collections.abc import Iterable
-from typing import Optional, Union, Callable, Any, Sequence, Literal, Dict, List, Tuple
+from collections import defaultdict, deque
+from collections.abc import Iterable, Mapping
+from typing import Optional, Union, Callable, Any, Sequence, Literal, Dict, List, Tuple, Generator, cast
 
 import h5py
 import numpy as np
+import pandas as pd
 from numpy import ma
-from scipy import interpolate
+from scipy import fft
+from scipy import sparse
+from vtkmodules.vtkCommonDataModel import vtkImageData, vtkPolyData, vtkUnstructuredGrid
+from vtkmodules.util.numpy_support import vtk_to_numpy
 
 import damask
 from . import VTK
+from . import Table
 from . import Orientation
 from . import Rotation
 from . import grid_filters
@@ -24,6 +35,10 @@ from . import mechanics
 from . import tensor
 from . import util
 from ._typehints import FloatSequence, IntSequence, DADF5Dataset
+try:
+    import hdf5plugin                                                                               # type: ignore
+except ImportError:
+    hdf5plugin = False
 
 
 h5py3 = h5py.__version__[0] == '3'
@@ -32,12 +47,164 @@ chunk_size = 1024**2//8
 
 prefix_inc = 'increment_'
 
+codecs = {'gzip': (6,   range(10)),                                                                 # default and valid levels
+          'lzf':  (None,[None]),
+          'blosc':(5,   range(10)),
+          'zstd': (3,   range(1,23))}
+
+
+def _compression(compression: Union[bool, str, Tuple[str, int]],
+                 chunks: int) -> Dict[str, Any]:
+    """Validated compression and chunking policy."""
+    codec,level = (compression,None) if isinstance(compression,(bool,str)) else compression
+    if codec is True: codec = 'gzip'
+    if codec is not False:
+        if codec not in codecs:
+            raise ValueError(f'invalid compression "{codec}"')
+        if codec in ['blosc','zstd'] and not hdf5plugin:
+            raise ModuleNotFoundError(f'compression "{codec}" requires hdf5plugin')
+        if level is not None and level not in codecs[codec][1]:
+            raise ValueError(f'invalid level "{level}" for compression "{codec}"')
+    if chunks < 1:
+        raise ValueError(f'invalid chunk size "{chunks}"')
+
+    return {'codec':codec if codec is not False else None,
+            'level':codecs[codec][0] if codec is not False and level is None else level,
+            'chunks':int(chunks)}
+
+
+def _create_options(policy: Dict[str, Any],
+                    shape: Tuple[int, ...]) -> Dict[str, Any]:
+    """Keyword arguments for h5py.Group.create_dataset following a compression policy."""
+    if 0 in shape: return {}
+
+    if compress := np.prod(shape) >= policy['chunks']*2:
+        chunks = (max(policy['chunks']//int(np.prod(shape[1:])),1),)+tuple(shape[1:])
+    else:
+        chunks = tuple(shape)
+    options: Dict[str, Any] = {'chunks':chunks if chunks else None,'fletcher32':bool(chunks)}
+
+    if not compress or policy['codec'] is None:
+        return options
+    if policy['codec'] == 'blosc':
+        return {**options,**hdf5plugin.Blosc(cname='lz4',clevel=policy['level'],shuffle=hdf5plugin.Blosc.SHUFFLE)}
+    options['shuffle'] = True
+    if policy['codec'] == 'zstd':
+        return {**options,**hdf5plugin.Zstd(clevel=policy['level'])}
+    return {**options,'compression':policy['codec'],'compression_opts':policy['level']}
+
+
+def _interpolation_weights(grid: Sequence[np.ndarray],
+                           points: np.ndarray) -> sparse.csr_matrix:
+    """
+    Weights for trilinear interpolation on a regular grid.
 
-def _read(dataset: h5py._hl.dataset.Dataset) -> np.ndarray:
-    """Read a dataset and its metadata into a numpy.ndarray."""
+    Data at the grid points is ordered with the first coordinate being
+    the fastest. Points outside of the grid are linearly extrapolated.
+    """
+    shape = tuple(len(g) for g in grid)
+    lower,t = [],[]
+    for g,x in zip(grid,points.T):
+        i = np.clip(np.searchsorted(g,x,side='right')-1,0,max(len(g)-2,0))
+        lower.append(i)
+        t.append(np.zeros_like(x) if len(g) == 1 else (x-g[i])/(g[i+1]-g[i]))
+
+    cols,weights = [],[]
+    for corner in itertools.product([0,1],repeat=3):
+        cols.append(np.ravel_multi_index(tuple(np.minimum(i+c,n-1) for i,c,n in zip(lower,corner,shape)),
+                                         shape,order='F'))
+        weights.append(np.prod([t_ if c else 1.-t_ for t_,c in zip(t,corner)],axis=0))
+    rows = np.broadcast_to(np.arange(len(points)),(8,len(points)))
+    return sparse.csr_matrix((np.ravel(weights),(rows.ravel(),np.ravel(cols))),shape=(len(points),np.prod(shape)))
+
+
+def _dtype(dataset: h5py._hl.dataset.Dataset) -> np.dtype:
+    """Data type of a dataset with its metadata."""
     metadata = {k:(v.decode() if not h5py3 and type(v) is bytes else v) for k,v in dataset.attrs.items()}
-    dtype = np.dtype(dataset.dtype,metadata=metadata)                                               # type: ignore
-    return np.array(dataset,dtype=dtype)
+    return np.dtype(dataset.dtype,metadata=metadata)                                                # type: ignore
+
+def _runs(rows: np.ndarray) -> List[slice]:
+    """Split sorted, unique indices into contiguous ranges."""
+    if len(rows) == 0: return []
+    breaks = np.flatnonzero(np.diff(rows) != 1)+1
+    return [slice(s,e+1) for s,e in zip(rows[np.r_[0,breaks]],rows[np.r_[breaks-1,len(rows)-1]])]
+
+def _read(dataset: h5py._hl.dataset.Dataset,
+          rows: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Read a dataset and its metadata into a numpy.ndarray.
+
+    If given, only the rows at the sorted, unique indices are read.
+    Contiguous rows are read as one hyperslab. If there are many
+    short hyperslabs, the enclosing range is read instead.
+    """
+    dtype = _dtype(dataset)
+    if rows is None:
+        return np.array(dataset,dtype=dtype)
+    if len(runs := _runs(rows)) == 0:
+        return np.empty((0,)+dataset.shape[1:],dtype)
+    if len(runs)*64 > (span := slice(runs[0].start,runs[-1].stop)).stop-span.start:                 # overhead of a hyperslab ≈ 64 rows
+        return np.asarray(dataset[span],dtype=dtype)[rows-span.start]
+    return np.concatenate([np.asarray(dataset[r],dtype=dtype) for r in runs]).view(dtype)
+
+def _write(dataset: h5py._hl.dataset.Dataset,
+           data: np.ndarray,
+           rows: Optional[np.ndarray] = None):
+    """
+    Write a numpy.ndarray into a dataset.
+
+    If given, only the rows at the sorted, unique indices are written.
+    """
+    if rows is None:
+        dataset[...] = data
+        return
+    start = 0
+    for r in _runs(rows):
+        dataset[r] = data[start:start+r.stop-r.start]
+        start += r.stop-r.start
+
+def _layout(group: h5py._hl.group.Group) -> Dict[str, Any]:
+    """Nested layout of a group with shape, type, unit, and description of each dataset."""
+    layout: Dict[str, Any] = {}
+    def visit(name: str, obj: Union[h5py._hl.group.Group, h5py._hl.dataset.Dataset]):
+        *path,leaf = name.split('/')
+        node = layout
+        for p in path: node = node[p]
+        node[leaf] = {} if isinstance(obj,h5py.Group) else \
+                     [list(obj.shape),obj.dtype.str]+[(obj.attrs[a] if h5py3 else obj.attrs[a].decode())
+                                                      if a in obj.attrs else '' for a in ['unit','description']]
+    group.visititems(visit)
+    return layout
+
+def _load_manifest(fname: Path) -> Optional[Dict[str, Any]]:
+    """Load a manifest, None if it is missing or invalid."""
+    try:
+        with open(fname) as f:
+            manifest = json.load(f)
+        return manifest if manifest.get('version') == 1 else None
+    except (OSError,ValueError):
+        return None
+
+def _save_manifest(fname: Path,
+                   dadf5: Path,
+                   times: Dict[str, float],
+                   layout: Dict[str, Dict[str, Any]]):
+    """Save a manifest, storing identical layouts of increments only once."""
+    layouts: List[Dict[str, Any]] = []
+    index: Dict[str, int] = {}
+    increments = {}
+    for inc,l in layout.items():
+        if (key := json.dumps(l,sort_keys=True)) not in index:
+            index[key] = len(layouts)
+            layouts.append(l)
+        increments[inc] = {'t/s':float(times[inc]),'layout':index[key]}
+    stat = dadf5.stat()
+    try:
+        with open(fname,'w') as f:
+            json.dump({'version':1,'size':stat.st_size,'mtime_ns':stat.st_mtime_ns,
+                       'increments':increments,'layouts':layouts},f,sort_keys=True)
+    except OSError as err:
+        print(f'Could not write manifest: {err}.')
 
 def _match(requested,
            existing: h5py._hl.base.KeysViewHDF5) -> List[str]:
@@ -56,14 +223,393 @@ def _match(requested,
     return sorted(set(flatten_list([fnmatch.filter(existing,r) for r in requested_])),
                   key=util.natural_sort)
 
-def _empty_like(dataset: np.ma.core.MaskedArray,
-                N_materialpoints: int,
+def _fill_value(dtype: np.dtype,
                 fill_float: float,
-                fill_int: int) -> np.ma.core.MaskedArray:
-    """Create empty numpy.ma.MaskedArray."""
-    return ma.array(np.empty((N_materialpoints,)+dataset.shape[1:],dataset.dtype),
-                    fill_value = fill_float if np.issubdtype(dataset.dtype,np.floating) else fill_int,
-                    mask = True)
+                fill_int: int) -> Union[float, int]:
+    """Fill value for non-existent entries."""
+    return fill_float if np.issubdtype(dtype,np.floating) else fill_int
+
+def _filled(placed: Tuple[np.ndarray, np.ndarray],
+            fill_float: float,
+            fill_int: int) -> np.ndarray:
+    """Set non-existent entries of placed data to the fill value."""
+    data,valid = placed
+    if not valid.all(): data[~valid] = _fill_value(data.dtype,fill_float,fill_int)
+    return data
+
+def _masked(placed: Tuple[np.ndarray, np.ndarray],
+            fill_float: float,
+            fill_int: int) -> np.ma.core.MaskedArray:
+    """Create numpy.ma.MaskedArray from placed data."""
+    data,valid = placed
+    mask = np.empty(data.shape,bool)
+    mask[...] = ~valid.reshape(valid.shape+(1,)*(data.ndim-1))
+    return ma.array(_filled(placed,fill_float,fill_int),
+                    fill_value = _fill_value(data.dtype,fill_float,fill_int),
+                    mask = mask)
+
+
+def _statistics(data: np.ndarray,
+                edges: Optional[np.ndarray] = None) -> Dict[str, Any]:
+    """Count, mean, sum of squared deviations, extrema, and histogram of data (along first axis)."""
+    x = data.reshape(len(data),-1).astype(np.float64)
+    mean = np.mean(x,axis=0)
+    return {'n':len(x),'mean':mean,'M2':np.sum((x-mean)**2,axis=0),
+            'min':np.min(x,axis=0),'max':np.max(x,axis=0),
+            'histogram':None if edges is None else
+                        np.array([np.histogram(x[:,i],edges)[0] for i in range(x.shape[1])])}
+
+def _merge_statistics(a: Optional[Dict[str, Any]],
+                      b: Dict[str, Any]) -> Dict[str, Any]:
+    """Combine statistics of two sets of data (Chan et al., 1979)."""
+    if a is None: return b
+    n = a['n']+b['n']
+    delta = b['mean']-a['mean']
+    return {'n':n,'mean':a['mean']+delta*b['n']/n,'M2':a['M2']+b['M2']+delta**2*a['n']*b['n']/n,
+            'min':np.minimum(a['min'],b['min']),'max':np.maximum(a['max'],b['max']),
+            'histogram':None if a['histogram'] is None else a['histogram']+b['histogram']}
+
+
+_worker_job: Optional[Callable] = None
+
+def _worker_init(job: Callable):
+    """Store the job of a worker process."""
+    global _worker_job
+    _worker_job = job
+
+def _worker_run(item: Any) -> Any:
+    """Run the job of a worker process."""
+    return _worker_job(item)                                                                        # type: ignore
+
+def _map_ordered(job: Callable,
+                 items: Iterable,
+                 workers: int = 1,
+                 background: bool = False) -> Generator[Any, None, None]:
+    """
+    Apply a function to items, optionally in forked worker processes.
+
+    Results are yielded in the order of the items. Items are consumed
+    lazily and the number of items in flight is bounded, which limits
+    memory consumption. A single worker runs in the calling process
+    unless 'background' is set. Without 'fork' support, items are
+    processed serially.
+    """
+    if workers < 1:
+        raise ValueError(f'invalid number of workers "{workers}"')
+
+    if (workers == 1 and not background) or 'fork' not in mp.get_all_start_methods():
+        for item in items:
+            yield job(item)
+    else:
+        with mp.get_context('fork').Pool(workers,_worker_init,(job,)) as pool:
+            pending: deque = deque()
+            for item in items:
+                pending.append(pool.apply_async(_worker_run,(item,)))
+                if len(pending) >= 2*workers: yield pending.popleft().get()
+            while pending:
+                yield pending.popleft().get()
+
+def _vtkhdf_create(f: h5py.File,
+                   v: VTK,
+                   times: Sequence[float]) -> h5py.Group:
+    """
+    Write geometry and time steps of a transient VTKHDF file.
+
+    All time steps share the geometry, i.e. the point, cell,
+    and connectivity offsets of each step are zero.
+    """
+    g = f.create_group('VTKHDF')
+    g.attrs['Version'] = np.array([2,1],np.int64)
+    g.attrs.create('Type',np.bytes_(v.vtk_data.GetClassName()[3:]))
+    N = len(times)
+    steps = g.create_group('Steps')
+    steps.attrs['NSteps'] = N
+    steps['Values'] = np.array(times,np.float64)
+
+    if isinstance(v.vtk_data,vtkImageData):
+        g.attrs['WholeExtent'] = np.array(v.vtk_data.GetExtent(),np.int64)
+        g.attrs['Origin'] = np.array(v.vtk_data.GetOrigin())
+        g.attrs['Spacing'] = np.array(v.vtk_data.GetSpacing())
+        g.attrs['Direction'] = np.eye(3).flatten()
+    else:
+        g['NumberOfPoints'] = [v.N_points]
+        g['Points'] = vtk_to_numpy(v.vtk_data.GetPoints().GetData())
+        for k in ['PartOffsets','PointOffsets']:
+            steps[k] = np.zeros(N,np.int64)
+        steps['NumberOfParts'] = np.ones(N,np.int64)
+        if isinstance(v.vtk_data,vtkPolyData):
+            for topology,cells in zip(['Vertices','Lines','Polygons','Strips'],
+                                      [v.vtk_data.GetVerts(),v.vtk_data.GetLines(),
+                                       v.vtk_data.GetPolys(),v.vtk_data.GetStrips()]):
+                t = g.create_group(topology)
+                t['NumberOfCells'] = [cells.GetNumberOfCells()]
+                t['NumberOfConnectivityIds'] = [cells.GetNumberOfConnectivityIds()]
+                t['Offsets'] = vtk_to_numpy(cells.GetOffsetsArray())
+                t['Connectivity'] = vtk_to_numpy(cells.GetConnectivityArray())
+            for k in ['CellOffsets','ConnectivityIdOffsets']:
+                steps[k] = np.zeros((N,4),np.int64)
+        else:
+            cells = cast(vtkUnstructuredGrid,v.vtk_data).GetCells()
+            g['NumberOfCells'] = [v.N_cells]
+            g['NumberOfConnectivityIds'] = [cells.GetNumberOfConnectivityIds()]
+            g['Offsets'] = vtk_to_numpy(cells.GetOffsetsArray())
+            g['Connectivity'] = vtk_to_numpy(cells.GetConnectivityArray())
+            g['Types'] = np.full(v.N_cells,v.vtk_data.GetCellType(0),np.uint8)                        # uniform cell type
+            for k in ['CellOffsets','ConnectivityIdOffsets']:
+                steps[k] = np.zeros(N,np.int64)
+
+    return g
+
+def _vtkhdf_set(g: h5py.Group,
+                step: int,
+                label: str,
+                data: np.ndarray,
+                at: Literal['Point', 'Cell'],
+                fill: Union[float, int]) -> int:
+    """
+    Write data of one time step of a transient VTKHDF file.
+
+    The dataset is allocated for all steps on first use;
+    steps without data keep the fill value. Slashes, which
+    separate groups in HDF5, are replaced by division slashes.
+    """
+    label = label.replace('/','\u2215')
+    data_: np.ndarray = data.reshape(data.shape[0],-1).astype(np.single if data.dtype in [np.double,np.longdouble] else data.dtype)
+    if data_.shape[1] == 1: data_ = data_.reshape(-1)
+    if 'WholeExtent' in g.attrs:                                                                    # (step,z,y,x,component)
+        extent = g.attrs['WholeExtent']
+        data_ = data_.reshape((1,)+tuple(np.flip(extent[1::2]-extent[::2]+(at == 'Point')))+data_.shape[1:])
+
+    N = data_.shape[0]
+    if label not in (d := g.require_group(f'{at}Data')):
+        shape = (g['Steps'].attrs['NSteps']*N,)+data_.shape[1:]
+        d.create_dataset(label,shape,data_.dtype,fillvalue=fill,
+                         **(_create_options(_compression('gzip',chunk_size),shape)                  # gzip is readable by VTK
+                            if np.prod(shape) >= 2*chunk_size else {}))
+        g['Steps'].require_group(f'{at}DataOffsets')[label] = np.arange(g['Steps'].attrs['NSteps'],dtype=np.int64)*N
+    d[label][step*N:(step+1)*N] = data_
+
+    return data_.nbytes
+
+
+class _FilePool:
+    """
+    HDF5 file handle shared by a Result and all views derived from it.
+
+    Outside of a session, every request opens and closes the file.
+    Within a session, a single handle is kept alive. It is opened
+    read-only on first use and reopened in append mode once write
+    access is requested, after which it serves reads and writes.
+    HDF5 handles must not be used across fork: pending writes are
+    flushed before forking and forked processes open their own handles.
+    """
+
+    def __init__(self, fname: Path):
+        self.fname = fname
+        self.handle: Optional[h5py.File] = None
+        self.sessions = 0
+        self.pid = os.getpid()
+        _pools.add(self)
+
+    def __deepcopy__(self, memo) -> "_FilePool":
+        """Share the pool among copies (views)."""
+        return self
+
+    @contextlib.contextmanager
+    def open(self, mode: Literal['r', 'a'] = 'r') -> Generator[h5py.File, None, None]:
+        """Provide a (pooled) file handle."""
+        if self.sessions == 0 or self.pid != os.getpid():
+            with h5py.File(self.fname,mode) as f:
+                yield f
+        else:
+            if self.handle is None or (mode != 'r' and self.handle.mode == 'r'):
+                self.close()
+                self.handle = h5py.File(self.fname,mode)
+            yield self.handle
+
+    def close(self):
+        """Close the pooled file handle."""
+        if self.handle is not None:
+            self.handle.close()
+            self.handle = None
+
+    def flush(self):
+        """Write pending changes of the pooled file handle."""
+        if self.handle is not None and self.handle.mode != 'r' and self.pid == os.getpid():
+            self.handle.flush()
+
+_pools: 'weakref.WeakSet[_FilePool]' = weakref.WeakSet()
+
+if hasattr(os,'register_at_fork'):
+    os.register_at_fork(before=lambda: [pool.flush() for pool in list(_pools)])
+
+
+class _Cache(dict):
+    """Dictionary shared by a Result and all views derived from it."""
+
+    def __deepcopy__(self, memo) -> "_Cache":
+        """Share the cache among copies (views)."""
+        return self
+
+
+class _LazyDataset:
+    """
+    Proxy of a DADF5 dataset that reads data on access.
+
+    Indexing reads only the selected part (following h5py slicing rules),
+    conversion to numpy.ndarray reads the complete dataset.
+    """
+
+    def __init__(self,
+                 pool: _FilePool,
+                 dataset: h5py._hl.dataset.Dataset):
+        self._pool = pool
+        self.name = dataset.name
+        self.shape = dataset.shape
+        self.dtype = _dtype(dataset)
+
+    def __repr__(self) -> str:
+        """Return repr(self)."""
+        return f'lazy DADF5 dataset "{self.name}": shape {self.shape}, type "{self.dtype}"'
+
+    def __len__(self) -> int:
+        """Return len(self)."""
+        return self.shape[0]
+
+    def __getitem__(self, key) -> np.ndarray:
+        """Read selected part."""
+        with self._pool.open('r') as f:
+            return np.asarray(f[self.name][key],dtype=self.dtype)
+
+    def __array__(self, dtype = None, copy = None) -> np.ndarray:
+        """Read complete dataset."""
+        return self[()] if dtype is None else self[()].astype(dtype)
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape))
+
+
+def _nest(data: Dict[Tuple[Optional[str], ...], Any],
+          nested: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Arrange datasets keyed by label tuples as nested dictionaries, skipping absent (None) levels."""
+    r: Dict[str,Any] = {} if nested is None else nested
+    for key,value in data.items():
+        d = r
+        levels = [k for k in key if k is not None]
+        for k in levels[:-1]:
+            d = d.setdefault(k,{})
+        d[levels[-1]] = value
+    return r
+
+
+class Datasets(Mapping):
+    """
+    Labelled collection of datasets.
+
+    Every dataset is identified by one label per dimension,
+    e.g. increment, type (phase/homogenization/geometry), field, and output.
+    Labels that do not apply (field of geometry data) are None.
+    Selections share the datasets, i.e. no data is copied.
+    """
+
+    def __init__(self,
+                 dims: Sequence[str],
+                 data: Dict[Tuple[Optional[str], ...], Any]):
+        """
+        New labelled collection of datasets.
+
+        Parameters
+        ----------
+        dims : sequence of str
+            Names of the dimensions.
+        data : dict
+            Datasets keyed by tuples containing one label per dimension.
+
+        """
+        self.dims = tuple(dims)
+        self._data = data
+
+    def __repr__(self) -> str:
+        """Return repr(self)."""
+        return '\n'.join([f'{len(self)} datasets']
+                        +[f'{dim}: {", ".join(map(str,labels))}' for dim,labels in self.coords.items()])
+
+    def __len__(self) -> int:
+        """Return len(self)."""
+        return len(self._data)
+
+    def __iter__(self):
+        """Iterate over label tuples."""
+        return iter(self._data)
+
+    def __getitem__(self, key: Union[Optional[str], Tuple[Optional[str], ...]]) -> Any:
+        """Return dataset with given labels."""
+        return self._data[key if isinstance(key,tuple) else (key,)]
+
+    @property
+    def coords(self) -> Dict[str, List[Optional[str]]]:
+        """Labels of each dimension in order of appearance."""
+        return {dim:list(dict.fromkeys(key[i] for key in self._data)) for i,dim in enumerate(self.dims)}
+
+    def sel(self, **labels: Union[Optional[str], Sequence[Optional[str]]]) -> "Datasets":
+        """
+        Select datasets by label.
+
+        Parameters
+        ----------
+        **labels : (list of) str
+            Labels to select per dimension.
+            Dimensions selected by a single label are dropped.
+
+        Returns
+        -------
+        selection : damask._result.Datasets
+            Selected datasets.
+
+        Examples
+        --------
+        Select the deformation gradient of phase 'Aluminum':
+
+        >>> import damask
+        >>> d = damask.Result('my_file.hdf5').get('F',labelled=True)
+        >>> F = d.sel(type='phase',label='Aluminum',output='F')
+
+        """
+        if (unknown := set(labels) - set(self.dims)):
+            raise ValueError(f'invalid dimension(s) "{", ".join(unknown)}"')
+        scalar = [i for i,dim in enumerate(self.dims) if dim in labels and not isinstance(labels[dim],(list,tuple))]
+        allowed = [None if dim not in labels else
+                   {labels[dim]} if i in scalar else set(labels[dim])                               # type: ignore
+                   for i,dim in enumerate(self.dims)]
+
+        return Datasets([dim for i,dim in enumerate(self.dims) if i not in scalar],
+                        {tuple(k for i,k in enumerate(key) if i not in scalar):v for key,v in self._data.items()
+                         if all(a is None or k in a for k,a in zip(key,allowed))})
+
+    def to_dict(self, flatten: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Arrange datasets in nested dictionaries as returned by `get` and `place`.
+
+        Parameters
+        ----------
+        flatten : bool, optional
+            Remove singular levels of the hierarchy. Defaults to True.
+
+        Returns
+        -------
+        data : dict
+            Datasets structured by their labels.
+
+        """
+        if not self._data: return None
+        if len(self) == 1 and all(k is None for k in next(iter(self))): return next(iter(self.values()))
+        r = _nest(self._data)
+        return util.dict_flatten(r) if flatten else r
 
 
 class Result:
@@ -94,7 +640,9 @@ class Result:
 
     """
 
-    def __init__(self, fname: Union[str, Path]):
+    def __init__(self,
+                 fname: Union[str, Path],
+                 manifest: bool = False):
         """
         New result view bound to a DADF5 file.
 
@@ -102,8 +650,23 @@ class Result:
         ----------
         fname : str or pathlib.Path
             Name of the DADF5 file to be opened.
+        manifest : bool, optional
+            Use a sidecar file (extension '.manifest.json') that stores the
+            layout of the DADF5 file, i.e. increments, times, and shape, type,
+            unit, and description of each dataset. It is created if missing
+            and updated incrementally if the DADF5 file has changed.
+            Defaults to False.
+
+        Notes
+        -----
+        Increments that are already known to the manifest are assumed to
+        be unchanged, except for the last one. Modifications made via
+        damask.Result update an existing manifest.
 
         """
+        self.fname = Path(fname).expanduser().absolute()
+        self._cache = _Cache()
+
         with h5py.File(fname,'r') as f:
 
             self.version_major = f.attrs['DADF5_version_major']
@@ -121,9 +684,13 @@ class Result:
 
             r = re.compile(rf'{prefix_inc}([0-9]+)')
             self._increments = sorted([i for i in f.keys() if r.match(i)],key=util.natural_sort)
-            self._times = {int(i.split('_')[1]):np.around(f[i].attrs['t/s'],12) for i in self._increments}
             if len(self._increments) == 0:
                 raise ValueError('incomplete DADF5 file')
+            if manifest:
+                times = self._read_manifest(f)
+                self._times = {int(i.split('_')[1]):np.around(times[i],12) for i in self._increments}
+            else:
+                self._times = {int(i.split('_')[1]):np.around(f[i].attrs['t/s'],12) for i in self._increments}
 
             self.N_materialpoints, self.N_constituents = np.shape(f['cell_to/phase'])
 
@@ -134,9 +701,9 @@ class Result:
 
             fields: List[str] = []
             for c in self._phases:
-                fields += f['/'.join([self._increments[0],'phase',c])].keys()
+                fields += self._keys(f,'/'.join([self._increments[0],'phase',c]))
             for m in self._homogenizations:
-                fields += f['/'.join([self._increments[0],'homogenization',m])].keys()
+                fields += self._keys(f,'/'.join([self._increments[0],'homogenization',m]))
             self._fields = sorted(set(fields),key=util.natural_sort)                                # make unique
 
         self._visible = {'increments':      self._increments,
@@ -145,7 +712,10 @@ class Result:
                          'fields':          self._fields,
                         }
 
-        self.fname = Path(fname).expanduser().absolute()
+        self._pool = _FilePool(self.fname)
+        self._points: Optional[np.ndarray] = None
+        self._batch: Optional[List[Tuple[Callable[..., DADF5Dataset], Dict[str, str], Dict[str, Any], int]]] = None
+        self._compression = _compression('gzip',chunk_size)
 
         self._protected = True
 
@@ -169,7 +739,7 @@ class Result:
         Give short, human-readable summary.
 
         """
-        with h5py.File(self.fname,'r') as f:
+        with self._pool.open('r') as f:
             header = [f'Created by {f.attrs["creator"]}',
                       f'        on {f.attrs["created"]}',
                       f' executing "{f.attrs["call"]}"']
@@ -186,6 +756,91 @@ class Result:
         return util.srepr([util.deemph(header)] + first + in_between + last)
 
 
+    @property
+    def _manifest(self) -> Path:
+        """Name of the manifest file."""
+        return self.fname.with_suffix('.manifest.json')
+
+
+    def _read_manifest(self, f: h5py.File) -> Dict[str, float]:
+        """
+        Load the layout from the manifest and update it if needed.
+
+        Parameters
+        ----------
+        f : h5py.File
+            Opened DADF5 file.
+
+        Returns
+        -------
+        times : dict
+            Time of each increment.
+
+        """
+        manifest = _load_manifest(self._manifest)
+        stat = self.fname.stat()
+        known = {} if manifest is None else manifest['increments']
+        layout = {inc: manifest['layouts'][known[inc]['layout']] for inc in known} if manifest else {}
+        times = {inc: known[inc]['t/s'] for inc in known}
+
+        if manifest is None or (manifest['size'],manifest['mtime_ns']) != (stat.st_size,stat.st_mtime_ns):
+            last = sorted(known,key=util.natural_sort)[-1:]
+            for inc in self._increments:
+                if inc not in known or inc in last:
+                    layout[inc] = _layout(f[inc])
+                    times[inc] = f[inc].attrs['t/s']
+            layout = {inc: layout[inc] for inc in self._increments}
+            _save_manifest(self._manifest,self.fname,times,layout)
+
+        self._cache['layout'] = layout
+        return times
+
+
+    def _update_manifest(self, increments: List[str]):
+        """
+        Update the layout of modified increments in the manifest.
+
+        Parameters
+        ----------
+        increments : list of str
+            Names of the modified increments.
+
+        """
+        if (layout := self._cache.get('layout')) is None:
+            if (manifest := _load_manifest(self._manifest)) is None: return
+            layout = {inc: manifest['layouts'][v['layout']] for inc,v in manifest['increments'].items()}
+        with self._pool.open('r') as f:
+            for inc in increments:
+                layout[inc] = _layout(f[inc])
+        times = {inc: self._times[int(inc.split('_')[1])] for inc in layout}
+        _save_manifest(self._manifest,self.fname,times,layout)
+
+
+    def _keys(self, f: h5py.File, path: str) -> List[str]:
+        """
+        Names of the members of a group.
+
+        Parameters
+        ----------
+        f : h5py.File
+            Opened DADF5 file.
+        path : str
+            Path of the group.
+
+        Returns
+        -------
+        keys : list of str
+            Names of the members, taken from the manifest if available.
+
+        """
+        if (layout := self._cache.get('layout')) is None:
+            return list(f[path].keys())
+        node = layout
+        for p in path.split('/'):
+            node = node[p]
+        return list(node.keys())
+
+
     def _manage_view(self,
                      action: Literal['set', 'add', 'del'],
                      increments: Union[None, int, Sequence[int], str, Sequence[str], bool] = None,
@@ -211,6 +866,7 @@ class Result:
             raise ValueError('"increments" and "times" are mutually exclusive')
 
         dup = self.copy()
+        dup._batch = None
         for what,datasets in zip(['increments','times','phases','homogenizations','fields'],
                                  [ increments,  times,  phases,  homogenizations,  fields ]):
             if  datasets is None:
@@ -255,6 +911,132 @@ class Result:
         return dup
 
 
+    def _select_points(self,
+                       points: Union[IntSequence, Tuple[slice, ...], bool]) -> Optional[np.ndarray]:
+        """
+        Convert a selection of material points into sorted, unique indices.
+
+        Parameters
+        ----------
+        points : numpy.ndarray of int or bool, tuple of slice, or bool
+            Indices, mask, or (for structured grids) slices along the cells.
+
+        Returns
+        -------
+        points : numpy.ndarray of int or None
+            Indices of the selected material points.
+            None if all material points are selected.
+
+        """
+        if points is True:
+            return None
+        if points is False:
+            return np.empty(0,np.int64)
+
+        if isinstance(points,tuple) and all(isinstance(s,slice) for s in points):
+            if not self.structured or len(points) != 3:
+                raise ValueError('selection by slices requires a structured grid and three slices')
+            i,j,k = [np.arange(c,dtype=np.int64)[s] for c,s in zip(self.cells,cast(Tuple[slice, ...],points))]
+            return np.unique(i[:,None,None] + self.cells[0]*(j[None,:,None] + self.cells[1]*k[None,None,:]))
+
+        points_ = np.asarray(points)
+        if points_.dtype == bool:
+            if self.structured and points_.shape == tuple(self.cells):
+                points_ = points_.reshape(-1,order='F')
+            if points_.shape != (self.N_materialpoints,):
+                raise ValueError(f'mask of invalid shape {points_.shape}')
+            return np.flatnonzero(points_)
+
+        points_ = points_.astype(np.int64).reshape(-1)
+        points_ = np.where(points_<0,points_+self.N_materialpoints,points_)
+        if np.any(points_<0) or np.any(points_>=self.N_materialpoints):
+            raise IndexError(f'material point index out of range (N_materialpoints = {self.N_materialpoints})')
+        return np.unique(points_)
+
+
+    @property
+    def _N_points(self) -> int:
+        """Number of selected material points."""
+        return self.N_materialpoints if self._points is None else len(self._points)
+
+
+    def _bounding_box(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Lower (inclusive) and upper (exclusive) cell bounds of the selected material points."""
+        if self._points is None:
+            return np.zeros(3,np.int64),np.array(self.cells,np.int64)
+        if len(self._points) == 0:
+            return np.zeros(3,np.int64),np.zeros(3,np.int64)
+        ijk = np.array(np.unravel_index(self._points,self.cells,order='F'))
+        return ijk.min(axis=1),ijk.max(axis=1)+1
+
+
+    def _geometry_rows(self, out: str) -> Optional[np.ndarray]:
+        """
+        Rows of a geometry dataset belonging to the selected material points.
+
+        Parameters
+        ----------
+        out : str
+            Name of the geometry dataset.
+
+        Returns
+        -------
+        rows : numpy.ndarray of int or None
+            Indices of the rows. None if all rows are needed.
+
+        """
+        if self._points is None:
+            return None
+        if out == 'u_p':
+            return self._points
+        if out == 'u_n' and self.structured:
+            lo,hi = self._bounding_box()
+            i,j,k = [np.arange(l,h+1 if h>l else l,dtype=np.int64) for l,h in zip(lo,hi)]
+            c = self.cells+1
+            return (i[:,None,None] + c[0]*(j[None,:,None] + c[1]*k[None,None,:])).reshape(-1,order='F')
+        return None
+
+
+    def _place(self,
+               placed: Dict[str, Tuple[np.ndarray, np.ndarray]],
+               dataset: h5py._hl.dataset.Dataset,
+               targets: List[Tuple[str, np.ndarray, np.ndarray]],
+               buffers: Optional[Dict[str, Tuple[np.ndarray, np.ndarray]]] = None):
+        """
+        Place data of a phase/homogenization spatially.
+
+        Parameters
+        ----------
+        placed : dict of tuple(numpy.ndarray, numpy.ndarray)
+            Spatially ordered data and validity of its entries, updated in-place.
+        dataset : h5py.Dataset
+            Dataset to read.
+        targets : list of tuple(str, numpy.ndarray, numpy.ndarray)
+            Key in 'placed', cell indices, and data indices.
+        buffers : dict of tuple(numpy.ndarray, numpy.ndarray), optional
+            Placed data of a previous increment to be overwritten.
+
+        """
+        if self._points is None:
+            data = _read(dataset)
+        else:
+            rows = np.unique(np.concatenate([in_data for _,_,in_data in targets]))
+            data = _read(dataset,rows)
+            targets = [(key,at_cell,np.searchsorted(rows,in_data)) for key,at_cell,in_data in targets]
+
+        for key,at_cell,in_data in targets:
+            if key not in placed:
+                shape = (self._N_points,)+data.shape[1:]
+                if buffers is not None and key in buffers and buffers[key][0].shape == shape \
+                                       and buffers[key][0].dtype == data.dtype:
+                    placed[key] = buffers[key]
+                    placed[key][1][...] = False
+                else:
+                    placed[key] = (np.empty(shape,data.dtype),np.zeros(shape[0],bool))
+            placed[key][0][at_cell] = data[in_data]
+            placed[key][1][at_cell] = True
+
+
     def increments_in_range(self,
                             start: Union[None, str, int] = None,
                             end: Union[None, str, int] = None) -> Sequence[int]:
@@ -309,7 +1091,10 @@ class Result:
              phases: Union[None, str, Sequence[str], bool] = None,
              homogenizations: Union[None, str, Sequence[str], bool] = None,
              fields: Union[None, str, Sequence[str], bool] = None,
-             protected: Optional[bool] = None) -> "Result":
+             points: Union[None, IntSequence, Tuple[slice, ...], bool] = None,
+             protected: Optional[bool] = None,
+             compression: Union[None, bool, str, Tuple[str, int]] = None,
+             chunks: Optional[int] = None) -> "Result":
         """
         Set view.
 
@@ -328,8 +1113,25 @@ class Result:
             Names of homogenizations to select.
         fields: (list of) str, or bool, optional.
             Names of fields to select.
+        points: numpy.ndarray of int or bool, tuple of slice, or bool, optional.
+            Material points to select, given as indices or as mask.
+            For structured grids, a tuple of slices selects a box of cells
+            and a mask can also be given with the shape of the grid.
+            True selects all, False selects no material points.
+            Only the data of the selected material points is read and
+            added; entries of new datasets at other points are not set.
         protected: bool, optional.
             Protection status of existing data.
+        compression: bool, str, or tuple of (str, int), optional.
+            Compression of new datasets, i.e. one of 'gzip', 'lzf',
+            'blosc', and 'zstd', optionally with level.
+            True is equivalent to 'gzip', False disables compression.
+            'blosc' and 'zstd' require hdf5plugin.
+            Defaults to ('gzip',6) for a new Result.
+        chunks: int, optional.
+            Number of values per chunk of new datasets.
+            Datasets with less than two chunks are not compressed.
+            Defaults to 131072 for a new Result.
 
         Returns
         -------
@@ -350,8 +1152,27 @@ class Result:
         >>> r = damask.Result('my_file.hdf5')
         >>> r_t10to40 = r.view(times=r.times_in_range(10.0,40.0))
 
+        Get a view that shows only the first 64x64x64 cells of a grid:
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5')
+        >>> r_box = r.view(points=(slice(0,64),slice(0,64),slice(0,64)))
+
+        Get a view that writes new datasets with fast LZF compression:
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5')
+        >>> r_lzf = r.view(compression='lzf')
+
         """
         dup = self._manage_view('set',increments,times,phases,homogenizations,fields)
+        if points is not None:
+            dup._points = self._select_points(points)
+        if compression is not None or chunks is not None:
+            current: Union[bool, str, Tuple[str, int]] = \
+                False if self._compression['codec'] is None else (self._compression['codec'],self._compression['level'])
+            dup._compression = _compression(current if compression is None else compression,
+                                            self._compression['chunks'] if chunks is None else chunks)
         if protected is not None:
             if not protected:
                 print(util.warn('Warning: Modification of existing datasets allowed!'))
@@ -455,12 +1276,180 @@ class Result:
             View with all attributes visible.
 
         """
-        return self.view(increments='*',phases='*',homogenizations='*',fields='*')
+        return self.view(increments='*',phases='*',homogenizations='*',fields='*',points=True)
+
+
+    @contextlib.contextmanager
+    def session(self) -> Generator["Result", None, None]:
+        """
+        Keep the DADF5 file open for the duration of a context.
+
+        By default, the file is opened and closed for every operation.
+        Within a session, the file handle is reused by this object and
+        all views derived from it. Sessions can be nested; the file is
+        closed when the outermost session ends.
+
+        Returns
+        -------
+        result : damask.Result
+            The object itself.
+
+        Examples
+        --------
+        Add the Mises equivalent of the Cauchy stress and read it
+        while opening 'my_file.hdf5' only once:
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5')
+        >>> with r.session():
+        ...     r.add_stress_Cauchy()
+        ...     r.add_equivalent_Mises('sigma')
+        ...     sigma_vM = r.view(increments=-1).place('sigma_vM')
+        [...]
+
+        """
+        self._pool.sessions += 1
+        try:
+            yield self
+        finally:
+            self._pool.sessions -= 1
+            if self._pool.sessions == 0: self._pool.close()
+
+
+    @contextlib.contextmanager
+    def batch(self,
+              store: Union[None, str, List[str]] = None) -> Generator["Result", None, None]:
+        """
+        Evaluate the pointwise calculations of a context together.
+
+        Within a batch, the methods that add pointwise data only record
+        the calculation. At the end of the context, the required datasets
+        of each group are read once and all calculations are evaluated in
+        the order of the calls. Results of preceding calculations are
+        taken from memory.
+
+        Parameters
+        ----------
+        store : (list of) str, optional
+            Names of the new datasets to store. Defaults to None,
+            in which case all new datasets are stored.
+
+        Returns
+        -------
+        result : damask.Result
+            The object itself.
+
+        Notes
+        -----
+        Only calculations added to this object are collected,
+        not those added to views derived from it.
+        Calculations that require a structured grid
+        (e.g. `add_curl`) cannot be part of a batch.
+
+        Examples
+        --------
+        Add the Mises equivalents of Cauchy stress and logarithmic strain
+        without storing the intermediate tensors:
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5')
+        >>> with r.batch(['sigma_vM','epsilon_V^0.0(F)_vM']):
+        ...     r.add_stress_Cauchy()
+        ...     r.add_equivalent_Mises('sigma')
+        ...     r.add_strain()
+        ...     r.add_equivalent_Mises('epsilon_V^0.0(F)')
+
+        """
+        if self._batch is not None:
+            raise ValueError('nested batch')
+
+        self._batch = []
+        try:
+            yield self
+            stages = self._batch
+        finally:
+            self._batch = None
+
+        if len(stages) > 0:
+            self._add_fused([stage[:3] for stage in stages],
+                            None if store is None else [store] if isinstance(store,str) else list(store),
+                            max(stage[3] for stage in stages))
+
+
+    def refresh(self) -> "Result":
+        """
+        Discover increments that were added to the DADF5 file.
+
+        Use this to follow a running simulation: new increments are
+        added to this object and a view of only them is returned.
+        They become visible in this object only if all increments
+        were visible before.
+        Increments that are still being written are not considered.
+        The file is opened in single-writer/multiple-reader (SWMR) mode
+        and opening is retried while it is locked by the simulation.
+
+        Returns
+        -------
+        view : damask.Result
+            View showing only the new increments.
+
+        Notes
+        -----
+        When adding data, existing datasets are skipped unless the view
+        is unprotected. Hence, the monitoring of a running simulation
+        can also be based on views of all increments.
+
+        Examples
+        --------
+        Add the Cauchy stress and export it for new increments:
+
+        >>> import time
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5')
+        >>> while True:
+        ...     new = r.refresh()
+        ...     new.add_stress_Cauchy()
+        ...     new.export_VTK('sigma')
+        ...     time.sleep(60)
+
+        """
+        self._pool.close()
+        for delay in [0.1,0.2,0.4,0.8,1.6,3.2]:
+            try:
+                f = h5py.File(self.fname,'r',swmr=True)
+                break
+            except OSError:
+                time.sleep(delay)
+        else:
+            f = h5py.File(self.fname,'r',swmr=True)
+
+        with f:
+            current = f.get('current',getlink=True)
+            current = current.path.strip('/') if isinstance(current,h5py.SoftLink) else None
+            r = re.compile(rf'{prefix_inc}([0-9]+)')
+            new = sorted([i for i in f.keys() if r.match(i) and i != current and i not in self._increments],
+                         key=util.natural_sort)
+
+            for inc in new:
+                self._times[int(inc.split('_')[1])] = np.around(f[inc].attrs['t/s'],12)
+                if 'layout' in self._cache: self._cache['layout'][inc] = _layout(f[inc])
+
+        if self._visible['increments'] == self._increments:                                         # unrestricted view
+            self._visible['increments'] = sorted(self._visible['increments']+new,key=util.natural_sort)
+        self._increments = sorted(self._increments+new,key=util.natural_sort)
+        if len(new) > 0 and 'layout' in self._cache:
+            _save_manifest(self._manifest,self.fname,
+                           {inc: self._times[int(inc.split('_')[1])] for inc in self._increments},
+                           self._cache['layout'])
+
+        return self.view(increments=new)
 
 
     def rename(self,
-               name_src: str,
-               name_dst: str):
+               name_src: Union[str, Sequence[str]],
+               name_dst: Union[str, Sequence[str]],
+               *,
+               repack: bool = False):
         r"""
         Rename/move datasets (within the same group/folder).
 
@@ -469,10 +1458,12 @@ class Result:
 
         Parameters
         ----------
-        name_src : str
-            Name of the datasets to be renamed.
-        name_dst : str
-            New name of the datasets.
+        name_src : (list of) str
+            Name(s) of the datasets to be renamed.
+        name_dst : (list of) str
+            New name(s) of the datasets.
+        repack : bool, optional
+            Rewrite the file afterwards. Defaults to False.
 
         Examples
         --------
@@ -484,25 +1475,40 @@ class Result:
         \x1b[93m\x1b[1mWarning: Modification of existing datasets allowed!\x1b[0m\x1b[0m
         >>> r_unprotected.rename('F','def_grad')
 
+        Rename the deformation gradient and the stress in one pass:
+
+        >>> r_unprotected.rename(['F','P'],['def_grad','stress_PK1'])
+
         """
         if self._protected:
             raise PermissionError('rename datasets')
 
-        with h5py.File(self.fname,'a') as f:
+        names_src = [name_src] if isinstance(name_src,str) else list(name_src)
+        names_dst = [name_dst] if isinstance(name_dst,str) else list(name_dst)
+        if len(names_src) != len(names_dst):
+            raise ValueError(f'number of source ({len(names_src)}) and destination ({len(names_dst)}) names differ')
+
+        with self._pool.open('a') as f:
             for inc in self._visible['increments']:
                 for ty in ['phase','homogenization']:
                     for label in self._visible[ty+'s']:
-                        for field in _match(self._visible['fields'],f['/'.join([inc,ty,label])].keys()):
-                            path_src = '/'.join([inc,ty,label,field,name_src])
-                            path_dst = '/'.join([inc,ty,label,field,name_dst])
-                            if path_src in f.keys():
-                                f[path_dst] = f[path_src]
-                                f[path_dst].attrs['renamed'] = f'original name: {name_src}' if h5py3 else \
-                                                               f'original name: {name_src}'.encode()
-                                del f[path_src]
-
-
-    def remove(self, name: str):
+                        for field in _match(self._visible['fields'],self._keys(f,'/'.join([inc,ty,label]))):
+                            group = f['/'.join([inc,ty,label,field])]
+                            for src,dst in zip(names_src,names_dst):
+                                if src in group:
+                                    group[dst] = group[src]
+                                    group[dst].attrs['renamed'] = f'original name: {src}' if h5py3 else \
+                                                                  f'original name: {src}'.encode()
+                                    del group[src]
+
+        if repack: self._repack()
+        self._update_manifest(self._visible['increments'])
+
+
+    def remove(self,
+               name: Union[str, Sequence[str]],
+               *,
+               repack: bool = False):
         r"""
         Remove/delete datasets.
 
@@ -511,8 +1517,12 @@ class Result:
 
         Parameters
         ----------
-        name : str
-            Name of the datasets to be deleted.
+        name : (list of) str
+            Name(s) of the datasets to be deleted.
+            Wildcard matching with '?' and '*' is supported.
+        repack : bool, optional
+            Rewrite the file afterwards to reclaim the space
+            of the deleted datasets. Defaults to False.
 
         Examples
         --------
@@ -524,17 +1534,55 @@ class Result:
         \x1b[93m\x1b[1mWarning: Modification of existing datasets allowed!\x1b[0m\x1b[0m
         >>> r_unprotected.remove('F')
 
+        Delete all von Mises equivalents and shrink the file:
+
+        >>> r_unprotected.remove('*_vM',repack=True)
+
         """
         if self._protected:
             raise PermissionError('delete datasets')
 
-        with h5py.File(self.fname,'a') as f:
+        with self._pool.open('a') as f:
             for inc in self._visible['increments']:
                 for ty in ['phase','homogenization']:
                     for label in self._visible[ty+'s']:
-                        for field in _match(self._visible['fields'],f['/'.join([inc,ty,label])].keys()):
-                            path = '/'.join([inc,ty,label,field,name])
-                            if path in f.keys(): del f[path]
+                        for field in _match(self._visible['fields'],self._keys(f,'/'.join([inc,ty,label]))):
+                            path = '/'.join([inc,ty,label,field])
+                            for out in _match(name,self._keys(f,path)):
+                                del f['/'.join([path,out])]
+
+        if repack: self._repack()
+        self._update_manifest(self._visible['increments'])
+
+
+    def _repack(self):
+        """
+        Rewrite the file to reclaim unused space.
+
+        HDF5 does not release the space of deleted objects, hence all
+        objects are copied into a new file that replaces the original.
+        Soft and external links are recreated, hard-linked objects are
+        copied only once.
+        """
+        self._pool.close()
+        tmp = self.fname.with_name(f'.{self.fname.name}.repack')
+        try:
+            with h5py.File(self.fname,'r') as f_in, h5py.File(tmp,'w') as f_out:
+                for k in f_in.attrs:
+                    f_out.attrs.create(k,f_in.attrs[k],dtype=f_in.attrs.get_id(k).dtype)
+                copied: Dict[Any, str] = {}
+                for name in f_in:
+                    link = f_in.get(name,getlink=True)
+                    if isinstance(link,(h5py.SoftLink,h5py.ExternalLink)):
+                        f_out[name] = link
+                    elif (oid := f_in[name].id) in copied:
+                        f_out[name] = f_out[copied[oid]]
+                    else:
+                        f_in.copy(name,f_out)
+                        copied[oid] = name
+            os.replace(tmp,self.fname)
+        finally:
+            tmp.unlink(missing_ok=True)
 
 
     def list_data(self) -> List[str]:
@@ -548,21 +1596,24 @@ class Result:
 
         """
         msg = []
-        with h5py.File(self.fname,'r') as f:
+        with self._pool.open('r') as f:
             for inc in self._visible['increments']:
                 msg += [f'\n{inc} ({self._times[int(inc.split("_")[1])]} s)']
                 for ty in ['phase','homogenization']:
                     msg += [f'  {ty}']
                     for label in self._visible[ty+'s']:
                         msg += [f'    {label}']
-                        for field in _match(self._visible['fields'],f['/'.join([inc,ty,label])].keys()):
+                        for field in _match(self._visible['fields'],self._keys(f,'/'.join([inc,ty,label]))):
                             msg += [f'      {field}']
-                            for d in f['/'.join([inc,ty,label,field])].keys():
-                                dataset = f['/'.join([inc,ty,label,field,d])]
-                                unit = dataset.attrs["unit"] if h5py3 else \
-                                       dataset.attrs["unit"].decode()
-                                description = dataset.attrs['description'] if h5py3 else \
-                                              dataset.attrs['description'].decode()
+                            for d in self._keys(f,'/'.join([inc,ty,label,field])):
+                                if 'layout' in self._cache:
+                                    unit,description = self._cache['layout'][inc][ty][label][field][d][2:]
+                                else:
+                                    dataset = f['/'.join([inc,ty,label,field,d])]
+                                    unit = dataset.attrs["unit"] if h5py3 else \
+                                           dataset.attrs["unit"].decode()
+                                    description = dataset.attrs['description'] if h5py3 else \
+                                                  dataset.attrs['description'].decode()
                                 msg += [f'        {d} / {unit}: {description}']
 
         return msg
@@ -578,7 +1629,7 @@ class Result:
     def simulation_setup_files(self):
         """Simulation setup files used to generate the Result object."""
         files = []
-        with h5py.File(self.fname,'r') as f_in:
+        with self._pool.open('r') as f_in:
             f_in['setup'].visititems(lambda name,obj: files.append(name) if isinstance(obj,h5py.Dataset) else None)
         return files
 
@@ -613,7 +1664,7 @@ class Result:
         if self.structured:
             return grid_filters.coordinates0_point(self.cells,self.size,self.origin).reshape(-1,3,order='F')
         else:
-            with h5py.File(self.fname,'r') as f:
+            with self._pool.open('r') as f:
                 return f['geometry/x_p'][()]
 
     @property
@@ -622,7 +1673,7 @@ class Result:
         if self.structured:
             return grid_filters.coordinates0_node(self.cells,self.size,self.origin).reshape(-1,3,order='F')
         else:
-            with h5py.File(self.fname,'r') as f:
+            with self._pool.open('r') as f:
                 return f['geometry/x_n'][()]
 
     @property
@@ -631,14 +1682,17 @@ class Result:
         if self.structured:
             return VTK.from_image_data(self.cells,self.size,self.origin)
         else:
-            with h5py.File(self.fname,'r') as f:
+            with self._pool.open('r') as f:
                 return VTK.from_unstructured_grid(f['/geometry/x_n'][()],
                                                   f['/geometry/T_c'][()]-1,
                                                   f['/geometry/T_c'].attrs['VTK_TYPE'] if h5py3 else \
                                                   f['/geometry/T_c'].attrs['VTK_TYPE'].decode())
 
 
-    def add_absolute(self, x: str):
+    def add_absolute(self,
+                     x: str,
+                     *,
+                     workers: int = 1):
         """
         Add absolute value.
 
@@ -646,6 +1700,8 @@ class Result:
         ----------
         x : str
             Name of scalar, vector, or tensor dataset to take absolute value of.
+        workers : int, optional
+            Number of worker processes. Defaults to 1.
 
         """
         def absolute(x: DADF5Dataset) -> DADF5Dataset:
@@ -659,14 +1715,16 @@ class Result:
                               }
                      }
 
-        self._add_generic_pointwise(absolute,{'x':x})
+        self._add_generic_pointwise(absolute,{'x':x},workers=workers)
 
 
     def add_calculation(self,
                         formula: str,
                         name: str,
                         unit: str = 'n/a',
-                        description: Optional[str] = None):
+                        description: Optional[str] = None,
+                        *,
+                        workers: int = 1):
         """
         Add result of a general formula.
 
@@ -681,6 +1739,8 @@ class Result:
             Physical unit of the result.
         description : str, optional
             Human-readable description of the result.
+        workers : int, optional
+            Number of worker processes. Defaults to 1.
 
         Examples
         --------
@@ -736,12 +1796,14 @@ class Result:
 
         dataset_mapping = {d:d for d in set(re.findall(r'#(.*?)#',formula))}                        # datasets used in the formula
         args             = {'formula':formula,'label':name,'unit':unit,'description':description}
-        self._add_generic_pointwise(calculation,dataset_mapping,args)
+        self._add_generic_pointwise(calculation,dataset_mapping,args,workers=workers)
 
 
     def add_stress_Cauchy(self,
                           P: str = 'P',
-                          F: str = 'F'):
+                          F: str = 'F',
+                          *,
+                          workers: int = 1):
         """
         Add Cauchy stress calculated from first Piola-Kirchhoff stress and deformation gradient.
 
@@ -753,6 +1815,8 @@ class Result:
         F : str, optional
             Name of the dataset containing the deformation gradient.
             Defaults to 'F'.
+        workers : int, optional
+            Number of worker processes. Defaults to 1.
 
         """
 
@@ -769,10 +1833,13 @@ class Result:
                               }
                     }
 
-        self._add_generic_pointwise(stress_Cauchy,{'P':P,'F':F})
+        self._add_generic_pointwise(stress_Cauchy,{'P':P,'F':F},workers=workers)
 
 
-    def add_determinant(self, T: str):
+    def add_determinant(self,
+                        T: str,
+                        *,
+                        workers: int = 1):
         """
         Add the determinant of a tensor.
 
@@ -780,6 +1847,8 @@ class Result:
         ----------
         T : str
             Name of tensor dataset.
+        workers : int, optional
+            Number of worker processes. Defaults to 1.
 
         Examples
         --------
@@ -803,10 +1872,13 @@ class Result:
                               }
                     }
 
-        self._add_generic_pointwise(determinant,{'T':T})
+        self._add_generic_pointwise(determinant,{'T':T},workers=workers)
 
 
-    def add_deviator(self, T: str):
+    def add_deviator(self,
+                     T: str,
+                     *,
+                     workers: int = 1):
         """
         Add the deviatoric part of a tensor.
 
@@ -814,6 +1886,8 @@ class Result:
         ----------
         T : str
             Name of tensor dataset.
+        workers : int, optional
+            Number of worker processes. Defaults to 1.
 
         Examples
         --------
@@ -837,12 +1911,14 @@ class Result:
                               }
                      }
 
-        self._add_generic_pointwise(deviator,{'T':T})
+        self._add_generic_pointwise(deviator,{'T':T},workers=workers)
 
 
     def add_eigenvalue(self,
                        T_sym: str,
-                       eigenvalue: Literal['max', 'mid', 'min'] = 'max'):
+                       eigenvalue: Literal['max', 'mid', 'min'] = 'max',
+                       *,
+                       workers: int = 1):
         """
         Add eigenvalues of symmetric tensor.
 
@@ -852,6 +1928,8 @@ class Result:
             Name of symmetric tensor dataset.
         eigenvalue : {'max', 'mid', 'min'}, optional
             Eigenvalue. Defaults to 'max'.
+        workers : int, optional
+            Number of worker processes. Defaults to 1.
 
         Examples
         --------
@@ -884,12 +1962,14 @@ class Result:
                              }
                     }
 
-        self._add_generic_pointwise(eigenval,{'T_sym':T_sym},{'eigenvalue':eigenvalue})
+        self._add_generic_pointwise(eigenval,{'T_sym':T_sym},{'eigenvalue':eigenvalue},workers=workers)
 
 
     def add_eigenvector(self,
                         T_sym: str,
-                        eigenvalue: Literal['max', 'mid', 'min'] = 'max'):
+                        eigenvalue: Literal['max', 'mid', 'min'] = 'max',
+                        *,
+                        workers: int = 1):
         """
         Add eigenvector of symmetric tensor.
 
@@ -900,6 +1980,8 @@ class Result:
         eigenvalue : {'max', 'mid', 'min'}, optional
             Eigenvalue to which the eigenvector corresponds.
             Defaults to 'max'.
+        workers : int, optional
+            Number of worker processes. Defaults to 1.
 
         """
 
@@ -924,12 +2006,14 @@ class Result:
                              }
                    }
 
-        self._add_generic_pointwise(eigenvector,{'T_sym':T_sym},{'eigenvalue':eigenvalue})
+        self._add_generic_pointwise(eigenvector,{'T_sym':T_sym},{'eigenvalue':eigenvalue},workers=workers)
 
 
     def add_IPF_color(self,
                       l: FloatSequence,
-                      q: str = 'O'):
+                      q: str = 'O',
+                      *,
+                      workers: int = 1):
         """
         Add RGB color tuple of inverse pole figure (IPF) color.
 
@@ -940,6 +2024,8 @@ class Result:
         q : str, optional
             Name of the dataset containing the crystallographic orientation as quaternions.
             Defaults to 'O'.
+        workers : int, optional
+            Number of worker processes. Defaults to 1.
 
         Examples
         --------
@@ -968,10 +2054,13 @@ class Result:
                              }
                    }
 
-        self._add_generic_pointwise(IPF_color,{'q':q},{'l':l})
+        self._add_generic_pointwise(IPF_color,{'q':q},{'l':l},workers=workers)
 
 
-    def add_maximum_shear(self, T_sym: str):
+    def add_maximum_shear(self,
+                          T_sym: str,
+                          *,
+                          workers: int = 1):
         """
         Add maximum shear components of symmetric tensor.
 
@@ -979,6 +2068,8 @@ class Result:
         ----------
         T_sym : str
             Name of symmetric tensor dataset.
+        workers : int, optional
+            Number of worker processes. Defaults to 1.
 
         """
         def maximum_shear(T_sym: DADF5Dataset) -> DADF5Dataset:
@@ -992,12 +2083,14 @@ class Result:
                               }
                      }
 
-        self._add_generic_pointwise(maximum_shear,{'T_sym':T_sym})
+        self._add_generic_pointwise(maximum_shear,{'T_sym':T_sym},workers=workers)
 
 
     def add_equivalent_Mises(self,
                              T_sym: str,
-                             kind: Optional[str] = None):
+                             kind: Optional[str] = None,
+                             *,
+                             workers: int = 1):
         """
         Add the equivalent Mises stress or strain of a symmetric tensor.
 
@@ -1008,6 +2101,8 @@ class Result:
         kind : {'stress', 'strain', None}, optional
             Kind of the von Mises equivalent. Defaults to None, in which case
             it is selected based on the unit of the dataset ('1' -> strain, 'Pa' -> stress).
+        workers : int, optional
+            Number of worker processes. Defaults to 1.
 
         Examples
         --------
@@ -1047,12 +2142,14 @@ class Result:
                               }
                     }
 
-        self._add_generic_pointwise(equivalent_Mises,{'T_sym':T_sym},{'kind':kind})
+        self._add_generic_pointwise(equivalent_Mises,{'T_sym':T_sym},{'kind':kind},workers=workers)
 
 
     def add_norm(self,
                  x: str,
-                 ord: Union[None, int, float, Literal['fro', 'nuc']] = None):
+                 ord: Union[None, int, float, Literal['fro', 'nuc']] = None,
+                 *,
+                 workers: int = 1):
         """
         Add the norm of a vector or tensor.
 
@@ -1062,6 +2159,8 @@ class Result:
             Name of vector or tensor dataset.
         ord : {non-zero int, inf, -inf, 'fro', 'nuc'}, optional
             Order of the norm. inf means NumPy's inf object. For details refer to numpy.linalg.norm.
+        workers : int, optional
+            Number of worker processes. Defaults to 1.
 
         """
         def norm(x: DADF5Dataset, ord: Union[int, float, Literal['fro', 'nuc']]) -> DADF5Dataset:
@@ -1087,12 +2186,14 @@ class Result:
                               }
                      }
 
-        self._add_generic_pointwise(norm,{'x':x},{'ord':ord})
+        self._add_generic_pointwise(norm,{'x':x},{'ord':ord},workers=workers)
 
 
     def add_stress_second_Piola_Kirchhoff(self,
                                           P: str = 'P',
-                                          F: str = 'F'):
+                                          F: str = 'F',
+                                          *,
+                                          workers: int = 1):
         r"""
         Add second Piola-Kirchhoff stress calculated from first Piola-Kirchhoff stress and deformation gradient.
 
@@ -1102,6 +2203,8 @@ class Result:
             Name of first Piola-Kirchhoff stress dataset. Defaults to 'P'.
         F : str, optional
             Name of deformation gradient dataset. Defaults to 'F'.
+        workers : int, optional
+            Number of worker processes. Defaults to 1.
 
         Notes
         -----
@@ -1125,7 +2228,7 @@ class Result:
                               }
                     }
 
-        self._add_generic_pointwise(stress_second_Piola_Kirchhoff,{'P':P,'F':F})
+        self._add_generic_pointwise(stress_second_Piola_Kirchhoff,{'P':P,'F':F},workers=workers)
 
 
 
@@ -1135,7 +2238,8 @@ class Result:
                  uvw: Optional[FloatSequence] = None,
                  hkl: Optional[FloatSequence] = None,
                  with_symmetry: bool = False,
-                 normalize: bool = True):
+                 normalize: bool = True,
+                 workers: int = 1):
         """
         Add lab frame vector along lattice direction [uvw] or plane normal (hkl).
 
@@ -1152,6 +2256,8 @@ class Result:
         normalize : bool, optional
             Normalize output vector.
             Defaults to True.
+        workers : int, optional
+            Number of worker processes. Defaults to 1.
 
         """
         def pole(q: DADF5Dataset,
@@ -1179,10 +2285,13 @@ class Result:
                               }
                     }
 
-        self._add_generic_pointwise(pole,{'q':q},{'uvw':uvw,'hkl':hkl,'with_symmetry':with_symmetry,'normalize':normalize})
+        self._add_generic_pointwise(pole,{'q':q},{'uvw':uvw,'hkl':hkl,'with_symmetry':with_symmetry,'normalize':normalize},workers=workers)
 
 
-    def add_rotation(self, F: str):
+    def add_rotation(self,
+                     F: str,
+                     *,
+                     workers: int = 1):
         """
         Add rotational part of a deformation gradient.
 
@@ -1190,6 +2299,8 @@ class Result:
         ----------
         F : str
             Name of deformation gradient dataset.
+        workers : int, optional
+            Number of worker processes. Defaults to 1.
 
         Examples
         --------
@@ -1212,10 +2323,13 @@ class Result:
                               }
                      }
 
-        self._add_generic_pointwise(rotation,{'F':F})
+        self._add_generic_pointwise(rotation,{'F':F},workers=workers)
 
 
-    def add_spherical(self, T: str):
+    def add_spherical(self,
+                      T: str,
+                      *,
+                      workers: int = 1):
         """
         Add the spherical (hydrostatic) part of a tensor.
 
@@ -1223,6 +2337,8 @@ class Result:
         ----------
         T : str
             Name of tensor dataset.
+        workers : int, optional
+            Number of worker processes. Defaults to 1.
 
         Examples
         --------
@@ -1245,13 +2361,15 @@ class Result:
                               }
                      }
 
-        self._add_generic_pointwise(spherical,{'T':T})
+        self._add_generic_pointwise(spherical,{'T':T},workers=workers)
 
 
     def add_strain(self,
                    F: str = 'F',
                    t: Literal['V', 'U'] = 'V',
-                   m: float = 0.0):
+                   m: float = 0.0,
+                   *,
+                   workers: int = 1):
         r"""
         Add strain tensor (Seth-Hill family) of a deformation gradient.
 
@@ -1267,6 +2385,8 @@ class Result:
             Defaults to 'V'.
         m : float, optional
             Order of the strain calculation. Defaults to 0.0.
+        workers : int, optional
+            Number of worker processes. Defaults to 1.
 
         Examples
         --------
@@ -1323,12 +2443,14 @@ class Result:
                               }
                      }
 
-        self._add_generic_pointwise(strain,{'F':F},{'t':t,'m':m})
+        self._add_generic_pointwise(strain,{'F':F},{'t':t,'m':m},workers=workers)
 
 
     def add_stretch_tensor(self,
                            F: str = 'F',
-                           t: Literal['V', 'U'] = 'V'):
+                           t: Literal['V', 'U'] = 'V',
+                           *,
+                           workers: int = 1):
         """
         Add stretch tensor of a deformation gradient.
 
@@ -1339,6 +2461,8 @@ class Result:
         t : {'V', 'U'}, optional
             Type of the polar decomposition, 'V' for left stretch tensor and 'U' for right stretch tensor.
             Defaults to 'V'.
+        workers : int, optional
+            Number of worker processes. Defaults to 1.
 
         """
         def stretch_tensor(F: DADF5Dataset, t: str) -> DADF5Dataset:
@@ -1353,10 +2477,13 @@ class Result:
                               }
                      }
 
-        self._add_generic_pointwise(stretch_tensor,{'F':F},{'t':t})
+        self._add_generic_pointwise(stretch_tensor,{'F':F},{'t':t},workers=workers)
 
 
-    def add_curl(self, f: str):
+    def add_curl(self,
+                    f: str,
+                    *,
+                    workers: int = 1):
         """
         Add curl of a field.
 
@@ -1364,6 +2491,8 @@ class Result:
         ----------
         f : str
             Name of vector or tensor field dataset.
+        workers : int, optional
+            Number of worker processes and FFT threads. Defaults to 1.
 
         Notes
         -----
@@ -1382,10 +2511,13 @@ class Result:
                               }
                      }
 
-        self._add_generic_grid(curl,{'f':f},{'size':self.size})
+        self._add_generic_grid(curl,{'f':f},{'size':self.size},workers=workers)
 
 
-    def add_divergence(self, f: str):
+    def add_divergence(self,
+                          f: str,
+                          *,
+                          workers: int = 1):
         """
         Add divergence of a field.
 
@@ -1393,6 +2525,8 @@ class Result:
         ----------
         f : str
             Name of vector or tensor field dataset.
+        workers : int, optional
+            Number of worker processes and FFT threads. Defaults to 1.
 
         Notes
         -----
@@ -1411,10 +2545,13 @@ class Result:
                               }
                      }
 
-        self._add_generic_grid(divergence,{'f':f},{'size':self.size})
+        self._add_generic_grid(divergence,{'f':f},{'size':self.size},workers=workers)
 
 
-    def add_gradient(self, f: str):
+    def add_gradient(self,
+                        f: str,
+                        *,
+                        workers: int = 1):
         """
         Add gradient of a field.
 
@@ -1422,6 +2559,8 @@ class Result:
         ----------
         f : str
             Name of scalar or vector field dataset.
+        workers : int, optional
+            Number of worker processes and FFT threads. Defaults to 1.
 
         Notes
         -----
@@ -1441,14 +2580,15 @@ class Result:
                               }
                      }
 
-        self._add_generic_grid(gradient,{'f':f},{'size':self.size})
+        self._add_generic_grid(gradient,{'f':f},{'size':self.size},workers=workers)
 
 
     def _add_generic_grid(self,
                           func: Callable[..., DADF5Dataset],
                           datasets: Dict[str, str],
                           args: Dict[str, str] = {},
-                          constituents = None):
+                          constituents = None,
+                          workers: int = 1):
         """
         General function to add data on a regular grid.
 
@@ -1462,44 +2602,87 @@ class Result:
             {arg (name to which the data is passed in func): label (in DADF5 file)}.
         args : dictionary, optional
             Arguments parsed to func.
+        workers : int, optional
+            Number of worker processes and FFT threads. Defaults to 1.
+
+        Notes
+        -----
+        Increments are distributed over min(workers,N_increments) processes,
+        each using the remaining share of the workers as FFT threads.
 
         """
+        if self._points is not None:
+            raise NotImplementedError('grid-based calculation of selected material points')
+        if self._batch is not None:
+            raise NotImplementedError('grid-based calculation within a batch')
+
         if self.N_constituents != 1 or len(datasets) != 1 or not self.structured:
             raise NotImplementedError('not a structured grid with one constituent and a single phase')
+        if workers < 1:
+            raise ValueError(f'invalid number of workers "{workers}"')
 
         at_cell_ph,in_data_ph,at_cell_ho,in_data_ho = self._mappings()
-
-        increments = self.place(list(datasets.values()),False)
-        if not increments: raise RuntimeError('received invalid dataset')
-        with h5py.File(self.fname, 'a') as f:
-            for increment in increments.items():
-                for ty in increment[1].items():
-                    for field in ty[1].items():
-                        d: np.ma.MaskedArray = list(field[1].values())[0]
-                        if np.any(d.mask): continue
-                        dataset = {'f':{'data':np.reshape(d.data,tuple(self.cells)+d.data.shape[1:]),
-                                        'label':list(datasets.values())[0],
-                                        'meta':d.data.dtype.metadata}}
-                        r = func(**dataset,**args)
-                        result = r['data'].reshape((-1,)+r['data'].shape[3:])
-                        for x in self._visible[ty[0]+'s']:
-                            if ty[0] == 'phase':
-                                result1 = result[at_cell_ph[0][x]]
-                            if ty[0] == 'homogenization':
-                                result1 = result[at_cell_ho[x]]
-
-                            path = '/'.join(['/',increment[0],ty[0],x,field[0]])
-                            h5_dataset = f[path].create_dataset(r['label'],data=result1)
-
-                            h5_dataset.attrs['created'] = util.time_stamp() if h5py3 else \
-                                                          util.time_stamp().encode()
-
-                            for l,v in r['meta'].items():
-                                h5_dataset.attrs[l.lower()]=v.encode() if not h5py3 and type(v) is str else v
-                            creator = h5_dataset.attrs['creator'] if h5py3 else \
-                                      h5_dataset.attrs['creator'].decode()
-                            h5_dataset.attrs['creator'] = f'damask.Result.{creator} v{damask.version}' if h5py3 else \
-                                                          f'damask.Result.{creator} v{damask.version}'.encode()
+        label = list(datasets.values())[0]
+        if len(self._visible['increments']) == 0: raise RuntimeError('received invalid dataset')
+        processes = min(workers,len(self._visible['increments']))
+        threads = max(workers//processes,1)
+
+        found = False
+
+        def read(f: h5py.File, inc: str) -> List[Tuple[str, str, Dict[str, Any]]]:
+            """Place data of an increment spatially, skip incomplete fields."""
+            nonlocal found
+            placed = []
+            for ty in ['phase','homogenization']:
+                for field in self._visible['fields']:
+                    outs: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+                    for x in self._visible[ty+'s']:
+                        path = '/'.join([inc,ty,x,field])
+                        if field not in self._keys(f,'/'.join([inc,ty,x])) or label not in self._keys(f,path):
+                            continue
+                        self._place(outs,f['/'.join([path,label])],
+                                    [(label,at_cell_ph[0][x],in_data_ph[0][x])] if ty == 'phase' else
+                                    [(label,at_cell_ho[x],in_data_ho[x])])
+                    found |= label in outs
+                    if label not in outs or not outs[label][1].all(): continue
+                    d = outs[label][0]
+                    placed.append((ty,field,{'data':np.reshape(d,tuple(self.cells)+d.shape[1:]),
+                                             'label':label,
+                                             'meta':dict(cast(Dict[str, Any],d.dtype.metadata))}))
+            return placed
+
+        def job(placed: List[Tuple[str, str, Dict[str, Any]]]) -> List[Tuple[str, str, DADF5Dataset]]:
+            with fft.set_workers(threads):
+                return [(ty,field,func(**{list(datasets)[0]:dataset},**args)) for ty,field,dataset in placed]
+
+        with self._pool.open('a') as f:
+            results = _map_ordered(job,(read(f,inc) for inc in self._visible['increments']),processes)
+            for inc,results_ in util.show_progress(zip(self._visible['increments'],results),
+                                                   len(self._visible['increments'])):
+                for ty,field,r in results_:
+                    result = r['data'].reshape((-1,)+r['data'].shape[3:])
+                    for x in self._visible[ty+'s']:
+                        if ty == 'phase':
+                            result1 = result[at_cell_ph[0][x]]
+                        if ty == 'homogenization':
+                            result1 = result[at_cell_ho[x]]
+
+                        path = '/'.join(['/',inc,ty,x,field])
+                        h5_dataset = f[path].create_dataset(r['label'],data=result1,
+                                                            **_create_options(self._compression,result1.shape))
+
+                        h5_dataset.attrs['created'] = util.time_stamp() if h5py3 else \
+                                                      util.time_stamp().encode()
+
+                        for l,v in r['meta'].items():
+                            h5_dataset.attrs[l.lower()]=v.encode() if not h5py3 and type(v) is str else v
+                        creator = h5_dataset.attrs['creator'] if h5py3 else \
+                                  h5_dataset.attrs['creator'].decode()
+                        h5_dataset.attrs['creator'] = f'damask.Result.{creator} v{damask.version}' if h5py3 else \
+                                                      f'damask.Result.{creator} v{damask.version}'.encode()
+            if not found: raise RuntimeError('received invalid dataset')
+
+        self._update_manifest(self._visible['increments'])
 
 
 
@@ -1507,10 +2690,13 @@ class Result:
     def _add_generic_pointwise(self,
                                func: Callable[..., DADF5Dataset],
                                datasets: Dict[str, str],
-                               args: Dict[str, Any] = {}):
+                               args: Dict[str, Any] = {},
+                               workers: int = 1):
         """
         General function to add pointwise data.
 
+        Within a batch, the calculation is only recorded.
+
         Parameters
         ----------
         callback : function
@@ -1521,92 +2707,210 @@ class Result:
             {arg (name to which the data is passed in func): label (in DADF5 file)}.
         args : dictionary, optional
             Arguments parsed to func.
+        workers : int, optional
+            Number of worker processes. Defaults to 1.
 
         """
+        if self._batch is not None:
+            self._batch.append((func,datasets,args,workers))
+        else:
+            self._add_fused([(func,datasets,args)],None,workers)
 
-        def job_pointwise(group: str,
-                          callback: Callable[..., DADF5Dataset],
-                          datasets: Dict[str, str],
-                          args: Dict[str, str]) -> Union[None, DADF5Dataset]:
-            try:
-                datasets_in = {}
-                with h5py.File(self.fname,'r') as f:
-                    for arg,label in datasets.items():
-                        loc  = f[group+'/'+label]
-                        datasets_in[arg]={'data' :loc[()],
-                                          'label':label,
-                                          'meta': {k:(v.decode() if not h5py3 and type(v) is bytes else v) \
-                                                   for k,v in loc.attrs.items()}}
-                return callback(**datasets_in,**args)
-            except Exception as err:
-                print(f'Error during calculation: {err}.')
-                return None
+
+    def _add_fused(self,
+                   stages: List[Tuple[Callable[..., DADF5Dataset], Dict[str, str], Dict[str, Any]]],
+                   store: Optional[List[str]] = None,
+                   workers: int = 1):
+        """
+        Add pointwise data of one or more consecutive calculations.
+
+        Datasets are read and written by the calling process,
+        calculations are distributed over the worker processes.
+        Per DADF5 group, each dataset is read once and the results
+        of a calculation are available in memory to the subsequent ones.
+        Results are written in the order of the groups.
+
+        Parameters
+        ----------
+        stages : list of tuple(function, dictionary, dictionary)
+            Callback function, details of the datasets to be used, and
+            additional arguments of each calculation (see `_add_generic_pointwise`).
+        store : list of str, optional
+            Labels of the results to store.
+            Defaults to None, in which case all results are stored.
+        workers : int, optional
+            Number of worker processes. Defaults to 1.
+
+        """
+
+        def read_pointwise(f: h5py.File,
+                           group: str,
+                           first: bool = False) -> Dict[str, Any]:
+            datasets_in = {}
+            for label in [l for l in inputs if l in self._keys(f,group)]:
+                loc  = f[group+'/'+label]
+                datasets_in[label]={'data' :loc[:1] if first else loc[()] if rows is None else _read(loc,rows[group]),
+                                    'label':label,
+                                    'meta': {k:(v.decode() if not h5py3 and type(v) is bytes else v) \
+                                             for k,v in loc.attrs.items()}}
+            return datasets_in
+
+        def job_pointwise(datasets_in: Dict[str, Any]) -> Tuple[Dict[int, str], List[DADF5Dataset]]:
+            labels,results = {},[]
+            for i,(callback,datasets,args) in enumerate(stages):
+                if not set(datasets.values()).issubset(datasets_in): continue
+                try:
+                    result = callback(**{arg:datasets_in[label] for arg,label in datasets.items()},**args)
+                except Exception as err:
+                    print(f'Error during calculation: {err}.')
+                    continue
+                labels[i] = result['label']
+                datasets_in[result['label']] = result
+                if store is None or result['label'] in store: results.append(result)
+            return labels,results
+
+        inputs = list(dict.fromkeys(label for _,datasets,_ in stages for label in datasets.values()))
 
         groups = []
-        with h5py.File(self.fname,'r') as f:
+        with self._pool.open('r') as f:
             for inc in self._visible['increments']:
                 for ty in ['phase','homogenization']:
                     for label in self._visible[ty+'s']:
-                        for field in _match(self._visible['fields'],f['/'.join([inc,ty,label])].keys()):
+                        for field in _match(self._visible['fields'],self._keys(f,'/'.join([inc,ty,label]))):
                             group = '/'.join([inc,ty,label,field])
-                            if set(datasets.values()).issubset(f[group].keys()): groups.append(group)
+                            keys = self._keys(f,group)
+                            if any(set(datasets.values()).issubset(keys) for _,datasets,_ in stages):
+                                groups.append(group)
 
         if len(groups) == 0:
             print('No matching dataset found, no data was added.')
             return
 
+        rows: Optional[Dict[str, np.ndarray]] = None
+        if self._points is not None:
+            _,in_data_ph,_,in_data_ho = self._mappings()
+            rows = {group: np.unique(np.concatenate([m[group.split('/')[2]] for m in in_data_ph])) \
+                           if group.split('/')[1] == 'phase' else np.unique(in_data_ho[group.split('/')[2]])
+                    for group in groups}
+
+        if self._protected:                                                                         # skip groups with all results
+            with self._pool.open('r') as f:
+                labels = job_pointwise(read_pointwise(f,groups[-1],first=True))[0].values()
+                stored = {l for l in labels if store is None or l in store}
+                groups = [g for g in groups if not stored.issubset(self._keys(f,g))]
+            if len(groups) == 0: return
+
+        with self._pool.open('a') as f:
+            results = _map_ordered(job_pointwise,(read_pointwise(f,group) for group in groups),workers)
+            for group,(_,results_) in util.show_progress(zip(groups,results),len(groups)):
+                for result in results_:
+                    if self._protected and '/'.join([group,result['label']]) in f: continue
+                    self._write_pointwise(f,group,result,None if rows is None else rows[group])
+
+        self._update_manifest(self._visible['increments'])
+
+
+    def _write_pointwise(self,
+                         f: h5py.File,
+                         group: str,
+                         result: DADF5Dataset,
+                         rows: Optional[np.ndarray] = None):
+        """
+        Write the result of a pointwise calculation.
 
-        for group in util.show_progress(groups):
-            if not (result := job_pointwise(group, callback=func, datasets=datasets, args=args)):   # type: ignore
-                continue
-            with h5py.File(self.fname, 'a') as f:
-                try:
-                    if not self._protected and '/'.join([group,result['label']]) in f:
-                        dataset = f['/'.join([group,result['label']])]
-                        dataset[...] = result['data']
-                        dataset.attrs['overwritten'] = True
-                    else:
-                        shape = result['data'].shape
-                        if compress := result['data'].size >= chunk_size*2:
-                            chunks = (chunk_size//np.prod(shape[1:]),)+shape[1:]
-                        else:
-                            chunks = shape
-                        dataset = f[group].create_dataset(result['label'],data=result['data'],
-                                                          maxshape=shape, chunks=chunks,
-                                                          compression = 'gzip' if compress else None,
-                                                          compression_opts = 6 if compress else None,
-                                                          shuffle=True,fletcher32=True)
-
-                    dataset.attrs['created'] = util.time_stamp() if h5py3 else \
-                                               util.time_stamp().encode()
-
-                    for l,v in result['meta'].items():
-                        dataset.attrs[l.lower()]=v.encode() if not h5py3 and type(v) is str else v
-                    creator = dataset.attrs['creator'] if h5py3 else \
-                              dataset.attrs['creator'].decode()
-                    dataset.attrs['creator'] = f'damask.Result.{creator} v{damask.version}' if h5py3 else \
-                                               f'damask.Result.{creator} v{damask.version}'.encode()
+        Parameters
+        ----------
+        f : h5py.File
+            DADF5 file opened for writing.
+        group : str
+            Name of the DADF5 group.
+        result : dictionary
+            Data, label, and metadata of the new dataset.
+        rows : numpy.ndarray of int, optional
+            Rows of the selected material points.
+            Defaults to None, in which case all rows are written.
 
-                except (OSError,RuntimeError) as err:
-                    print(f'Could not add dataset: {err}.')
+        """
+        try:
+            if not self._protected and '/'.join([group,result['label']]) in f:
+                dataset = f['/'.join([group,result['label']])]
+                _write(dataset,result['data'],rows)
+                dataset.attrs['overwritten'] = True
+            else:
+                shape = result['data'].shape if rows is None else \
+                        (f['/'.join([group,next(iter(f[group].keys()))])].shape[0],)+result['data'].shape[1:]
+                fill = None if rows is None else \
+                       (np.nan if np.issubdtype(result['data'].dtype,np.floating) else 0)
+                dataset = f[group].create_dataset(result['label'],shape=shape,dtype=result['data'].dtype,
+                                                  data=result['data'] if rows is None else None,
+                                                  fillvalue=fill,maxshape=shape,
+                                                  **_create_options(self._compression,shape))
+                if rows is not None: _write(dataset,result['data'],rows)
+
+            dataset.attrs['created'] = util.time_stamp() if h5py3 else \
+                                       util.time_stamp().encode()
+
+            for l,v in result['meta'].items():
+                dataset.attrs[l.lower()]=v.encode() if not h5py3 and type(v) is str else v
+            creator = dataset.attrs['creator'] if h5py3 else \
+                      dataset.attrs['creator'].decode()
+            dataset.attrs['creator'] = f'damask.Result.{creator} v{damask.version}' if h5py3 else \
+                                       f'damask.Result.{creator} v{damask.version}'.encode()
+
+        except (OSError,RuntimeError) as err:
+            print(f'Could not add dataset: {err}.')
+
+
+    def _mappings(self, restrict: bool = True):
+        """
+        Mappings to place data spatially.
 
+        Parameters
+        ----------
+        restrict : bool, optional
+            Restrict to the selected material points, in which case
+            cell indices refer to the position among the selected points.
+            Defaults to True.
 
-    def _mappings(self):
-        """Mappings to place data spatially."""
-        with h5py.File(self.fname,'r') as f:
+        """
+        def group(labels: List[str], ID: np.ndarray) -> Dict[str, np.ndarray]:
+            """Indices of each label using integer codes instead of string comparison."""
+            labels_ = np.array(sorted(labels))
+            codes = np.searchsorted(labels_,ID)
+            return {label: np.flatnonzero(codes == i) for i,label in enumerate(labels_)}
+
+        if 'mappings' not in self._cache:
+            with self._pool.open('r') as f:
+                entry_ph = f['/'.join(['cell_to','phase'])]['entry']
+                entry_ho = f['/'.join(['cell_to','homogenization'])]['entry']
+
+            at_cell_ph_all = [group(self._phases,self.phase[:,c]) for c in range(self.N_constituents)]
+            in_data_ph_all = [{label: entry_ph[at,c] for label,at in at_cell_ph_all[c].items()} \
+                              for c in range(self.N_constituents)]
+            at_cell_ho_all = group(self._homogenizations,self.homogenization)
+            in_data_ho_all = {label: entry_ho[at] for label,at in at_cell_ho_all.items()}
+
+            self._cache['mappings'] = (at_cell_ph_all,in_data_ph_all,at_cell_ho_all,in_data_ho_all)
+
+        at_cell_ph_all,in_data_ph_all,at_cell_ho_all,in_data_ho_all = self._cache['mappings']
+
+        at_cell_ph = [{label: m[label] for label in self._visible['phases']} for m in at_cell_ph_all]
+        in_data_ph = [{label: m[label] for label in self._visible['phases']} for m in in_data_ph_all]
+        at_cell_ho = {label: at_cell_ho_all[label] for label in self._visible['homogenizations']}
+        in_data_ho = {label: in_data_ho_all[label] for label in self._visible['homogenizations']}
+
+        if restrict and (points := self._points) is not None:
+            def select(at_cell: np.ndarray, in_data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+                pos = np.minimum(np.searchsorted(at_cell,points),max(len(at_cell)-1,0))
+                match = np.flatnonzero(at_cell[pos] == points) if len(at_cell) > 0 else \
+                        np.empty(0,np.int64)
+                return match,in_data[pos[match]]
 
-            at_cell_ph = []
-            in_data_ph = []
             for c in range(self.N_constituents):
-                at_cell_ph.append({label: np.where(self.phase[:,c] == label)[0] \
-                                          for label in self._visible['phases']})
-                in_data_ph.append({label: f['/'.join(['cell_to','phase'])]['entry'][at_cell_ph[c][label]][:,c] \
-                                          for label in self._visible['phases']})
-
-            at_cell_ho = {label: np.where(self.homogenization[:] == label)[0] \
-                                 for label in self._visible['homogenizations']}
-            in_data_ho = {label: f['/'.join(['cell_to','homogenization'])]['entry'][at_cell_ho[label]] \
-                                 for label in self._visible['homogenizations']}
+                for label in self._visible['phases']:
+                    at_cell_ph[c][label],in_data_ph[c][label] = select(at_cell_ph[c][label],in_data_ph[c][label])
+            for label in self._visible['homogenizations']:
+                at_cell_ho[label],in_data_ho[label] = select(at_cell_ho[label],in_data_ho[label])
 
         return at_cell_ph,in_data_ph,at_cell_ho,in_data_ho
 
@@ -1614,7 +2918,9 @@ class Result:
     def get(self,
             output: Union[str, List[str]] = '*',
             flatten: bool = True,
-            prune: bool = True) -> Union[None,Dict[str,Any]]:
+            prune: bool = True,
+            lazy: bool = False,
+            labelled: bool = False) -> Union[None, Dict[str,Any], Datasets]:
         """
         Collect data per phase/homogenization reflecting the group/folder structure in the DADF5 file.
 
@@ -1629,31 +2935,74 @@ class Result:
             phase/homogenization, or field. Defaults to True.
         prune : bool, optional
             Remove branches with no data. Defaults to True.
+        lazy : bool, optional
+            Return proxies that read the data only when accessed.
+            Indexing a proxy reads the selected part only.
+            Defaults to False.
+        labelled : bool, optional
+            Return a labelled collection with the dimensions
+            'increment', 'type', 'label', 'field', and 'output'
+            instead of nested dictionaries. `flatten` and `prune`
+            are ignored. Defaults to False.
 
         Returns
         -------
-        data : dict of numpy.ndarray
+        data : dict of numpy.ndarray or damask._result.Datasets
             Datasets structured by phase/homogenization and according to selected view.
 
+        Examples
+        --------
+        Read the deformation gradient of the first ten material points
+        of phase 'Aluminum' in the last increment:
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5').view(increments=-1,phases='Aluminum')
+        >>> F = r.get('F',lazy=True)[:10]
+
+        Select the plastic deformation gradient of all phases in the first increment:
+
+        >>> d = damask.Result('my_file.hdf5').get('F_p',labelled=True)
+        >>> F_p = d.sel(increment=d.coords['increment'][0],type='phase')
+
         """
         r: Dict[str,Any] = {}
-
-        with h5py.File(self.fname,'r') as f:
+        data: Dict[Tuple[Optional[str], ...], Any] = {}
+        read = functools.partial(_LazyDataset,self._pool) if lazy else _read
+
+        rows: Dict[str,Dict[str,np.ndarray]] = {}
+        if self._points is not None:
+            if lazy: raise NotImplementedError('lazy reading of selected material points')
+            _,in_data_ph,_,in_data_ho = self._mappings()
+            rows = {'phase':{label: np.unique(np.concatenate([m[label] for m in in_data_ph]))
+                             for label in self._visible['phases']},
+                    'homogenization':{label: np.unique(in_data_ho[label])
+                                      for label in self._visible['homogenizations']}}
+
+        with self._pool.open('r') as f:
+            skeleton = not (prune or labelled)
             for inc in util.show_progress(self._visible['increments']):
-                r[inc] = {'phase':{},'homogenization':{},'geometry':{}}
-
-                for out in _match(output,f['/'.join([inc,'geometry'])].keys()):
-                    r[inc]['geometry'][out] = _read(f['/'.join([inc,'geometry',out])])
+                if skeleton: r[inc] = {'phase':{},'homogenization':{},'geometry':{}}
 
                 for ty in ['phase','homogenization']:
                     for label in self._visible[ty+'s']:
-                        r[inc][ty][label] = {}
-                        for field in _match(self._visible['fields'],f['/'.join([inc,ty,label])].keys()):
-                            r[inc][ty][label][field] = {}
-                            for out in _match(output,f['/'.join([inc,ty,label,field])].keys()):
-                                r[inc][ty][label][field][out] = _read(f['/'.join([inc,ty,label,field,out])])
-
-        if prune:   r = util.dict_prune(r)
+                        if skeleton: r[inc][ty][label] = {}
+                        for field in _match(self._visible['fields'],self._keys(f,'/'.join([inc,ty,label]))):
+                            if skeleton: r[inc][ty][label][field] = {}
+                            for out in _match(output,self._keys(f,'/'.join([inc,ty,label,field]))):
+                                data[(inc,ty,label,field,out)] = read(f['/'.join([inc,ty,label,field,out])]) \
+                                                                 if self._points is None else \
+                                                                 _read(f['/'.join([inc,ty,label,field,out])],
+                                                                       rows[ty][label])
+
+                for out in _match(output,self._keys(f,'/'.join([inc,'geometry']))):
+                    data[(inc,'geometry',None,None,out)] = read(f['/'.join([inc,'geometry',out])]) \
+                                                           if self._points is None else \
+                                                           _read(f['/'.join([inc,'geometry',out])],
+                                                                 self._geometry_rows(out))
+
+        if labelled: return Datasets(['increment','type','label','field','output'],data) if data else None
+
+        r = _nest(data,r)
         if flatten: r = util.dict_flatten(r)
 
         return None if (type(r) == dict and r == {}) else r
@@ -1665,7 +3014,9 @@ class Result:
               prune: bool = True,
               constituents: Optional[IntSequence] = None,
               fill_float: float = np.nan,
-              fill_int: int = 0) -> Optional[Dict[str,Any]]:
+              fill_int: int = 0,
+              labelled: bool = False,
+              masked: bool = True) -> Union[None, Dict[str,Any], Datasets]:
         """
         Merge data into spatial order that is compatible with the damask.VTK geometry representation.
 
@@ -1695,62 +3046,353 @@ class Result:
         fill_int : int, optional
             Fill value for non-existent entries of integer type.
             Defaults to 0.
+        labelled : bool, optional
+            Return a labelled collection with the dimensions
+            'increment', 'type', 'field', and 'output'
+            instead of nested dictionaries. `flatten` and `prune`
+            are ignored. Defaults to False.
+        masked : bool, optional
+            Return masked arrays. Defaults to True.
+            If False, each dataset is a tuple of the data, in which
+            non-existent entries are set to the fill value, and the
+            validity of each material point.
 
         Returns
         -------
-        data : dict of numpy.ma.MaskedArray
+        data : dict of numpy.ma.MaskedArray or damask._result.Datasets
             Datasets structured by spatial position and according to selected view.
+            Tuples of data and validity if `masked` is False.
 
         """
         r: Dict[str,Any] = {}
+        data: Dict[Tuple[Optional[str], ...], Any] = {}
 
-        constituents_ = map(int,constituents) if isinstance(constituents,Iterable) else \
-                      (range(self.N_constituents) if constituents is None else [constituents])      # type: ignore
+        constituents_ = list(map(int,constituents)) if isinstance(constituents,Iterable) else \
+                        (range(self.N_constituents) if constituents is None else [constituents])    # type: ignore
 
         suffixes = [''] if self.N_constituents == 1 or isinstance(constituents,int) else \
                    [f'#{c}' for c in constituents_]
 
         at_cell_ph,in_data_ph,at_cell_ho,in_data_ho = self._mappings()
 
-        with h5py.File(self.fname,'r') as f:
+        with self._pool.open('r') as f:
 
+            skeleton = not (prune or labelled)
             for inc in util.show_progress(self._visible['increments']):
-                r[inc] = {'phase':{},'homogenization':{},'geometry':{}}
-
-                for out in _match(output,f['/'.join([inc,'geometry'])].keys()):
-                    r[inc]['geometry'][out] = ma.array(_read(f['/'.join([inc,'geometry',out])]),fill_value = fill_float)
+                if skeleton: r[inc] = {'phase':{},'homogenization':{},'geometry':{}}
 
                 for ty in ['phase','homogenization']:
+                    placed: Dict[str,Dict[str,Any]] = {}
                     for label in self._visible[ty+'s']:
-                        for field in _match(self._visible['fields'],f['/'.join([inc,ty,label])].keys()):
-                            if field not in r[inc][ty].keys():
-                                r[inc][ty][field] = {}
-
-                            for out in _match(output,f['/'.join([inc,ty,label,field])].keys()):
-                                data = ma.array(_read(f['/'.join([inc,ty,label,field,out])]))
+                        for field in _match(self._visible['fields'],self._keys(f,'/'.join([inc,ty,label]))):
+                            placed.setdefault(field,{})
+                            if skeleton: r[inc][ty].setdefault(field,{})
 
-                                if ty == 'phase':
-                                    if out+suffixes[0] not in r[inc][ty][field].keys():
-                                        for c,suffix in zip(constituents_,suffixes):
-                                            r[inc][ty][field][out+suffix] = \
-                                                _empty_like(data,self.N_materialpoints,fill_float,fill_int)
+                            for out in _match(output,self._keys(f,'/'.join([inc,ty,label,field]))):
+                                targets = [(out+suffix,at_cell_ph[c][label],in_data_ph[c][label])
+                                           for c,suffix in zip(constituents_,suffixes)] if ty == 'phase' else \
+                                          [(out,at_cell_ho[label],in_data_ho[label])]
+                                self._place(placed[field],f['/'.join([inc,ty,label,field,out])],targets)
 
-                                    for c,suffix in zip(constituents_,suffixes):
-                                        r[inc][ty][field][out+suffix][at_cell_ph[c][label]] = data[in_data_ph[c][label]]
+                    for field in placed:
+                        for key,p in placed[field].items():
+                            data[(inc,ty,field,key)] = _masked(p,fill_float,fill_int) if masked else \
+                                                       (_filled(p,fill_float,fill_int),p[1])
 
-                                if ty == 'homogenization':
-                                    if out not in r[inc][ty][field].keys():
-                                        r[inc][ty][field][out] = \
-                                            _empty_like(data,self.N_materialpoints,fill_float,fill_int)
+                for out in _match(output,self._keys(f,'/'.join([inc,'geometry']))):
+                    d = _read(f['/'.join([inc,'geometry',out])],self._geometry_rows(out))
+                    data[(inc,'geometry',None,out)] = ma.array(d,fill_value = fill_float) if masked else \
+                                                      (d,np.ones(len(d),bool))
 
-                                    r[inc][ty][field][out][at_cell_ho[label]] = data[in_data_ho[label]]
+        if labelled: return Datasets(['increment','type','field','output'],data) if data else None
 
-        if prune:   r = util.dict_prune(r)
+        r = _nest(data,r)
         if flatten: r = util.dict_flatten(r)
 
         return None if (type(r) == dict and r == {}) else r
 
 
+    def iterate(self,
+                output: Union[str, List[str]] = '*',
+                placed: bool = False,
+                **kwargs) -> Generator[Tuple[str, Any], None, None]:
+        """
+        Collect data increment by increment.
+
+        Only the data of one increment is in memory at a time,
+        irrespective of the number of visible increments.
+
+        Parameters
+        ----------
+        output : (list of) str, optional
+            Names of the datasets to read.
+            Defaults to '*', in which case all visible datasets are read.
+        placed : bool, optional
+            Merge data into spatial order as done by `place`.
+            Defaults to False, i.e. data is collected as done by `get`.
+        **kwargs
+            Keyword arguments passed on to `get` or `place`.
+
+        Yields
+        ------
+        increment : str
+            Name of the increment.
+        data : dict of numpy.ndarray or numpy.ma.MaskedArray
+            Datasets of the increment as returned by `get` or `place`.
+
+        Examples
+        --------
+        Calculate the average Mises equivalent stress of each increment:
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5')
+        >>> sigma_vM_avg = {inc: data.mean() for inc,data in r.iterate('sigma_vM',placed=True)}
+
+        """
+        for inc in self._visible['increments']:
+            view = self.view(increments=inc)
+            yield inc, view.place(output,**kwargs) if placed else view.get(output,**kwargs)
+
+
+    def reduce(self,
+               output: str,
+               op: Union[str, Sequence[str]] = 'mean',
+               by: Literal['phase', 'homogenization', 'material'] = 'phase',
+               bins: Union[int, FloatSequence] = 10,
+               *,
+               workers: int = 1) -> Table:
+        """
+        Reduce a dataset to statistics per increment and phase/homogenization.
+
+        The data is read in chunks, i.e. the memory consumption does
+        not depend on the size of the dataset.
+
+        Parameters
+        ----------
+        output : str
+            Name of the dataset to reduce.
+        op : (list of) str, optional
+            Statistics to compute. Select from 'mean', 'std', 'min', 'max',
+            'sum', 'count', and 'histogram'. Defaults to 'mean'.
+        by : {'phase', 'homogenization', 'material'}, optional
+            Group the data per phase, per homogenization, or reduce the data
+            of the visible material as a whole. Defaults to 'phase'.
+        bins : int or sequence of float, optional
+            Edges or number of equal-width bins of the histograms.
+            Equal-width bins span the range of the data of all
+            visible increments. Defaults to 10.
+        workers : int, optional
+            Number of processes that reduce increments in parallel.
+            Defaults to 1.
+
+        Returns
+        -------
+        statistics : damask.Table
+            Statistics per increment and group. Components of vector or
+            tensor data are reduced independently.
+
+        Notes
+        -----
+        Phase data of all constituents is considered, homogenization data
+        is used only if no visible phase contains the dataset. When grouping
+        by homogenization, phase data is assigned to the homogenization of
+        its material point. Statistics are not weighted, i.e. they equal
+        volume averages for material points of equal volume and a single
+        constituent. The standard deviation is not corrected for bias.
+
+        Examples
+        --------
+        Evolution of average and spread of the Mises equivalent stress of each phase:
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5')
+        >>> t = r.reduce('sigma_vM',op=['mean','std'])
+        >>> t.get('mean(sigma_vM)')
+
+        """
+        ops = [op] if isinstance(op,str) else list(op)
+        if invalid := set(ops).difference(['mean','std','min','max','sum','count','histogram']):
+            raise ValueError(f'invalid operation "{invalid.pop()}"')
+        if by not in ['phase','homogenization','material']:
+            raise ValueError(f'invalid grouping "{by}"')
+
+        groups = self._visible[by+'s'] if by != 'material' else ['material']
+        at_cell_ph,in_data_ph,at_cell_ho,in_data_ho = self._mappings(restrict=False)
+        selected = np.ones(self.N_materialpoints,bool)
+        if self._points is not None:
+            selected[:] = False
+            selected[self._points] = True
+        at_group = np.full(self.N_materialpoints,-1)
+        if by == 'homogenization':
+            for i,label in enumerate(groups):
+                at_group[at_cell_ho[label]] = i
+
+        codes: Dict[str, Dict[str, np.ndarray]] = {'phase':{},'homogenization':{}}
+        for label in self._visible['phases']:
+            codes['phase'][label] = np.full(sum(len(m[label]) for m in in_data_ph),-1)
+            for at_cell,in_data in zip([m[label] for m in at_cell_ph],[m[label] for m in in_data_ph]):
+                at_cell,in_data = at_cell[selected[at_cell]],in_data[selected[at_cell]]
+                codes['phase'][label][in_data] = groups.index(label) if by == 'phase' else \
+                                                 at_group[at_cell] if by == 'homogenization' else 0
+        if by != 'phase':
+            for label in self._visible['homogenizations']:
+                codes['homogenization'][label] = np.full(len(in_data_ho[label]),-1)
+                at_cell,in_data = at_cell_ho[label][selected[at_cell_ho[label]]],\
+                                  in_data_ho[label][selected[at_cell_ho[label]]]
+                codes['homogenization'][label][in_data] = groups.index(label) if by == 'homogenization' else 0
+
+        def reduce_increment(inc: str,
+                             edges: Optional[np.ndarray]) -> Tuple[List[Optional[Dict[str, Any]]], Dict[str, Any]]:
+            stats: List[Optional[Dict[str, Any]]] = [None]*len(groups)
+            meta: Dict[str, Any] = {}
+            with self._pool.open('r') as f:
+                paths = {ty:['/'.join([inc,ty,label,field,output])
+                             for label in codes[ty]
+                             for field in _match(self._visible['fields'],self._keys(f,'/'.join([inc,ty,label])))
+                             if output in self._keys(f,'/'.join([inc,ty,label,field]))]
+                         for ty in ['phase','homogenization']}
+                for path in paths['phase'] if paths['phase'] else paths['homogenization']:
+                    dataset = f[path]
+                    code = codes[path.split('/')[1]][path.split('/')[2]]
+                    meta = {'shape':dataset.shape[1:],**cast(Dict[str, Any],_dtype(dataset).metadata)}
+                    N_rows = max(chunk_size//int(np.prod(dataset.shape[1:])),1)
+                    if dataset.chunks is not None:
+                        N_rows = max(N_rows//dataset.chunks[0],1)*dataset.chunks[0]                 # align with storage
+                    for start in range(0,dataset.shape[0],N_rows):
+                        code_ = code[start:start+N_rows]
+                        if np.all(code_ < 0): continue
+                        data = dataset[start:start+N_rows]
+                        for g in np.unique(code_[code_ >= 0]):
+                            stats[g] = _merge_statistics(stats[g],_statistics(data[code_ == g],edges))
+            return stats,meta
+
+        edges = None
+        if 'histogram' in ops:
+            if isinstance(bins,(int,np.integer)):
+                extrema = [s for stats,_ in _map_ordered(functools.partial(reduce_increment,edges=None),
+                                                         self._visible['increments'],workers)
+                           for s in stats if s is not None]
+                lo = min([np.min(s['min']) for s in extrema],default=0.)
+                hi = max([np.max(s['max']) for s in extrema],default=1.)
+                edges = np.linspace(lo,hi if hi > lo else lo+1.,bins+1)
+            else:
+                edges = np.asarray(bins,float)
+
+        rows = []
+        meta: Dict[str, Any] = {'shape':(1,)}
+        for inc,(stats,meta_) in zip(self._visible['increments'],
+                                     util.show_progress(_map_ordered(functools.partial(reduce_increment,edges=edges),
+                                                                     self._visible['increments'],workers),
+                                                        len(self._visible['increments']))):
+            if meta_: meta = meta_
+            for group,s in zip(groups,stats):
+                if s is None: continue
+                values = {'mean':s['mean'],'std':np.sqrt(s['M2']/s['n']),'min':s['min'],'max':s['max'],
+                          'sum':s['mean']*s['n'],'count':s['n'],'histogram':s['histogram']}
+                rows.append([int(inc.split(prefix_inc)[-1])]+([] if by == 'material' else [group])
+                            +[v for o in ops for v in np.ravel(values[o]).tolist()])
+
+        shape = tuple(meta['shape']) if meta['shape'] else (1,)
+        shapes: Dict[str, Tuple[int, ...]] = {'increment':(1,),**({} if by == 'material' else {by:(1,)}),
+                                              **{f'{o}({output})':(1,) if o == 'count' else
+                                                                  shape+(len(edges)-1,) if o == 'histogram' and edges is not None else
+                                                                  shape for o in ops}}
+        comments = [util.execution_stamp('Result','reduce')]
+        if 'unit' in meta:
+            comments.append(f'{output} / {meta["unit"]}: {meta.get("description","")}')
+        if edges is not None:
+            comments.append(f'histogram({output}) bin edges: {" ".join(map(str,edges))}')
+
+        return Table(shapes,pd.DataFrame(rows) if rows else np.empty((0,sum(int(np.prod(s)) for s in shapes.values()))),
+                     comments)
+
+
+    def time_series(self,
+                    output: str,
+                    points: Union[int, IntSequence],
+                    constituent: int = 0,
+                    fill_float: float = np.nan,
+                    fill_int: int = 0) -> Optional[np.ma.MaskedArray]:
+        """
+        Collect the history of a dataset at selected material points.
+
+        Only the rows of the selected material points are read
+        from the datasets of each visible increment.
+
+        Parameters
+        ----------
+        output : str
+            Name of the dataset to read.
+        points : (list of) int
+            Indices of the material points.
+            Independent of the material points selected in the view.
+        constituent : int, optional
+            Constituent to consider for phase data. Defaults to 0.
+        fill_float : float, optional
+            Fill value for non-existent entries of floating point type.
+            Defaults to NaN.
+        fill_int : int, optional
+            Fill value for non-existent entries of integer type.
+            Defaults to 0.
+
+        Returns
+        -------
+        data : numpy.ma.MaskedArray of shape (N_increments,N_points,...)
+            Data of all visible increments at the selected material points.
+            Entries of material points without the dataset are masked.
+
+        Notes
+        -----
+        The dataset needs to be unique among the visible fields and
+        either phases or homogenizations.
+        Material points of a grid are numbered in Fortran order.
+
+        Examples
+        --------
+        Get the history of the Cauchy stress at the first and last material point:
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5')
+        >>> sigma = r.time_series('sigma',[0,-1])
+
+        """
+        points_ = np.array(points,dtype=np.int64).reshape(-1)
+        points_ = np.where(points_<0,points_+self.N_materialpoints,points_)
+        if np.any(points_<0) or np.any(points_>=self.N_materialpoints):
+            raise IndexError(f'material point index out of range (N_materialpoints = {self.N_materialpoints})')
+
+        at_cell_ph,in_data_ph,at_cell_ho,in_data_ho = self._mappings(restrict=False)
+
+        selection = {}
+        for ty,at_cell,in_data in [('phase',at_cell_ph[constituent],in_data_ph[constituent]),
+                                   ('homogenization',at_cell_ho,in_data_ho)]:
+            for label in self._visible[ty+'s']:
+                pos = np.minimum(np.searchsorted(at_cell[label],points_),len(at_cell[label])-1)
+                if len(at_cell[label]) == 0 or \
+                   len(idx := np.flatnonzero(at_cell[label][pos] == points_)) == 0: continue
+                entries,inverse = np.unique(in_data[label][pos[idx]],return_inverse=True)
+                selection[(ty,label)] = (idx,entries,inverse.reshape(-1))
+
+        r: Optional[np.ma.MaskedArray] = None
+        found = set()
+        with self._pool.open('r') as f:
+            for i,inc in enumerate(self._visible['increments']):
+                for (ty,label),(idx,entries,inverse) in selection.items():
+                    for field in _match(self._visible['fields'],self._keys(f,'/'.join([inc,ty,label]))):
+                        if output not in self._keys(f,'/'.join([inc,ty,label,field])): continue
+                        found.add((ty,field))
+                        if len(found) > 1: raise ValueError(f'dataset "{output}" is not unique')
+                        dataset = f['/'.join([inc,ty,label,field,output])]
+                        if r is None:
+                            dtype = _dtype(dataset)
+                            r = ma.array(np.empty((len(self._visible['increments']),len(points_))+dataset.shape[1:],dtype),
+                                         fill_value = fill_float if np.issubdtype(dtype,np.floating) else fill_int,
+                                         mask = True)
+                        r[i,idx] = dataset[entries][inverse]
+
+        return r
+
+
     def export_XDMF(self,
                     output: Union[str, List[str]] = '*',
                     target_dir: Union[None, str, Path] = None,
@@ -1758,9 +3400,11 @@ class Result:
         """
         Write XDMF file to directly visualize data from DADF5 file.
 
-        The XDMF format is only supported for structured grids
-        with single phase and single constituent.
-        For other cases use `export_VTK`.
+        The XDMF format is only supported for structured grids.
+        Data of multiple phases/homogenizations or constituents
+        is presented in spatial order by virtual datasets that are
+        stored in an auxiliary HDF5 file next to the XDMF file.
+        The data itself is not copied.
 
         Parameters
         ----------
@@ -1776,12 +3420,14 @@ class Result:
 
         Notes
         -----
-        This function is implemented only for structured grids with
-        one constituent and a single phase.
+        Reading virtual datasets requires HDF5 1.10 or newer.
 
         """
-        if self.N_constituents != 1 or len(self.phases) != 1 or not self.structured:
-            raise NotImplementedError('not a structured grid with one constituent and a single phase')
+        if self._points is not None:
+            raise NotImplementedError('XDMF export of selected material points')
+
+        if not self.structured:
+            raise NotImplementedError('not a structured grid')
 
         attribute_type_map = defaultdict(lambda:'Matrix', ( ((),'Scalar'), ((3,),'Vector'), ((3,3),'Tensor')) )
 
@@ -1791,6 +3437,29 @@ class Result:
             if np.issubdtype(dtype,np.floating):        return 'Float'
             raise TypeError(f'invalid type "{dtype}"')
 
+        def pieces(at_cell: np.ndarray, in_data: np.ndarray) -> List[Tuple[np.ndarray, np.ndarray]]:
+            """
+            Contiguous ranges of cells and corresponding data entries.
+
+            The ranges are grouped into pieces along which the data
+            entries increase, each piece is mapped as one selection.
+            """
+            if len(at_cell) == 0: return []
+            breaks = np.flatnonzero((np.diff(at_cell) != 1) | (np.diff(in_data) != 1))+1
+            start,stop = np.r_[0,breaks],np.r_[breaks,len(at_cell)]
+            cells = np.stack([at_cell[start],at_cell[stop-1]+1],axis=-1)
+            entries = np.stack([in_data[start],in_data[stop-1]+1],axis=-1)
+            split = np.flatnonzero(entries[1:,0] < entries[:-1,1])+1
+            return list(zip(np.split(cells,split),np.split(entries,split)))
+
+        def selection(shape: Tuple[int, ...], ranges: np.ndarray) -> h5py._hl.selections.Selection:
+            """Union of ranges along the first axis."""
+            space = h5py.h5s.create_simple(shape)
+            space.select_none()
+            for start,stop in ranges:
+                space.select_hyperslab((start,)+(0,)*(len(shape)-1),(stop-start,)+shape[1:],op=h5py.h5s.SELECT_OR)
+            return h5py._hl.selections.Selection(shape,spaceid=space)
+
 
         xdmf = ET.Element('Xdmf')
         xdmf.attrib = {'Version':  '2.0',
@@ -1819,8 +3488,27 @@ class Result:
         hdf5_dir  = self.fname.parent
         out_dir   = Path.cwd() if target_dir is None else Path(target_dir)
         hdf5_link = (hdf5_dir if absolute_path else Path(os.path.relpath(hdf5_dir,out_dir.resolve())))/hdf5_name
+        virtual_name = f'{self.fname.stem}_virtual.hdf5'
+        virtual_link = out_dir.resolve()/virtual_name if absolute_path else Path(virtual_name)
+
+        at_cell_ph,in_data_ph,at_cell_ho,in_data_ho = self._mappings()
+        mappings = {'phase':          [(f'#{c}' if self.N_constituents > 1 else '',at_cell_ph[c],in_data_ph[c])
+                                       for c in range(self.N_constituents)],
+                    'homogenization': [('',at_cell_ho,in_data_ho)]}
+        identity = np.arange(self.N_materialpoints)
+        direct = {ty: len(m) == 1 and len(m[0][1]) <= 1 and \
+                      all(np.array_equal(a,identity) for a in m[0][1].values()) and \
+                      all(np.array_equal(i,identity) for i in m[0][2].values())
+                  for ty,m in mappings.items()}
+        layout_pieces = {(ty,suffix,label):pieces(at_cell[label],in_data[label])
+                         for ty,m in mappings.items() if not direct[ty]
+                         for suffix,at_cell,in_data in m for label in at_cell}
+        selections: Dict[Tuple, List[Tuple[h5py._hl.selections.Selection, h5py._hl.selections.Selection]]] = {}
+
+        out_dir.mkdir(parents=True,exist_ok=True)
 
-        with h5py.File(self.fname,'r') as f:
+        with self._pool.open('r') as f, contextlib.ExitStack() as stack:
+            v: Optional[h5py.File] = None                                                           # created on first use
             for inc in self._visible['increments']:
 
                 grid = ET.SubElement(collection,'Grid')
@@ -1856,29 +3544,56 @@ class Result:
                                          'Dimensions': '{} {} {} 3'.format(*(self.cells[::-1]+1))}
                 data_items[-1].text = f'{hdf5_link}:/{inc}/geometry/u_n'
                 for ty in ['phase','homogenization']:
+                    labels = defaultdict(list)
                     for label in self._visible[ty+'s']:
-                        for field in _match(self._visible['fields'],f['/'.join([inc,ty,label])].keys()):
-                            for out in _match(output,f['/'.join([inc,ty,label,field])].keys()):
-                                name = '/'.join([inc,ty,label,field,out])
-                                shape = f[name].shape[1:]
-                                dtype = f[name].dtype
-
-                                unit = f[name].attrs['unit'] if h5py3 else \
-                                       f[name].attrs['unit'].decode()
-
-                                attributes.append(ET.SubElement(grid, 'Attribute'))
-                                attributes[-1].attrib = {'Name':          '/'.join([ty,field,out])+f' / {unit}',
-                                                         'Center':       'Cell',
-                                                         'AttributeType': attribute_type_map[shape]}
-                                data_items.append(ET.SubElement(attributes[-1], 'DataItem'))
-                                data_items[-1].attrib = {'Format':     'HDF',
-                                                         'NumberType': number_type_map(dtype),
-                                                         'Precision':  f'{dtype.itemsize}',
-                                                         'Dimensions': '{} {} {} {}'.format(*self.cells[::-1],1 if shape == () else
-                                                                                                        np.prod(shape))}
-                                data_items[-1].text = f'{hdf5_link}:{name}'
+                        for field in _match(self._visible['fields'],self._keys(f,'/'.join([inc,ty,label]))):
+                            for out in _match(output,self._keys(f,'/'.join([inc,ty,label,field]))):
+                                labels[(field,out)].append(label)
+
+                    for (field,out),labels_ in labels.items():
+                        name = '/'.join([inc,ty,labels_[0],field,out])
+                        shape = f[name].shape[1:]
+                        dtype = f[name].dtype
+
+                        unit = f[name].attrs['unit'] if h5py3 else \
+                               f[name].attrs['unit'].decode()
+
+                        if direct[ty]:
+                            sources = [(out,f'{hdf5_link}:{name}')]
+                        else:
+                            if v is None:
+                                v = stack.enter_context(h5py.File(out_dir/virtual_name,'w'))
+                            sources = []
+                            for suffix,_,_ in mappings[ty]:
+                                layout = h5py.VirtualLayout((self.N_materialpoints,)+shape,dtype)
+                                for label in labels_:
+                                    name = '/'.join([inc,ty,label,field,out])
+                                    key = (ty,suffix,label,f[name].shape)
+                                    if key not in selections:                                       # reused across increments and outputs
+                                        selections[key] = [(selection((self.N_materialpoints,)+shape,cells),
+                                                            selection(f[name].shape,entries))
+                                                           for cells,entries in layout_pieces[(ty,suffix,label)]]
+                                    source = h5py.VirtualSource(str(hdf5_link),name,shape=f[name].shape)
+                                    for cells,entries in selections[key]:
+                                        layout[cells] = source[entries]
+                                name = '/'.join([inc,ty,field,out+suffix])
+                                v.create_virtual_dataset(name,layout,
+                                                         fillvalue=np.nan if np.issubdtype(dtype,np.floating) else 0)
+                                sources.append((out+suffix,f'{virtual_link}:/{name}'))
+
+                        for out_,source in sources:
+                            attributes.append(ET.SubElement(grid, 'Attribute'))
+                            attributes[-1].attrib = {'Name':          '/'.join([ty,field,out_])+f' / {unit}',
+                                                     'Center':       'Cell',
+                                                     'AttributeType': attribute_type_map[shape]}
+                            data_items.append(ET.SubElement(attributes[-1], 'DataItem'))
+                            data_items[-1].attrib = {'Format':     'HDF',
+                                                     'NumberType': number_type_map(dtype),
+                                                     'Precision':  f'{dtype.itemsize}',
+                                                     'Dimensions': '{} {} {} {}'.format(*self.cells[::-1],1 if shape == () else
+                                                                                                    np.prod(shape))}
+                            data_items[-1].text = source
 
-        out_dir.mkdir(parents=True,exist_ok=True)
         with util.open_text((out_dir/hdf5_name).with_suffix('.xdmf'),'w') as f:
             f.write(xml.dom.minidom.parseString(ET.tostring(xdmf).decode()).toprettyxml())
 
@@ -1890,7 +3605,11 @@ class Result:
                    target_dir: Union[None, str, Path] = None,
                    fill_float: float = np.nan,
                    fill_int: int = 0,
-                   parallel: bool = True):
+                   parallel: bool = True,
+                   *,
+                   workers: int = 1,
+                   writers: int = 1,
+                   time_series: bool = False) -> Table:
         """
         Export to VTK cell/point data.
 
@@ -1899,6 +3618,8 @@ class Result:
         For cell data, the file format is either ImageData (.vti)
         or UnstructuredGrid (.vtu) for grid-based or mesh-based simulations,
         respectively.
+        Alternatively, a single transient VTKHDF file (.vtkhdf) is created,
+        which stores the geometry only once.
 
         Parameters
         ----------
@@ -1920,14 +3641,51 @@ class Result:
             Fill value for non-existent entries of integer type.
             Defaults to 0.
         parallel : bool, optional
-            Write VTK files in parallel in a separate background process.
+            Write VTK files in parallel in separate background processes.
             Defaults to True.
+        workers : int, optional
+            Number of worker processes reading the data. Defaults to 1.
+        writers : int, optional
+            Number of background processes writing the VTK files.
+            Defaults to 1. Ignored if 'parallel' is False.
+        time_series : bool, optional
+            Write all visible increments as time steps of one VTKHDF file.
+            Reading requires VTK 9.3 or ParaView 5.12 or newer.
+            'parallel' and 'writers' are ignored.
+            Defaults to False.
+
+        Returns
+        -------
+        statistics : damask.Table
+            Time to read and write as well as file size
+            (or data size in case of a time series) per increment.
+
+        Notes
+        -----
+        Reading and writing are pipelined. At most twice the number
+        of workers/writers increments are held in memory at a time,
+        i.e. reading pauses while the writers are busy.
 
         """
+        at_box = None
         if mode.lower()=='cell':
-            v = self.geometry0
+            if self._points is None:
+                v = self.geometry0
+            elif self.structured:
+                lo,hi = self._bounding_box()
+                v = VTK.from_image_data(hi-lo,self.size/self.cells*(hi-lo),self.origin+self.size/self.cells*lo)
+                if len(self._points) != np.prod(hi-lo):
+                    ijk = np.unravel_index(self._points,self.cells,order='F')
+                    at_box = np.ravel_multi_index(tuple(ijk[d]-lo[d] for d in range(3)),hi-lo,order='F')
+            else:
+                with self._pool.open('r') as f:
+                    v = VTK.from_unstructured_grid(f['/geometry/x_n'][()],
+                                                   _read(f['/geometry/T_c'],self._points)-1,
+                                                   f['/geometry/T_c'].attrs['VTK_TYPE'] if h5py3 else \
+                                                   f['/geometry/T_c'].attrs['VTK_TYPE'].decode())
         elif mode.lower()=='point':
-            v = VTK.from_poly_data(self.coordinates0_point)
+            v = VTK.from_poly_data(self.coordinates0_point if self._points is None else \
+                                   self.coordinates0_point[self._points])
         else:
             raise ValueError(f'invalid mode "{mode}"')
 
@@ -1935,7 +3693,7 @@ class Result:
 
         N_digits = int(np.floor(np.log10(max(1,self._incs[-1]))))+1
 
-        constituents_ = constituents if isinstance(constituents,Iterable) else \
+        constituents_ = list(map(int,constituents)) if isinstance(constituents,Iterable) else \
                         (range(self.N_constituents) if constituents is None else [constituents])    # type: ignore
 
         suffixes = [''] if self.N_constituents == 1 or isinstance(constituents,int) else \
@@ -1945,47 +3703,89 @@ class Result:
 
         out_dir = Path.cwd() if target_dir is None else Path(target_dir)
         out_dir.mkdir(parents=True,exist_ok=True)
+        ext = '.vtp' if mode.lower() == 'point' else '.vti' if self.structured else '.vtu'
+        u_name = 'u_n' if mode.lower() == 'cell' else 'u_p'
 
-        with h5py.File(self.fname,'r') as f:
+        with self._pool.open('r') as f:
             creator = f.attrs['creator'] if h5py3 else f.attrs['creator'].decode()
             created = f.attrs['created'] if h5py3 else f.attrs['created'].decode()
             v.comments += [f'{creator} ({created})']
 
-            for inc in util.show_progress(self._visible['increments']):
+        # buffers can be reused once the data of the previous increment is written or sent to the writer
+        reuse = time_series or workers > 1 or not parallel \
+                or 'fork' not in mp.get_all_start_methods()
+        buffers: Dict[Tuple[str, str], Dict[str, Tuple[np.ndarray, np.ndarray]]] = defaultdict(dict)
 
-                u = _read(f['/'.join([inc,'geometry','u_n' if mode.lower() == 'cell' else 'u_p'])])
-                v = v.set('u',u)
+        def read(inc: str) -> Tuple[str, Dict[str, np.ndarray], float]:
+            t_0 = time.perf_counter()
+            data = {}
+            with self._pool.open('r') as f:
+                data['u'] = _read(f['/'.join([inc,'geometry',u_name])],self._geometry_rows(u_name))
 
                 for ty in ['phase','homogenization']:
                     for field in self._visible['fields']:
-                        outs: Dict[str, np.ma.core.MaskedArray] = {}
+                        outs: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
                         for label in self._visible[ty+'s']:
-                            if field not in f['/'.join([inc,ty,label])].keys(): continue
-
-                            for out in _match(output,f['/'.join([inc,ty,label,field])].keys()):
-                                data = ma.array(_read(f['/'.join([inc,ty,label,field,out])]))
-
-                                if ty == 'phase':
-                                    if out+suffixes[0] not in outs.keys():
-                                        for c,suffix in zip(constituents_,suffixes):
-                                            outs[out+suffix] = \
-                                                _empty_like(data,self.N_materialpoints,fill_float,fill_int)
-
-                                    for c,suffix in zip(constituents_,suffixes):
-                                        outs[out+suffix][at_cell_ph[c][label]] = data[in_data_ph[c][label]]
-
-                                if ty == 'homogenization':
-                                    if out not in outs.keys():
-                                        outs[out] = _empty_like(data,self.N_materialpoints,fill_float,fill_int)
-
-                                    outs[out][at_cell_ho[label]] = data[in_data_ho[label]]
-
-                        for label,dataset in outs.items():
-                            v = v.set(' / '.join(['/'.join([ty,field,label]),dataset.dtype.metadata['unit']]),dataset)
+                            if field not in self._keys(f,'/'.join([inc,ty,label])): continue
+
+                            for out in _match(output,self._keys(f,'/'.join([inc,ty,label,field]))):
+                                targets = [(out+suffix,at_cell_ph[c][label],in_data_ph[c][label])
+                                           for c,suffix in zip(constituents_,suffixes)] if ty == 'phase' else \
+                                          [(out,at_cell_ho[label],in_data_ho[label])]
+                                self._place(outs,f['/'.join([inc,ty,label,field,out])],targets,
+                                            buffers[(ty,field)] if reuse else None)
+
+                        for label,placed in outs.items():
+                            dataset = _filled(placed,fill_float,fill_int)
+                            if at_box is not None:
+                                dataset_ = np.full((v.N_cells,)+dataset.shape[1:],
+                                                   _fill_value(dataset.dtype,fill_float,fill_int),dataset.dtype)
+                                dataset_[at_box] = dataset
+                                dataset = dataset_
+                            data[' / '.join(['/'.join([ty,field,label]),cast(Dict[str, Any],dataset.dtype.metadata)['unit']])] = dataset
+                        if reuse: buffers[(ty,field)].update(outs)
+
+            return inc,data,time.perf_counter()-t_0
+
+        def write(item: Tuple[str, Dict[str, np.ndarray], float]) -> Tuple[int, float, float, int]:
+            inc,data,t_read = item
+            t_0 = time.perf_counter()
+            v_ = v
+            for label,dataset in data.items():
+                v_ = v_.set(label,dataset)
+            fname = out_dir/f'{self.fname.stem}_inc{inc.split(prefix_inc)[-1].zfill(N_digits)}{ext}'
+            v_.save(fname,parallel=False)
+            return int(inc.split(prefix_inc)[-1]),t_read,time.perf_counter()-t_0,fname.stat().st_size
+
+        def write_step(item: Tuple[str, Dict[str, np.ndarray], float]) -> Tuple[int, float, float, int]:
+            inc,data,t_read = item
+            t_0 = time.perf_counter()
+            size = 0
+            for label,dataset in data.items():
+                size += _vtkhdf_set(g,self._visible['increments'].index(inc),label,dataset,
+                                    'Point' if label == 'u' or mode.lower() == 'point' else 'Cell',
+                                    _fill_value(dataset.dtype,fill_float,fill_int))
+            return int(inc.split(prefix_inc)[-1]),t_read,time.perf_counter()-t_0,size
+
+        if time_series:
+            with h5py.File(out_dir/f'{self.fname.stem}.vtkhdf','w') as f_out:
+                f_out.attrs['comments'] = v.comments
+                g = _vtkhdf_create(f_out,v,self.times)
+                stats = list(util.show_progress(_map_ordered(write_step,
+                                                             _map_ordered(read,self._visible['increments'],workers)),
+                                                len(self._visible['increments'])))
+        else:
+            stats = list(util.show_progress(_map_ordered(write,
+                                                         _map_ordered(read,self._visible['increments'],workers),
+                                                         writers if parallel else 1,parallel),
+                                            len(self._visible['increments'])))
 
+        return Table({'increment':(1,),'t_read':(1,),'t_write':(1,),'size':(1,)},
+                     np.array(stats).reshape(-1,4),
+                     ['t_read / s: time to read and place data',
+                      't_write / s: time to write VTK file',
+                      'size / B: size of VTK file' if not time_series else 'size / B: size of written data'])
 
-                v.save(out_dir/f'{self.fname.stem}_inc{inc.split(prefix_inc)[-1].zfill(N_digits)}',
-                       parallel=parallel)
 
     def export_DREAM3D(self,
                        q: str = 'O',
@@ -2011,6 +3811,9 @@ class Result:
         one constituent.
 
         """
+        if self._points is not None:
+            raise NotImplementedError('DREAM3D export of selected material points')
+
         def add_attribute(obj,name,data):
             """DREAM.3D requires fixed length string."""
             if isinstance(data,str):
@@ -2034,7 +3837,7 @@ class Result:
         out_dir = Path.cwd() if target_dir is None else Path(target_dir)
         out_dir.mkdir(parents=True,exist_ok=True)
 
-        with h5py.File(self.fname,'r') as f:
+        with self._pool.open('r') as f:
             for inc in util.show_progress(self._visible['increments']):
                 for c in range(self.N_constituents):
                     crystal_structure = [999]
@@ -2119,7 +3922,9 @@ class Result:
     def export_DADF5(self,
                      fname,
                      output: Union[str, List[str]] = '*',
-                     mapping = None):
+                     mapping = None,
+                     *,
+                     workers: int = 1):
         """
         Export visible components into a new DADF5 file.
 
@@ -2136,9 +3941,25 @@ class Result:
         mapping : numpy.ndarray of int, shape (:,:,:), optional
             Indices for regridding. Only applicable for grid
             solver results.
+        workers : int, optional
+            Number of worker processes that export increments in parallel.
+            Defaults to 1.
+
+        Notes
+        -----
+        Datasets are written with the compression of the view.
+        Datasets that are already stored with this compression
+        are copied without decompression unless regridded.
+        Regridded datasets are processed in chunks.
+        With multiple workers, each increment is written to a temporary
+        file next to 'fname' and then copied without decompression.
 
         """
-        if Path(fname).expanduser().absolute() == self.fname:
+        if self._points is not None:
+            raise NotImplementedError('DADF5 export of selected material points')
+
+        fname = Path(fname).expanduser().absolute()
+        if fname == self.fname:
             raise PermissionError(f'cannot overwrite "{self.fname}"')
 
         if mapping is not None and not self.structured:
@@ -2146,14 +3967,59 @@ class Result:
 
 
         def cp(path_in,path_out,label,mapping):
-            if mapping is None:
-                path_in.copy(label,path_out)
+            d = path_in[label]
+            options = _create_options(self._compression,d.shape if mapping is None else
+                                                        (len(mapping),)+d.shape[1:])
+            if mapping is None and (d.compression,d.compression_opts) \
+                                == (options.get('compression'),options.get('compression_opts')):
+                path_in.copy(label,path_out)                                                        # raw copy of chunks
             else:
-                path_out.create_dataset(label,data=path_in[label][()][mapping])
-                path_out[label].attrs.update(path_in[label].attrs)
-
+                N = len(d) if mapping is None else len(mapping)
+                d_out = path_out.create_dataset(label,shape=(N,)+d.shape[1:],dtype=d.dtype,**options)
+                N_rows = max(chunk_size//int(np.prod(d.shape[1:])),1)
+                if d_out.chunks is not None:
+                    N_rows = max(N_rows//d_out.chunks[0],1)*d_out.chunks[0]                         # align with storage
+                for start in range(0,N,N_rows):
+                    if mapping is None:
+                        d_out[start:start+N_rows] = d[start:start+N_rows]                           # re-encode slab-wise
+                    else:
+                        rows,inverse = np.unique(mapping[start:start+N_rows],return_inverse=True)
+                        d_out[start:start+N_rows] = _read(d,rows)[inverse]
+                d_out.attrs.update(d.attrs)
 
-        with h5py.File(self.fname,'r') as f_in, h5py.File(fname,'w') as f_out:
+        def export_increment(f_in: h5py.File, f_out: h5py.File, inc: str):
+            f_in.copy(inc,f_out,shallow=True)
+            if mapping is None:
+                for label in ['u_p','u_n']:
+                    cp(f_in[inc]['geometry'],f_out[inc]['geometry'],label,None)
+            else:
+                u_p = f_in[inc]['geometry']['u_p'][()][mapping_flat]
+                f_out[inc]['geometry'].create_dataset('u_p',data=u_p,
+                                                      **_create_options(self._compression,u_p.shape))
+                f_out[inc]['geometry'].create_dataset('u_n',data=weights_n@u_p,
+                                                      **_create_options(self._compression,(weights_n.shape[0],3)))
+                f_out[inc]['geometry/u_n'].attrs.update(f_in[inc]['geometry/u_n'].attrs)
+
+            for label in self._homogenizations:
+                f_in[inc]['homogenization'].copy(label,f_out[inc]['homogenization'],shallow=True)
+            for label in self._phases:
+                f_in[inc]['phase'].copy(label,f_out[inc]['phase'],shallow=True)
+
+            for ty in ['phase','homogenization']:
+                for label in self._visible[ty+'s']:
+                    for field in _match(self._visible['fields'],self._keys(f_in,'/'.join([inc,ty,label]))):
+                        p = '/'.join([inc,ty,label,field])
+                        for out in _match(output,self._keys(f_in,p)):
+                            cp(f_in[p],f_out[p],out,None if mapping is None else mappings[ty][label.encode()])
+
+        def export_temporary(inc: str) -> Path:
+            tmp = fname.with_name(f'.{fname.name}.{inc}')
+            with self._pool.open('r') as f_in, h5py.File(tmp,'w') as f_tmp:
+                export_increment(f_in,f_tmp,inc)
+            return tmp
+
+
+        with self._pool.open('r') as f_in, h5py.File(fname,'w') as f_out:
             f_out.attrs.update(f_in.attrs)
             for g in ['setup','geometry'] + (['cell_to'] if mapping is None else []):
                 f_in.copy(g,f_out)
@@ -2177,43 +4043,31 @@ class Result:
                     mapping_phase[m] = list(zip((p,)*c,tuple(np.arange(c))))
                 f_out['cell_to'].create_dataset('phase',data=mapping_phase.reshape(np.prod(mapping_flat.shape),-1))
 
-                mapping_homog = f_in['cell_to']['homogenization'][()][mapping]
+                mapping_homog = f_in['cell_to']['homogenization'][()][mapping_flat]
                 for h in np.unique(mapping_homog['label']):
                     m = mapping_homog['label'] == h
                     mappings['homogenization'][h] = mapping_homog[m]['entry']
                     c = np.count_nonzero(m)
                     mapping_homog[mapping_homog['label'] == h] = list(zip((h,)*c,tuple(np.arange(c))))
-                f_out['cell_to'].create_dataset('homogenization',data=mapping_homog.flatten())
+                f_out['cell_to'].create_dataset('homogenization',data=mapping_homog)
 
+                delta = self.size/np.array(cells)
+                weights_n = _interpolation_weights([np.linspace(delta[i]/2,self.size[i]-delta[i]/2,cells[i])
+                                                    for i in [0,1,2]],
+                                                   grid_filters.coordinates0_node(cells,self.size)
+                                                   .reshape(-1,3,order='F'))
 
-            for inc in util.show_progress(self._visible['increments']):
-                f_in.copy(inc,f_out,shallow=True)
-                if mapping is None:
-                    for label in ['u_p','u_n']:
-                        f_in[inc]['geometry'].copy(label,f_out[inc]['geometry'])
-                else:
-                    u_p = f_in[inc]['geometry']['u_p'][()][mapping_flat]
-                    f_out[inc]['geometry'].create_dataset('u_p',data=u_p)
-                    delta = self.size/np.array(mapping.shape)
-                    c_0_p = tuple([np.linspace(delta[i]/2,self.size[i]-delta[i]/2,mapping.shape[i]) for i in [0,1,2]])
-                    interpolator = interpolate.RegularGridInterpolator(c_0_p,np.reshape(u_p,tuple(cells)+(3,)),
-                                                                       fill_value=None,bounds_error=False,method='linear')
-                    c_0_n = grid_filters.coordinates0_node(mapping.shape,self.size).reshape(-1,3)
-                    f_out[inc]['geometry'].create_dataset('u_n',data=interpolator(c_0_n))
-                    f_out[inc]['geometry/u_n'].attrs.update(f_in[inc]['geometry/u_n'].attrs)
-
-
-                for label in self._homogenizations:
-                    f_in[inc]['homogenization'].copy(label,f_out[inc]['homogenization'],shallow=True)
-                for label in self._phases:
-                    f_in[inc]['phase'].copy(label,f_out[inc]['phase'],shallow=True)
+            if workers == 1:
+                for inc in util.show_progress(self._visible['increments']):
+                    export_increment(f_in,f_out,inc)
 
-                for ty in ['phase','homogenization']:
-                    for label in self._visible[ty+'s']:
-                        for field in _match(self._visible['fields'],f_in['/'.join([inc,ty,label])].keys()):
-                            p = '/'.join([inc,ty,label,field])
-                            for out in _match(output,f_in[p].keys()):
-                                cp(f_in[p],f_out[p],out,None if mapping is None else mappings[ty][label.encode()])
+        if workers > 1:
+            for inc,tmp in util.show_progress(zip(self._visible['increments'],
+                                                  _map_ordered(export_temporary,self._visible['increments'],workers)),
+                                              len(self._visible['increments'])):
+                with h5py.File(tmp,'r') as f_tmp, h5py.File(fname,'a') as f_out:
+                    f_tmp.copy(inc,f_out)
+                tmp.unlink()
 
 
     def export_simulation_setup(self,
@@ -2252,7 +4106,7 @@ class Result:
                     with util.open_text(cfg,'w') as f_out: f_out.write(obj[0].decode())
 
         cfg_dir = (Path.cwd() if target_dir is None else Path(target_dir))
-        with h5py.File(self.fname,'r') as f_in:
+        with self._pool.open('r') as f_in:
             f_in['setup'].visititems(functools.partial(export,
                                                        output=output,
                                                        cfg_dir=cfg_dir,
@@ -13,7 +13,7 @@ class Table:
 
     def __init__(self,
                  shapes: dict = {},
-                 data: Optional[np.ndarray] = None,
+                 data: Union[None, np.ndarray, pd.DataFrame] = None,
                  comments: Union[None, str, Iterable[str]] = None):
         """
         New spreadsheet.
@@ -0,0 +1,124 @@
+"""
+Benchmarks of damask.Result.
+
+Run with `pytest --benchmark tests/benchmark_Result.py`. Each operation
+runs in a fresh interpreter, its wall time and the increase of the
+resident set size (RSS) of that interpreter and its worker processes
+are compared to the baseline in resources/Result/benchmark.json.
+Store the current values as new baseline with `--update`.
+"""
+import json
+import subprocess
+import sys
+
+import pytest
+
+
+time_tolerance   = (2.0,0.1)                                                                        # relative, absolute / s
+memory_tolerance = (1.25,16e6)                                                                      # relative, absolute / B
+
+
+@pytest.fixture
+def res_path(res_path_base):
+    """Directory containing testing resources."""
+    return res_path_base/'Result'
+
+@pytest.fixture
+def baseline(res_path,update):
+    """Compare to or, with --update, store as baseline."""
+    fname = res_path/'benchmark.json'
+
+    def compare(key,measured):
+        reference = json.loads(fname.read_text()) if fname.exists() else {}
+        if update:
+            reference[key] = measured
+            fname.write_text(json.dumps(reference,indent=2,sort_keys=True)+'\n')
+            return
+        if key not in reference:
+            pytest.skip(f'no baseline for "{key}"')
+        for label,(rel,abs_) in [('time / s',time_tolerance),('RSS / B',memory_tolerance)]:
+            assert measured[label] <= reference[key][label]*rel+abs_, \
+                   f'{label}: {measured[label]:.3g} exceeds baseline {reference[key][label]:.3g}'
+        if 'size / B' in measured:
+            assert measured['size / B'] == pytest.approx(reference[key]['size / B'],rel=.05)
+
+    return compare
+
+def measure(setup,statement):
+    """
+    Wall time and RSS increase of a statement in a fresh interpreter.
+
+    The statement runs in a process forked after the setup. The RSS
+    increase is the peak RSS of that process minus its RSS after the
+    fork, plus the peak RSS of its largest worker process.
+    """
+    script = '\n'.join(['import json',
+                        'import os',
+                        'import resource',
+                        'import sys',
+                        'import time',
+                        setup,
+                        'if os.fork() == 0:',
+                        '    rss_0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss',
+                        '    t_0 = time.perf_counter()',
+                        f'    {statement}',
+                        '    t = time.perf_counter() - t_0',
+                        '    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_0 \\',
+                        '        + resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss',
+                        "    unit = 1 if sys.platform == 'darwin' else 1024",                       # macOS: B, Linux: KiB
+                        "    print(json.dumps({'time / s':t,'RSS / B':rss*unit}),flush=True)",
+                        '    os._exit(0)',
+                        'os.wait()'])
+    return json.loads(subprocess.run([sys.executable,'-c',script],
+                                     check=True,capture_output=True,text=True).stdout.splitlines()[-1])
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('operation',['Result','view','get','place',
+                                      'add_stress_Cauchy','add_equivalent_Mises','add_curl',
+                                      'export_VTK','export_XDMF','export_DADF5'])
+def test_operation(synthetic,pytestconfig,tmp_path,baseline,operation):
+    fname = synthetic()
+    options = [pytestconfig.getoption(f'--benchmark-{o}')
+               for o in ['cells','increments','phases','constituents']]
+    if operation in ['add_curl','export_XDMF'] and options[-1] > 1:
+        pytest.skip(f'{operation} requires one constituent')
+    setup = '\n'.join(['import damask',
+                       f'r = damask.Result({str(fname)!r})',
+                       "r.add_stress_Cauchy()" if operation == 'add_equivalent_Mises' else ''])
+    statement = {'Result':               f'damask.Result({str(fname)!r})',
+                 'view':                 "r.view(increments=r.increments[::2],phases=r.phases[:1],fields='mechanical')",
+                 'get':                  'r.get()',
+                 'place':                'r.place()',
+                 'add_stress_Cauchy':    'r.add_stress_Cauchy()',
+                 'add_equivalent_Mises': "r.add_equivalent_Mises('sigma')",
+                 'add_curl':             "r.add_curl('F')",
+                 'export_VTK':           f'r.export_VTK(target_dir={str(tmp_path)!r},parallel=False)',
+                 'export_XDMF':          f'r.export_XDMF(target_dir={str(tmp_path)!r})',
+                 'export_DADF5':         f"r.export_DADF5({str(tmp_path/'exported.hdf5')!r})",
+                }[operation]
+
+    measured = measure(setup,statement)
+    print(f'\n{operation:>20} ({"x".join([str(options[0])]*3)}, {options[1]} increments, '
+          f'{options[2]} phases, {options[3]} constituents): '
+          f'{measured["time / s"]:8.3f} s, RSS {measured["RSS / B"]/1e6:8.1f} MB')
+    baseline(f'{operation} {options}',measured)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('compression',[False,'lzf',('gzip',1),('gzip',6),'blosc','zstd'])
+def test_compression(res_path,tmp_path,baseline,compression):
+    if compression in ['blosc','zstd']: pytest.importorskip('hdf5plugin')
+    fname = tmp_path/'regridded.hdf5'
+    setup = '\n'.join(['import numpy as np',
+                       'import damask',
+                       f"r = damask.Result({str(res_path/'12grains6x7x8_tensionY.hdf5')!r})"
+                       f'.view(fields="mechanical",compression={compression!r},chunks=2**14)',
+                       'm = damask.grid_filters.regrid(r.size,np.broadcast_to(np.eye(3),tuple(r.cells)+(3,3)),'
+                       '                                r.cells*6)'])
+
+    measured = measure(setup,f'r.export_DADF5({str(fname)!r},mapping=m)')
+    measured['size / B'] = fname.stat().st_size
+    print(f'\n{str(compression):>12}: write {measured["time / s"]:7.3f} s, '
+          f'RSS {measured["RSS / B"]/1e6:6.1f} MB, size {measured["size / B"]/1e6:6.1f} MB')
+    baseline(f'compression {compression}',measured)
@@ -3,6 +3,7 @@ import datetime
 import os
 
 import numpy as np
+import h5py
 import pytest
 import matplotlib as mpl
 if os.name == 'posix' and 'DISPLAY' not in os.environ:
@@ -53,6 +54,16 @@ def pytest_addoption(parser):
                      help='Update reference results.')
     parser.addoption('--damaskroot',
                      help='DAMASK root directory.')
+    parser.addoption('--benchmark', action='store_true', default=False,
+                     help='Run benchmarks.')
+    parser.addoption('--benchmark-cells', type=int, default=16,
+                     help='Number of cells per direction of synthetic benchmark data.')
+    parser.addoption('--benchmark-increments', type=int, default=5,
+                     help='Number of increments of synthetic benchmark data.')
+    parser.addoption('--benchmark-phases', type=int, default=2,
+                     help='Number of phases of synthetic benchmark data.')
+    parser.addoption('--benchmark-constituents', type=int, default=1,
+                     help='Number of constituents of synthetic benchmark data.')
 
 @pytest.fixture
 def update(pytestconfig):
@@ -70,11 +81,72 @@ def pytest_collection_modifyitems(config, items):
         need_damaskroot = pytest.mark.skip(reason='need --damaskroot to run')
         for item in items:
             if 'need_damaskroot' in item.keywords: item.add_marker(need_damaskroot)
+    if not config.getoption('--benchmark'):
+        benchmark = pytest.mark.skip(reason='need --benchmark to run')
+        for item in items:
+            if 'benchmark' in item.keywords: item.add_marker(benchmark)
 
 def pytest_configure(config):
     config.addinivalue_line(
         'markers', 'need_damaskroot: mark test to run only if DAMASK root is given'
     )
+    config.addinivalue_line(
+        'markers', 'benchmark: mark test to run only if --benchmark is given'
+    )
+
+@pytest.fixture
+def synthetic(tmp_path,pytestconfig):
+    """Factory of synthetic DADF5 files, by default of the size configured for benchmarks."""
+    def create(cells=None,N_increments=None,N_phases=None,N_constituents=None,N_grains=None):
+        cells = np.full(3,pytestconfig.getoption('--benchmark-cells') if cells is None else cells)
+        if N_increments is None: N_increments = pytestconfig.getoption('--benchmark-increments')
+        if N_phases is None: N_phases = pytestconfig.getoption('--benchmark-phases')
+        if N_constituents is None: N_constituents = pytestconfig.getoption('--benchmark-constituents')
+        N = np.prod(cells)
+        if N_grains is None: N_grains = max(N//100,1)
+        rng = np.random.default_rng(20191102)
+
+        grains = damask.GeomGrid.from_Voronoi_tessellation(cells,np.ones(3),
+                                                           damask.seeds.from_random(np.ones(3),N_grains,cells,
+                                                                                    rng_seed=20191102))
+        phase = (grains.material.reshape(-1,1,order='F')+np.arange(N_constituents)) % N_phases
+        entry = np.empty_like(phase)
+        for p in range(N_phases):
+            entry[phase == p] = np.arange(np.count_nonzero(phase == p))
+
+        fname = tmp_path/f'synthetic{cells[0]}x{cells[1]}x{cells[2]}.hdf5'
+        with h5py.File(fname,'w') as f:
+            f.attrs['DADF5_version_major'] = np.int32(1)
+            f.attrs['DADF5_version_minor'] = np.int32(0)
+            f.attrs['creator'] = 'pytest'
+            f.attrs['call'] = 'pytest'
+            f.attrs['created'] = '2019-11-02 11:58:00+0000'
+            f.create_group('setup')
+            f.create_group('geometry').attrs.update({'cells':cells,'size':np.ones(3),'origin':np.zeros(3)})
+            f['cell_to/phase'] = np.rec.fromarrays([np.char.add('phase_',phase.astype(str)).astype('S'),entry],
+                                                   dtype=[('label','S9'),('entry','<i8')])
+            f['cell_to/homogenization'] = np.rec.fromarrays([np.full(N,b'SX'),np.arange(N)],
+                                                            dtype=[('label','S2'),('entry','<i8')])
+            for i in range(N_increments):
+                inc = f.create_group(f'increment_{i}')
+                inc.attrs['t/s'] = float(i)
+                inc.create_group('homogenization/SX/mechanical')
+                data = {'geometry':{'u_n':rng.random((np.prod(cells+1),3)),'u_p':rng.random((N,3))}}
+                for p in range(N_phases):
+                    N_p = np.count_nonzero(phase == p)
+                    data[f'phase/phase_{p}/mechanical'] = {'F':np.eye(3)+rng.random((N_p,3,3))*1e-2,
+                                                           'P':rng.random((N_p,3,3))*1e6,
+                                                           'O':rng.random((N_p,4))}
+                for group,datasets in data.items():
+                    for label,d in datasets.items():
+                        inc[f'{group}/{label}'] = d
+                        inc[f'{group}/{label}'].attrs.update({'unit':'Pa' if label == 'P' else 'm' if label[0] == 'u' else '1',
+                                                              'description':'synthetic','creator':'pytest',
+                                                              'created':'2019-11-02 11:58:00+0000'})
+                        if label == 'O': inc[f'{group}/{label}'].attrs['lattice'] = 'cI'
+        return fname
+
+    return create
 
 @pytest.fixture
 def res_path_base():
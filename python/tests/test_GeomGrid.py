@@ -1,7 +1,9 @@
 import sys
+import time
 
 import pytest
 import numpy as np
+from scipy import ndimage
 from vtkmodules.vtkCommonCore import vtkVersion
 
 from damask import VTK
@@ -15,6 +17,26 @@ from damask import seeds
 from damask import grid_filters
 
 
+def clean_generic_filter(material,distance,selection,periodic,rng_seed):
+    """Majority filter evaluated per cell (reference for GeomGrid.clean)."""
+    def most_frequent(stencil,selection,rng):
+        me = stencil[stencil.size//2]
+        if selection is None or me in selection:
+            unique, counts = np.unique(stencil,return_counts=True)
+            return rng.choice(unique[counts==np.max(counts)])
+        else:
+            return me
+
+    d = np.floor(distance).astype(np.int64)
+    ext = np.linspace(-d,d,1+2*d,dtype=float),
+    xx,yy,zz = np.meshgrid(ext,ext,ext)
+    footprint = xx**2+yy**2+zz**2 <= distance**2+distance*1e-8
+    return ndimage.generic_filter(material,most_frequent,footprint=footprint,
+                                  mode='wrap' if periodic else 'nearest',
+                                  extra_keywords=dict(selection=selection,rng=np.random.default_rng(rng_seed)),
+                                 ).astype(material.dtype)
+
+
 @pytest.fixture
 def default():
     """Simple geometry."""
@@ -69,6 +91,113 @@ class TestGeomGrid:
         new = GeomGrid.load(tmp_path/'default.vti')
         assert new == default
 
+    @pytest.mark.parametrize('memmap',[True,False])
+    def test_save_load_HDF5(self,random,tmp_path,memmap):
+        random.initial_conditions = {'T': np.random.rand(*random.cells),
+                                     'v': np.random.rand(*random.cells,3)}
+        random.save_HDF5(tmp_path/'random.hdf5')
+        new = GeomGrid.load_HDF5(tmp_path/'random.hdf5',memmap=memmap)
+        assert new == random and new.out_of_core == memmap and new.comments == random.comments
+        for k,v in random.initial_conditions.items():
+            assert np.array_equal(new.initial_conditions[k],v)
+
+    @pytest.mark.parametrize('operation',[lambda g: g.canvas(g.cells+[3,-2,1],[-1,2,0]),
+                                          lambda g: g.mirror('xz'),
+                                          lambda g: g.mirror('y',reflect=True),
+                                          lambda g: g.flip('xy'),
+                                          lambda g: g.substitute([1,2,3],[3,1,20]),
+                                          lambda g: g.renumber(),
+                                          lambda g: g.clean(rng_seed=1),
+                                          lambda g: g.vicinity_offset(),
+                                          lambda g: g.add_primitive(3,10,1),
+                                          lambda g: g.add_primitive(g.size*.3,g.size*.2,2,inverse=True,periodic=False),
+                                          lambda g: g.scale(g.cells+[2,-3,5]),
+                                          lambda g: g.rotate(Rotation.from_random(rng_seed=1)),
+                                          lambda g: g.sort(),
+                                          lambda g: g.assemble(np.arange(np.prod(g.cells)).reshape(g.cells)[::-1]),
+                                          lambda g: g.copy(),
+                                         ])
+    def test_out_of_core(self,random,tmp_path,operation):
+        random.save_HDF5(tmp_path/'random.hdf5')
+        mapped = GeomGrid.load_HDF5(tmp_path/'random.hdf5',memmap=True)
+        new = operation(mapped)
+        assert new.out_of_core and new == operation(random)
+
+    def test_out_of_core_no_alias(self,random,tmp_path):
+        m = np.memmap(tmp_path/'material.raw',random.material.dtype,'w+',shape=tuple(random.cells))
+        m[...] = random.material
+        g = GeomGrid(m,random.size)
+        m[...] = -1
+        assert g.out_of_core and g == random
+        mirrored = g.mirror('x')
+        h = GeomGrid(mirrored.material,mirrored.size)
+        mirrored.material[...] = -1
+        assert h.out_of_core and h == g.mirror('x')
+        assert not GeomGrid(mirrored.material+1,mirrored.size).out_of_core
+
+    @pytest.mark.parametrize('tessellation',['Voronoi','Laguerre'])
+    @pytest.mark.parametrize('periodic',[True,False])
+    def test_tessellation_out_of_core(self,tessellation,periodic):
+        cells = np.random.randint(10,20,3)
+        size = np.random.rand(3)+.5
+        s = seeds.from_random(size,15,cells)
+        material = np.random.randint(0,4,15)
+        args = (cells,size,s,np.random.rand(15)) if tessellation == 'Laguerre' else (cells,size,s)
+        new = getattr(GeomGrid,f'from_{tessellation}_tessellation')(*args,material,periodic,out_of_core=True)
+        assert new.out_of_core and \
+               new == getattr(GeomGrid,f'from_{tessellation}_tessellation')(*args,material,periodic)
+
+    @pytest.mark.parametrize('operation',[lambda g: g,
+                                          lambda g: g.canvas(g.cells+2),
+                                          lambda g: g.rotate(Rotation.from_random(rng_seed=1)),
+                                          lambda g: g.scale(g.cells*2),
+                                          lambda g: g.renumber(),
+                                          lambda g: g.substitute([1,2],[70000,0]),
+                                          lambda g: g.vicinity_offset(offset=-3),
+                                          lambda g: g.add_primitive(3,10,1),
+                                          lambda g: g.add_primitive(3,10,1,fill=-1),
+                                          lambda g: g.add_primitive(3,10,1,fill=70000),
+                                          lambda g: g.clean(rng_seed=1),
+                                         ])
+    def test_compact_material(self,random,operation):
+        compact = operation(random.renumber(compact=True))
+        legacy = operation(random.renumber())
+        assert legacy.material.dtype == np.int64 and np.array_equal(compact.material,legacy.material)
+        assert compact.material.dtype == (np.uint32 if compact.material.max() >= 2**16 else np.uint16) \
+               or compact.material.min() < 0
+
+    def test_compact_material_default(self):
+        g = GeomGrid(np.zeros((2,2,2),int),np.ones(3))
+        assert g.material.dtype == np.int64 and np.all(g.material - 1 == -1)
+        assert g.renumber().material.dtype == np.int64
+        assert g.renumber(compact=True).material.dtype == np.uint16
+
+    @pytest.mark.parametrize('tessellation',['Voronoi','Laguerre'])
+    def test_compact_material_tessellation(self,tessellation):
+        cells = np.random.randint(10,20,3)
+        size = np.random.rand(3)+.5
+        s = seeds.from_random(size,15,cells)
+        args = (cells,size,s,np.random.rand(15)) if tessellation == 'Laguerre' else (cells,size,s)
+        default = getattr(GeomGrid,f'from_{tessellation}_tessellation')(*args)
+        compact = getattr(GeomGrid,f'from_{tessellation}_tessellation')(*args,compact=True)
+        assert default.material.dtype == np.int64 and compact.material.dtype == np.uint16 \
+               and default == compact
+
+    def test_compact_material_overflow(self):
+        g = GeomGrid(np.array([0,2**16-1]*4,np.uint16).reshape(2,2,2),np.ones(3))
+        assert g.material.dtype == np.uint16
+        assert g.canvas([3,2,2]).material.max() == 2**16 and \
+               g.canvas([3,2,2]).material.dtype == np.uint32
+        assert g.vicinity_offset(offset=-1).material.min() == -1
+        assert g.add_primitive(1,[0,0,0],1).material.max() == 2**16 and \
+               g.add_primitive(1,[0,0,0],1).material.dtype == np.uint32
+
+    def test_save_compact_material(self,random,tmp_path):
+        compact = random.renumber(compact=True)
+        compact.save(tmp_path/'random.vti')
+        assert VTK.load(tmp_path/'random.vti').get('material').dtype == np.int32
+        assert GeomGrid.load(tmp_path/'random.vti') == compact
+
     def test_invalid_no_material(self,tmp_path):
         v = VTK.from_image_data(np.random.randint(5,10,3)*2,np.random.random(3) + 1.0)
         v.save(tmp_path/'no_materialpoint.vti',parallel=False)
@@ -81,7 +210,7 @@ class TestGeomGrid:
 
     def test_cast_to_int(self):
         g = GeomGrid(np.zeros((3,3,3),dtype=np.float64),np.ones(3))
-        assert g.material.dtype in [np.int32,np.int64]
+        assert np.issubdtype(g.material.dtype,np.integer)
 
     def test_invalid_size(self,default):
         with pytest.raises(ValueError):
@@ -130,6 +259,17 @@ class TestGeomGrid:
         if update: modified.save(reference)
         assert GeomGrid.load(reference) == modified
 
+    @pytest.mark.parametrize('directions',[['x'],['y'],['z'],['x','y','z']])
+    @pytest.mark.parametrize('reflect',[True,False])
+    def test_mirror_slabs(self,random,monkeypatch,directions,reflect):
+        mat = random.material
+        for d in directions:
+            axis = 'xyz'.index(d)
+            flipped = np.flip(mat,axis) if reflect else np.flip(mat,axis).take(range(1,mat.shape[axis]-1),axis)
+            mat = np.concatenate([mat,flipped],axis)
+        monkeypatch.setattr('damask._geomgrid._slabs',lambda shape: (slice(x,x+1) for x in range(shape[0])))
+        assert np.array_equal(random.mirror(directions,reflect).material,mat)
+
     @pytest.mark.parametrize('directions',[(1,2,'y'),('a','b','x'),[1]])
     def test_mirror_invalid(self,default,directions):
         with pytest.raises(ValueError):
@@ -200,6 +340,37 @@ class TestGeomGrid:
         assert random.clean(selection=None,invert_selection=True,rng_seed=0) == random.clean(rng_seed=0) and \
                random.clean(selection=None,invert_selection=False,rng_seed=0) == random.clean(rng_seed=0)
 
+    @pytest.mark.parametrize('distance',[1.,np.sqrt(2),2.5])
+    @pytest.mark.parametrize('selection',[None,[1,3,5]])
+    @pytest.mark.parametrize('periodic',[True,False])
+    def test_clean_generic_filter(self,distance,selection,periodic):
+        rng_seed = np.random.randint(2**31)
+        material = np.random.randint(0,8,np.random.randint(3,9,3))
+        assert np.array_equal(clean_generic_filter(material,distance,selection,periodic,rng_seed),
+                              GeomGrid(material,np.ones(3)).clean(distance,selection,periodic=periodic,
+                                                                  rng_seed=rng_seed).material)
+
+    @pytest.mark.parametrize('distance',[1.,2.5])
+    @pytest.mark.parametrize('selection',[None,[1,3,5]])
+    @pytest.mark.parametrize('periodic',[True,False])
+    def test_clean_slabs(self,monkeypatch,distance,selection,periodic):
+        material = np.random.randint(0,8,np.random.randint(3,9,3))
+        reference = GeomGrid(material,np.ones(3)).clean(distance,selection,periodic=periodic,rng_seed=1)
+        monkeypatch.setattr('damask._geomgrid._slabs',lambda shape: (slice(x,x+1) for x in range(shape[0])))
+        assert reference == GeomGrid(material,np.ones(3)).clean(distance,selection,periodic=periodic,rng_seed=1)
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize('distance',[np.sqrt(3),3.])
+    def test_clean_benchmark(self,distance):
+        material = np.random.randint(0,50,(48,48,48))
+        t_0 = time.perf_counter()
+        reference = clean_generic_filter(material,distance,None,True,0)
+        t_1 = time.perf_counter()
+        current = GeomGrid(material,np.ones(3)).clean(distance,rng_seed=0).material
+        t_2 = time.perf_counter()
+        assert np.array_equal(reference,current)
+        print(f'\ndistance {distance:.2f}: generic_filter {t_1-t_0:6.2f} s, vectorized {t_2-t_1:6.2f} s')
+
     @pytest.mark.parametrize('cells',[
                                      (10,11,10),
                                      [10,13,10],
@@ -319,6 +490,15 @@ class TestGeomGrid:
         G_2 = GeomGrid(np.ones(g,'i'),s,o).add_primitive(diameter,center2,exponent)
         assert np.count_nonzero(G_1.material!=2) == np.count_nonzero(G_2.material!=2)
 
+    @pytest.mark.parametrize('inverse',[True,False])
+    def test_add_primitive_periodic_inside(self,inverse):
+        """Periodicity does not matter for primitives inside the grid."""
+        cells = np.array([9,11,13])
+        G = GeomGrid(np.ones(cells,'i'),cells*1e-3)
+        center = (np.array([3,4,8])+.5)*1e-3
+        assert G.add_primitive(3.3e-3,center,1,inverse=inverse,periodic=True) \
+            == G.add_primitive(3.3e-3,center,1,inverse=inverse,periodic=False)
+
     @pytest.mark.parametrize('center',[np.random.randint(4,10,(3)),
                                        np.random.randint(2,10),
                                        np.random.rand()*4,
@@ -374,6 +554,17 @@ class TestGeomGrid:
         assert random.vicinity_offset(selection=None,invert_selection=False) == random.vicinity_offset() and \
                random.vicinity_offset(selection=None,invert_selection=True ) == random.vicinity_offset()
 
+    @pytest.mark.parametrize('distance',[1.,np.sqrt(3),2.5])
+    @pytest.mark.parametrize('selection',[None,[1,3,5]])
+    @pytest.mark.parametrize('periodic',[True,False])
+    def test_vicinity_offset_slabs(self,monkeypatch,distance,selection,periodic):
+        g = GeomGrid(np.random.randint(0,8,np.random.randint(3,9,3)),np.ones(3))
+        reference = g.vicinity_offset(distance,selection=selection,periodic=periodic)
+        monkeypatch.setattr('damask._geomgrid._slabs',lambda shape: (slice(x,x+1) for x in range(shape[0])))
+        assert reference == g.vicinity_offset(distance,selection=selection,periodic=periodic)
+        monkeypatch.setattr('damask._geomgrid.nb',True)                                             # uncompiled if numba is missing
+        assert reference == g.vicinity_offset(distance,selection=selection,periodic=periodic)
+
     @pytest.mark.parametrize('periodic',[True,False])
     def test_vicinity_offset_invariant(self,default,periodic):
         offset = default.vicinity_offset(selection=[default.material.max()+1,
@@ -401,6 +592,20 @@ class TestGeomGrid:
         Laguerre = GeomGrid.from_Laguerre_tessellation(cells,size,seeds,weights,periodic=np.random.random()>0.5)
         assert np.all(Laguerre.material == ms)
 
+    @pytest.mark.parametrize('periodic',[True,False])
+    def test_Laguerre_power_distance(self,periodic):
+        cells  = np.random.randint(5,15,3)
+        size   = np.random.random(3) + 1.0
+        N_seeds= np.random.randint(10,30)
+        seeds  = np.random.rand(N_seeds,3) * np.broadcast_to(size,(N_seeds,3))
+        weights= np.random.random(N_seeds)*0.1
+        images = np.array(np.meshgrid(*[[-1,0,1]]*3)).reshape(3,-1).T*size if periodic else np.zeros((1,3))
+        seeds_p = (seeds+images[:,np.newaxis]).reshape(-1,3)
+        x = grid_filters.coordinates0_point(cells,size).reshape(-1,3)
+        power = np.sum((x[:,np.newaxis]-seeds_p)**2,axis=-1) - np.tile(weights,len(images))
+        Laguerre = GeomGrid.from_Laguerre_tessellation(cells,size,seeds,weights,periodic=periodic)
+        assert np.all(Laguerre.material == (np.argmin(power,axis=1)%N_seeds).reshape(cells))
+
     @pytest.mark.parametrize('approach',['Laguerre','Voronoi'])
     def test_tessellate_bicrystal(self,approach):
         cells = np.random.randint(5,10,3)*2
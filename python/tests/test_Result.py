@@ -7,17 +7,20 @@ import sys
 import hashlib
 import fnmatch
 import random
+import contextlib
 from datetime import datetime
 
 import pytest
 from vtkmodules.vtkIOXML import vtkXMLImageDataReader
 from vtkmodules.vtkCommonCore import vtkVersion
+from vtkmodules.util.numpy_support import vtk_to_numpy
 try:
     from vtkmodules.vtkIOXdmf2 import vtkXdmfReader
 except ImportError:
     vtkXdmfReader=None                                                                              # noqa type: ignore
 import h5py
 import numpy as np
+from scipy import interpolate
 
 from damask import Result
 from damask import Orientation
@@ -130,6 +133,154 @@ class TestResult:
         times = list(default._times.values())
         assert [default._increments[inc]] == default.view(times=times[inc]+eps)._visible['increments']
 
+    def test_manifest(self,res_path,tmp_path):
+        shutil.copy(res_path/'4grains2x4x3_compressionY.hdf5',tmp_path)
+        fname = tmp_path/'4grains2x4x3_compressionY.hdf5'
+        ref = Result(fname)
+        cur = Result(fname,manifest=True)
+        assert fname.with_suffix('.manifest.json').exists()
+        cur = Result(fname,manifest=True)
+        assert repr(cur) == repr(ref) and cur.times == ref.times and cur.fields == ref.fields
+        assert str(cur.get('*')) == str(ref.get('*'))
+
+    def test_manifest_update(self,res_path,tmp_path):
+        shutil.copy(res_path/'4grains2x4x3_compressionY.hdf5',tmp_path)
+        fname = tmp_path/'4grains2x4x3_compressionY.hdf5'
+        Result(fname,manifest=True)
+        Result(fname).add_determinant('F')
+        with h5py.File(fname,'a') as f:
+            f.copy(f['increment_10'],f,'increment_11')
+            f['increment_11'].attrs['t/s'] = 6.0
+        cur,ref = Result(fname,manifest=True),Result(fname)
+        assert any('det(F)' in l for l in cur.view(increments=0).list_data()) and repr(cur) == repr(ref)
+        assert cur.increments[-1] == 'increment_11'
+
+    def test_manifest_invalid(self,res_path,tmp_path):
+        shutil.copy(res_path/'4grains2x4x3_compressionY.hdf5',tmp_path)
+        fname = tmp_path/'4grains2x4x3_compressionY.hdf5'
+        with open(fname.with_suffix('.manifest.json'),'w') as f:
+            f.write('{"invalid')
+        assert repr(Result(fname,manifest=True)) == repr(Result(fname))
+
+    def test_refresh(self,res_path,tmp_path):
+        shutil.copy(res_path/'12grains6x7x8_tensionY.hdf5',tmp_path)
+        fname = tmp_path/'12grains6x7x8_tensionY.hdf5'
+        result = Result(fname)
+        result.add_stress_Cauchy()
+        assert result.refresh().increments == []
+        with h5py.File(fname,'a') as f:
+            for i in [44,48]:
+                f.copy(f['increment_40'],f,f'increment_{i}')
+                f[f'increment_{i}'].attrs['t/s'] = float(i)
+                del f[f'increment_{i}/phase/pheno_bcc/mechanical/sigma']
+            f['current'] = h5py.SoftLink('/increment_48')
+        new = result.refresh()
+        assert new.increments == ['increment_44'] and result.increments[-1] == 'increment_44'
+        new.add_stress_Cauchy()
+        with h5py.File(fname,'a') as f:
+            del f['current']
+        new = result.refresh()
+        assert new.increments == ['increment_48'] and new.times == [48.0]
+        bcc = result.view(phases='pheno_bcc')
+        created = bcc.view(increments=0).get('sigma').dtype.metadata['created']
+        result.add_stress_Cauchy()
+        assert bcc.view(increments=0).get('sigma').dtype.metadata['created'] == created
+        assert len(bcc.get('sigma')) == len(result.increments)
+
+    def test_refresh_restricted(self,res_path,tmp_path):
+        shutil.copy(res_path/'12grains6x7x8_tensionY.hdf5',tmp_path)
+        fname = tmp_path/'12grains6x7x8_tensionY.hdf5'
+        result = Result(fname)
+        first = result.view(increments=0)
+        with h5py.File(fname,'a') as f:
+            f.copy(f['increment_40'],f,'increment_44')
+            f['increment_44'].attrs['t/s'] = 44.
+        assert first.refresh().increments == ['increment_44']
+        assert first.increments == ['increment_0'] and first.times == [0.0]
+        assert result.refresh().increments == ['increment_44']
+        assert result.increments[-1] == 'increment_44'
+
+    def test_add_protected_existing(self,default,monkeypatch):
+        calls = []
+        stress_Cauchy = mechanics.stress_Cauchy
+        def counted(P,F):
+            calls.append(len(P))
+            return stress_Cauchy(P,F)
+        r = Result(default.fname).view(increments=[0,20,40])
+        r.view(increments=0).add_stress_Cauchy()
+        def created():
+            return {k:v.dtype.metadata['created'] for k,v in r.view(increments=0).get('sigma').items()}
+        created_first = created()
+        monkeypatch.setattr(mechanics,'stress_Cauchy',counted)
+        r.add_stress_Cauchy()
+        assert len([N for N in calls if N > 1]) == 2*len(r.phases)
+        calls.clear()
+        with r.batch():
+            r.add_stress_Cauchy()
+            r.add_equivalent_Mises('sigma')
+        assert len([N for N in calls if N > 1]) == 3*len(r.phases)
+        assert created() == created_first
+        for i in [0,20,40]:
+            single = r.view(increments=i)
+            assert np.array_equal(single.place('sigma_vM'),mechanics.equivalent_stress_Mises(single.place('sigma')))
+        calls.clear()
+        with r.batch():
+            r.add_stress_Cauchy()
+            r.add_equivalent_Mises('sigma')
+        assert len([N for N in calls if N > 1]) == 0
+
+    def test_session(self,default):
+        with default.session() as r:
+            r.add_stress_Cauchy()
+            handle = r._pool.handle
+            assert handle.mode == 'r+'
+            a = r.view(increments=-1).place('sigma')
+            assert r._pool.handle is handle
+        assert default._pool.handle is None and not handle
+        assert np.allclose(a,default.view(increments=-1).place('sigma'))
+
+    @pytest.mark.skipif(not hasattr(os,'fork'),reason='needs fork')
+    def test_session_fork(self,default,tmp_path):
+        with default.session() as r:
+            r.add_stress_Cauchy()
+            handle = r._pool.handle
+            r.export_DADF5(tmp_path/'exported.hdf5',workers=2)
+            pid = os.fork()
+            if pid == 0:
+                with r._pool.open('r') as f:
+                    private = f is not handle
+                    flushed = 'sigma' in f[f'{r.increments[0]}/phase/pheno_bcc/mechanical']
+                os._exit(0 if private and flushed else 1)
+            assert os.waitpid(pid,0)[1] == 0
+            assert r._pool.handle is handle
+        assert np.array_equal(Result(tmp_path/'exported.hdf5').view(increments=0).place('sigma'),
+                              default.view(increments=0).place('sigma'))
+
+    def test_session_nested(self,default):
+        with default.session():
+            with default.view(increments=0).session() as r:
+                r.get('F')
+            assert default._pool.handle
+        assert default._pool.handle is None
+
+    @pytest.mark.parametrize('fname',['4grains2x4x3_compressionY.hdf5','12grains6x7x8_tensionY.hdf5'])
+    def test_mappings(self,res_path,fname):
+        result = Result(res_path/fname)
+        with h5py.File(result.fname,'r') as f:
+            entry_ph = f['cell_to/phase']['entry']
+            entry_ho = f['cell_to/homogenization']['entry']
+        view = result.view(phases=result.phases[-1:])
+        at_cell_ph,in_data_ph,at_cell_ho,in_data_ho = view._mappings()
+        assert view._cache is result._cache
+        for c in range(result.N_constituents):
+            assert at_cell_ph[c].keys() == set(view.phases)
+            for label in view.phases:
+                assert np.array_equal(at_cell_ph[c][label],np.where(result.phase[:,c] == label)[0])
+                assert np.array_equal(in_data_ph[c][label],entry_ph[at_cell_ph[c][label],c])
+        for label in result.homogenizations:
+            assert np.array_equal(at_cell_ho[label],np.where(result.homogenization == label)[0])
+            assert np.array_equal(in_data_ho[label],entry_ho[at_cell_ho[label]])
+
     def test_getters(self,default):
         file_layout = default.get('non-existing',prune=False,flatten=False)
         for i in default.increments:
@@ -322,6 +473,95 @@ class TestResult:
         in_file   = default.place('V(F)')
         assert np.allclose(in_memory,in_file)
 
+    @pytest.mark.parametrize('workers',[2,3])
+    def test_add_workers(self,default,tmp_path,workers):
+        shutil.copy(default.fname,tmp_path/'parallel.hdf5')
+        serial = Result(default.fname)
+        parallel = Result(tmp_path/'parallel.hdf5')
+        serial.add_strain('F','U',0.5)
+        parallel.add_strain('F','U',0.5,workers=workers)
+        assert dict_equal(serial.get('epsilon_U^0.5(F)'),parallel.get('epsilon_U^0.5(F)'))
+
+    @pytest.mark.parametrize('store',[None,['sigma_vM','epsilon_V^0.0(F)_vM']])
+    def test_batch(self,res_path,tmp_path,store):
+        for d in ['sequential','batch']:
+            (tmp_path/d).mkdir()
+            shutil.copy(res_path/'12grains6x7x8_tensionY.hdf5',tmp_path/d)
+        ref = Result(tmp_path/'sequential'/'12grains6x7x8_tensionY.hdf5').view(increments=[0,20,40])
+        cur = Result(tmp_path/'batch'/'12grains6x7x8_tensionY.hdf5').view(increments=[0,20,40])
+        for r in [ref,cur]:
+            with (r.batch(store) if r is cur else contextlib.nullcontext()):
+                r.add_stress_Cauchy()
+                r.add_equivalent_Mises('sigma')
+                r.add_strain()
+                r.add_equivalent_Mises('epsilon_V^0.0(F)')
+        for label in ['sigma','sigma_vM','epsilon_V^0.0(F)','epsilon_V^0.0(F)_vM']:
+            if store is None or label in store:
+                a,b = ref.place(label),cur.place(label)
+                assert all(np.array_equal(a[k].filled(0),b[k].filled(0)) and
+                           {m:v for m,v in a[k].dtype.metadata.items() if m != 'created'} ==
+                           {m:v for m,v in b[k].dtype.metadata.items() if m != 'created'} for k in a)
+            else:
+                assert cur.get(label) is None
+
+    def test_batch_invalid(self,default):
+        with pytest.raises(ValueError):
+            with default.batch():
+                with default.batch():
+                    pass
+        with pytest.raises(NotImplementedError):
+            with default.batch():
+                default.add_curl('F')
+
+    @pytest.mark.parametrize('compression',[False,'lzf',True,('gzip',1),'blosc',('zstd',9)])
+    def test_compression(self,default,compression):
+        codec = compression if isinstance(compression,str) else \
+                compression[0] if isinstance(compression,tuple) else \
+                'gzip' if compression else None
+        if codec in ['blosc','zstd']: pytest.importorskip('hdf5plugin')
+        r = default.view(compression=compression,chunks=64)
+        r.add_calculation('#F#*2','x')
+        r.add_curl('F')
+        assert np.array_equal(r.place('x'),2*r.place('F'))
+        assert np.allclose(r.place('curl(F)'),
+                           grid_filters.curl(r.size,r.place('F').reshape(tuple(r.cells)+(3,3))).reshape(-1,3,3))
+        with h5py.File(r.fname,'r') as f:
+            for label in ['x','curl(F)']:
+                d = f[f'{r.increments[0]}/phase/pheno_bcc/mechanical/{label}']
+                assert d.chunks[0] < d.shape[0] and d.fletcher32
+                if codec in ['gzip','lzf']: assert d.compression == codec
+                if codec is None: assert d.compression is None and not d.shuffle
+
+    def test_compression_export_DADF5(self,default,tmp_path):
+        default.view(compression='lzf',chunks=64).export_DADF5(tmp_path/'lzf.hdf5')
+        default.view(chunks=64).export_DADF5(tmp_path/'gzip.hdf5')
+        with h5py.File(tmp_path/'lzf.hdf5','r') as f_lzf, h5py.File(tmp_path/'gzip.hdf5','r') as f_gzip:
+            assert f_lzf[f'{default.increments[0]}/phase/pheno_bcc/mechanical/F'].compression == 'lzf'
+            assert f_gzip[f'{default.increments[0]}/phase/pheno_bcc/mechanical/F'].compression == 'gzip'
+            assert f_gzip[f'{default.increments[0]}/geometry/u_n'].compression_opts == 6
+        assert str(Result(tmp_path/'lzf.hdf5').place()) == str(default.place())
+
+    def test_compression_export_DADF5_slabs(self,default,tmp_path,monkeypatch):
+        monkeypatch.setattr('damask._result.chunk_size',64)                                         # several slabs
+        default.view(compression='lzf',chunks=32).export_DADF5(tmp_path/'lzf.hdf5')
+        with h5py.File(default.fname,'r') as f_ref, h5py.File(tmp_path/'lzf.hdf5','r') as f_cur:
+            names = []
+            f_ref[default.increments[0]].visititems(lambda name,obj: names.append(name)
+                                                    if isinstance(obj,h5py.Dataset) and obj.ndim > 0 else None)
+            assert len(names) > 0
+            for name in ['/'.join([default.increments[0],n]) for n in names]:
+                assert f_cur[name].compression == 'lzf' and np.array_equal(f_cur[name][()],f_ref[name][()])
+
+    @pytest.mark.parametrize('compression,chunks',[('lz4',None),(('gzip',12),None),(('lzf',1),None),
+                                                   ('gzip',0)])
+    def test_compression_invalid(self,default,compression,chunks):
+        with pytest.raises(ValueError):
+            default.view(compression=compression,chunks=chunks)
+
+    def test_add_workers_invalid(self,default):
+        with pytest.raises(ValueError):
+            default.add_absolute('F',workers=0)
+
     def test_add_invalid_dataset(self,default):
         with pytest.raises(TypeError):
             default.add_calculation('#invalid#*2')
@@ -331,6 +571,11 @@ class TestResult:
         with pytest.raises(NotImplementedError):
             result.add_curl('F')
 
+    @pytest.mark.parametrize('workers',[1,2])
+    def test_add_generic_grid_no_increments(self,default,workers):
+        with pytest.raises(RuntimeError):
+            default.view(increments=False).add_curl('F',workers=workers)
+
 
     @pytest.mark.parametrize('shape',['vector','tensor'])
     def test_add_curl(self,default,shape):
@@ -342,6 +587,17 @@ class TestResult:
         in_memory = grid_filters.curl(default.size,x.reshape(tuple(default.cells)+x.shape[1:])).reshape(in_file.shape)
         assert (in_file == in_memory).all()
 
+    @pytest.mark.parametrize('workers',[2,3,20])
+    def test_add_generic_grid_workers(self,default,workers):
+        default = default.view(increments=True)
+        default.add_curl('F',workers=workers)
+        default.add_divergence('F',workers=workers)
+        for label,ref in zip(['curl(F)','divergence(F)'],[grid_filters.curl,grid_filters.divergence]):
+            for inc,F in default.iterate(['F',label],placed=True):
+                in_file = F[label]
+                in_memory = ref(default.size,F['F'].reshape(tuple(default.cells)+(3,3))).reshape(in_file.shape)
+                assert np.allclose(in_file,in_memory)
+
     @pytest.mark.parametrize('shape',['vector','tensor'])
     def test_add_divergence(self,default,shape):
         if shape == 'vector': default.add_calculation('#F#[:,:,0]','x','1','just a vector')
@@ -410,6 +666,47 @@ class TestResult:
             with pytest.raises(PermissionError):
                 default.remove('F')
 
+    def test_rename_multiple(self,default):
+        F,P = default.place(['F','P']).values()
+        unsafe = default.view(protected=False)
+        unsafe.rename(['F','P'],['def_grad','stress'])
+        assert unsafe.get(['F','P']) is None
+        assert np.all(F == unsafe.place('def_grad')) and np.all(P == unsafe.place('stress'))
+
+    def test_rename_invalid(self,default):
+        with pytest.raises(ValueError):
+            default.view(protected=False).rename(['F','P'],'def_grad')
+
+    @pytest.mark.parametrize('repack',[True,False])
+    def test_remove_multiple(self,default,repack):
+        unsafe = default.view(protected=False)
+        unsafe.add_stress_Cauchy()
+        unsafe.add_equivalent_Mises('sigma')
+        unsafe.add_strain()
+        unsafe.add_equivalent_Mises('epsilon_V^0.0(F)')
+        size = os.path.getsize(default.fname)
+        removed = sum(v.nbytes for v in default.get(['*_vM','F_e','F_p'],labelled=True).values())
+        ref = default.get(['sigma','F'])
+        with unsafe.session():
+            unsafe.remove(['F_*','*_vM'],repack=repack)
+            assert default.get(['*_vM','F_e','F_p']) is None
+            assert dict_equal(default.get(['sigma','F']),ref)
+        assert Result(default.fname).view(times=20.0).get(['*_vM','F_e','F_p']) is None
+        assert (os.path.getsize(default.fname) <= size - removed) == repack
+
+    def test_remove_repack_links(self,default):
+        with h5py.File(default.fname,'a') as f:
+            last = sorted(k for k in f if k.startswith('increment_'))[-1]
+            f['current'] = h5py.SoftLink(last)
+            f['alias'] = f[last]
+        size = os.path.getsize(default.fname)
+        default.view(protected=False).remove('F_e',repack=True)
+        with h5py.File(default.fname,'r') as f:
+            assert isinstance(f.get('current',getlink=True),h5py.SoftLink)
+            assert f.get('current',getlink=True).path == last
+            assert f['alias'] == f[last]
+        assert os.path.getsize(default.fname) < size
+
     @pytest.mark.parametrize('mode',['cell','node'])
     def test_coordinates(self,default,mode):
         if   mode == 'cell':
@@ -468,6 +765,77 @@ class TestResult:
         single_phase.export_VTK(mode='point',target_dir=export_dir,parallel=False)
         assert set(os.listdir(export_dir)) == set([f'{single_phase.fname.stem}_inc{i:02}.vtp' for i in range(0,40+1,4)])
 
+    @pytest.mark.parametrize('workers,writers,parallel',[(1,1,True),(2,1,False),(3,2,True)])
+    def test_vtk_pipeline(self,tmp_path,single_phase,workers,writers,parallel):
+        single_phase.export_VTK(target_dir=tmp_path/'serial',parallel=False)
+        stats = single_phase.export_VTK(target_dir=tmp_path/'pipeline',parallel=parallel,
+                                        workers=workers,writers=writers)
+        assert np.array_equal(stats.get('increment').flatten(),range(0,40+1,4))
+        assert np.all(stats.get('size') > 0)
+        stats.save(tmp_path/'stats.txt')
+        for fname in os.listdir(tmp_path/'serial'):
+            ref,cur = VTK.load(tmp_path/'serial'/fname),VTK.load(tmp_path/'pipeline'/fname)
+            for label in ref.labels['Cell Data']:
+                assert np.array_equal(ref.get(label),cur.get(label),equal_nan=True)
+
+    def test_vtk_session(self,tmp_path,single_phase):
+        r = single_phase.view(increments=[0,4])
+        with r.session():
+            r.add_calculation('#F#*2','x')
+            r.export_VTK(output='x',target_dir=tmp_path/'pipeline',workers=2)
+        r.export_VTK(output='x',target_dir=tmp_path/'serial',parallel=False)
+        for fname in os.listdir(tmp_path/'serial'):
+            ref,cur = VTK.load(tmp_path/'serial'/fname),VTK.load(tmp_path/'pipeline'/fname)
+            assert len(ref.labels['Cell Data']) == 1
+            for label in ref.labels['Cell Data']:
+                assert np.array_equal(ref.get(label),cur.get(label))
+
+    def test_vtk_writers_not_parallel(self,tmp_path,single_phase,monkeypatch):
+        def fork(*args,**kwargs):
+            raise AssertionError('worker pool started')
+        monkeypatch.setattr('damask._result.mp.get_context',fork)
+        single_phase.view(increments=[0,4]).export_VTK(target_dir=tmp_path/'export',parallel=False,writers=2)
+        assert len(os.listdir(tmp_path/'export')) == 2
+
+    @pytest.mark.parametrize('workers,parallel',[(1,False),(2,False),(1,True)])
+    def test_vtk_buffers(self,tmp_path,default,workers,parallel):
+        r = default.view(increments=[0,20,40])
+        for inc,phase in zip(r.increments,['pheno_bcc','pheno_fcc','pheno_bcc']):
+            r.view(increments=inc,phases=phase).add_calculation('#F#*2','x')
+        r.export_VTK('x',target_dir=tmp_path,parallel=parallel,workers=workers)
+        for inc,placed in r.view(fields='mechanical').iterate('x',placed=True):
+            v = VTK.load(tmp_path/f'{r.fname.stem}_inc{inc.split("_")[-1]:>02}.vti')
+            assert np.array_equal(v.get('phase/mechanical/x / n/a').reshape(placed.shape),
+                                  placed.filled(np.nan).astype(np.float32),equal_nan=True)
+
+    @pytest.mark.parametrize('fname,mode',[('12grains6x7x8_tensionY.hdf5','cell'),
+                                           ('12grains6x7x8_tensionY.hdf5','point'),
+                                           ('check_compile_job1.hdf5','cell')])
+    @pytest.mark.parametrize('workers',[1,2])
+    def test_vtk_time_series(self,tmp_path,res_path,fname,mode,workers):
+        vtkIOHDF = pytest.importorskip('vtkmodules.vtkIOHDF')
+        result = Result(res_path/fname)
+        result.export_VTK(mode=mode,target_dir=tmp_path/'files',parallel=False)
+        stats = result.export_VTK(mode=mode,target_dir=tmp_path,time_series=True,workers=workers)
+        assert np.array_equal(stats.get('increment').flatten(),result._incs)
+        reader = vtkIOHDF.vtkHDFReader()
+        reader.SetFileName(str(tmp_path/f'{result.fname.stem}.vtkhdf'))
+        reader.UpdateInformation()
+        assert reader.GetNumberOfSteps() == len(result.increments)
+        for step,f in enumerate(sorted(os.listdir(tmp_path/'files'))):
+            reader.SetStep(step)
+            reader.Update()
+            cur,ref = VTK(reader.GetOutput()),VTK.load(tmp_path/'files'/f)
+            assert (cur.N_points,cur.N_cells) == (ref.N_points,ref.N_cells)
+            for at in ['Point Data'] + (['Cell Data'] if mode == 'cell' else []):
+                assert sorted(l.replace('\u2215','/') for l in cur.labels[at]) == sorted(ref.labels[at])
+                for label in cur.labels[at]:
+                    assert np.array_equal(cur.get(label),ref.get(label.replace('\u2215','/')),equal_nan=True)
+
+    def test_vtk_pipeline_invalid(self,tmp_path,single_phase):
+        with pytest.raises(ValueError):
+            single_phase.export_VTK(target_dir=tmp_path,workers=0)
+
     def test_export_DREAM3D(self,tmp_path,res_path,h5py_dataset_iterator):
         result = Result(res_path/'2phase_irregularGrid_tensionX_material.hdf5').view(increments=0)  # compare the initial data only
         result.export_DREAM3D(target_dir=tmp_path)
@@ -530,9 +898,35 @@ class TestResult:
         bounds_vti = reader_vti.GetOutput().GetBounds()
         assert dim_vti == dim_xdmf and bounds_vti == bounds_xdmf
 
-    def test_XDMF_invalid(self,default):
+    def test_XDMF_invalid(self,res_path):
         with pytest.raises(NotImplementedError):
-            default.export_XDMF()
+            Result(res_path/'check_compile_job1.hdf5').export_XDMF()
+
+    @pytest.mark.skipif(not hasattr(vtkXdmfReader,'GetOutput'),reason='https://discourse.vtk.org/t/2450')
+    @pytest.mark.parametrize('fname',['12grains6x7x8_tensionY.hdf5','4grains2x4x3_compressionY.hdf5'])
+    def test_XDMF_virtual(self,tmp_path,res_path,fname):
+        result = Result(res_path/fname).view(increments=-1)
+        result.export_XDMF(target_dir=tmp_path)
+        assert (tmp_path/f'{result.fname.stem}_virtual.hdf5').exists()
+        reader_xdmf = vtkXdmfReader()
+        reader_xdmf.SetFileName(tmp_path/result.fname.with_suffix('.xdmf').name)
+        reader_xdmf.Update()
+        cell_data = reader_xdmf.GetOutput().GetCellData()
+        for ty,data in result.place(['F','Delta_V'],flatten=False)[result.increments[0]].items():
+            for label,ref in data['mechanical'].items():
+                cur = vtk_to_numpy(cell_data.GetArray(f"{ty}/mechanical/{label} / {ref.dtype.metadata['unit']}"))
+                assert np.allclose(cur.reshape(len(ref),-1),ref.filled(np.nan).reshape(len(ref),-1),equal_nan=True)
+
+    def test_XDMF_virtual_many_grains(self,tmp_path,synthetic):
+        result = Result(synthetic(cells=12,N_increments=2,N_phases=3,N_constituents=1,N_grains=300))
+        result.export_XDMF(target_dir=tmp_path)
+        data = result.place(flatten=False)
+        with h5py.File(tmp_path/f'{result.fname.stem}_virtual.hdf5','r') as f:
+            for inc in result.increments:
+                for out in ['F','P','O']:
+                    d = f[f'{inc}/phase/mechanical/{out}']
+                    assert len(d.virtual_sources()) == len(result.phases)
+                    assert np.array_equal(d[()],data[inc]['phase']['mechanical'][out])
 
     def test_XDMF_custom_path(self,single_phase,tmp_path):
         os.chdir(tmp_path)
@@ -617,6 +1011,213 @@ class TestResult:
             ref = pickle.load(f)
             assert cur is None if ref is None else dict_equal(cur,ref)
 
+    @pytest.mark.parametrize('view',[{},{'phases':['A','C']},{'phases':False}])
+    def test_place_masked(self,res_path,view):
+        result = Result(res_path/'4grains2x4x3_compressionY.hdf5').view(increments=-1,**view)
+        masked = result.place(flatten=False,labelled=True,fill_int=-1)
+        unmasked = result.place(flatten=False,labelled=True,fill_int=-1,masked=False)
+        assert list(masked) == list(unmasked)
+        for key,(data,valid) in unmasked.items():
+            m = np.ma.getmaskarray(masked[key])
+            assert np.array_equal(data,masked[key].filled(),equal_nan=data.dtype.kind == 'f')
+            assert np.array_equal(valid,~m.reshape(len(m),-1).any(axis=1))
+
+    @pytest.mark.parametrize('output',['F','*',['P','u_n']])
+    def test_get_lazy(self,res_path,output):
+        result = Result(res_path/'4grains2x4x3_compressionY.hdf5')
+        lazy = result.get(output,False,True,lazy=True)
+        eager = result.get(output,False,True)
+        for inc in eager:
+            for ty in eager[inc]:
+                for label in eager[inc][ty]:
+                    if ty == 'geometry':
+                        assert np.array_equal(lazy[inc][ty][label][()],eager[inc][ty][label])
+                        continue
+                    for field in eager[inc][ty][label]:
+                        for out in eager[inc][ty][label][field]:
+                            a = eager[inc][ty][label][field][out]
+                            b = lazy[inc][ty][label][field][out]
+                            assert b.shape == a.shape and str(b.dtype.metadata) == str(a.dtype.metadata)
+                            assert np.array_equal(np.asarray(b),a) and np.array_equal(b[1:3],a[1:3])
+
+    @pytest.mark.parametrize('placed',[False,True])
+    def test_iterate(self,res_path,placed):
+        result = Result(res_path/'4grains2x4x3_compressionY.hdf5').view(increments=[0,4,8])
+        incs = []
+        for inc,data in result.iterate(['F','P'],placed):
+            ref = result.view(increments=inc)
+            assert dict_equal(data,ref.place(['F','P']) if placed else ref.get(['F','P']))
+            incs.append(inc)
+        assert incs == result.increments
+
+    @pytest.mark.parametrize('placed',[True,False])
+    @pytest.mark.parametrize('flatten',[True,False])
+    def test_labelled(self,res_path,placed,flatten):
+        result = Result(res_path/'4grains2x4x3_compressionY.hdf5').view(increments=[0,4])
+        collect = result.place if placed else result.get
+        labelled = collect(['F','P','u_n'],labelled=True)
+        assert str(labelled.to_dict(flatten)) == str(collect(['F','P','u_n'],flatten))
+        assert labelled.coords['increment'] == result.increments
+        assert set(labelled.coords['output']) == ({f'{o}#{c}' for o in ['F','P'] for c in range(result.N_constituents)}
+                                                  |{'u_n'} if placed else {'F','P','u_n'})
+
+    def test_labelled_sel(self,res_path):
+        result = Result(res_path/'4grains2x4x3_compressionY.hdf5').view(increments=[0,4])
+        inc = result.increments[1]
+        labelled = result.get(['F','P','u_n'],labelled=True)
+        F = labelled.sel(increment=inc,type='phase',output='F')
+        assert F.dims == ('label','field')
+        assert np.array_equal(F['A','mechanical'],result.view(increments=inc,phases='A').get('F'))
+        assert F['A','mechanical'] is labelled[inc,'phase','A','mechanical','F']
+        assert labelled.sel(type='geometry',output='u_n',increment=inc).to_dict() is labelled[inc,'geometry',None,None,'u_n']
+        assert len(labelled.sel(output=['F','P'])) == len(labelled) - len(result.increments)
+
+    def test_labelled_sel_invalid(self,res_path):
+        with pytest.raises(ValueError):
+            Result(res_path/'4grains2x4x3_compressionY.hdf5').get('F',labelled=True).sel(phase='A')
+
+    def test_labelled_empty(self,default):
+        assert default.get('non-existing',labelled=True) is None
+
+    @pytest.mark.parametrize('by',['phase','material'])
+    @pytest.mark.parametrize('points',[None,[17,0,5,22,23]])
+    @pytest.mark.parametrize('workers',[1,2])
+    def test_reduce(self,res_path,by,points,workers):
+        result = Result(res_path/'4grains2x4x3_compressionY.hdf5').view(increments=[0,4,8],phases=['A','C'])
+        if points is not None: result = result.view(points=points)
+        t = result.reduce('L_p',['mean','std','min','max','sum','count','histogram'],by,bins=[-1e3,0,1e3],
+                          workers=workers)
+        rows = 0
+        for inc,data in result.iterate('L_p',flatten=False):
+            data = data[inc]['phase']
+            groups = {label:d['mechanical']['L_p'] for label,d in data.items()} if by == 'phase' else \
+                     {'material':np.concatenate([d['mechanical']['L_p'] for d in data.values()])}
+            for group,P in groups.items():
+                row = (t.get('increment').flatten() == int(inc.split('_')[-1])) & \
+                      (True if by == 'material' else t.get('phase').flatten() == group)
+                assert np.count_nonzero(row) == 1
+                for op,ref in zip(['mean','std','min','max','sum','count'],
+                                  [np.mean(P,0),np.std(P,0),np.min(P,0),np.max(P,0),np.sum(P,0),len(P)]):
+                    assert np.allclose(t.get(f'{op}(L_p)')[row],ref)
+                assert np.array_equal(t.get('histogram(L_p)')[row][0],
+                                      np.stack([np.count_nonzero(P<0,axis=0),np.count_nonzero(P>=0,axis=0)],-1))
+                rows += 1
+        assert len(t) == rows
+
+    def test_reduce_session(self,default):
+        with default.session():
+            default.add_calculation('#F#*2','x')
+            t = default.reduce('x',['mean','max'],'phase',workers=2)
+        assert t == default.reduce('x',['mean','max'],'phase')
+
+    def test_reduce_homogenization(self,res_path):
+        result = Result(res_path/'4grains2x4x3_compressionY.hdf5')
+        t = result.reduce('F',['count','mean'],'homogenization')
+        assert np.all(t.get('count(F)') == result.N_materialpoints*result.N_constituents)
+        assert np.allclose(t.get('mean(F)'),result.reduce('F',by='material').get('mean(F)'))
+        t = result.view(phases=False).reduce('M','max','homogenization')
+        assert np.allclose(t.get('max(M)'),[np.max(M,0) for M in result.get('M').values()])
+
+    def test_reduce_chunked(self,monkeypatch,default):
+        monkeypatch.setattr('damask._result.chunk_size',64)
+        default.view(chunks=64).add_calculation('#F#*2','x')
+        t = default.reduce('x',['mean','std','min','max','histogram'],'material',bins=5)
+        x = np.concatenate(list(default.get('x').values()))
+        for op,ref in zip(['mean','std','min','max'],[np.mean(x,0),np.std(x,0),np.min(x,0),np.max(x,0)]):
+            assert np.allclose(t.get(f'{op}(x)'),ref)
+        assert np.all(t.get('histogram(x)').sum(axis=-1) == default.N_materialpoints)
+        edges = np.array(t.comments[-1].split(':')[-1].split(),float)
+        assert np.isclose(edges[0],x.min()) and np.isclose(edges[-1],x.max())
+        t.save(default.fname.with_suffix('.txt'))
+
+    @pytest.mark.parametrize('op,by',[('median','phase'),('mean','grain')])
+    def test_reduce_invalid(self,default,op,by):
+        with pytest.raises(ValueError):
+            default.reduce('F',op,by)
+
+    @pytest.mark.parametrize('output',['F','O'])
+    @pytest.mark.parametrize('constituent',[0,1])
+    def test_time_series(self,res_path,output,constituent):
+        result = Result(res_path/'4grains2x4x3_compressionY.hdf5').view(homogenizations=False)
+        points = [17,0,-1,5,17]
+        cur = result.time_series(output,points,constituent)
+        assert cur.shape[:2] == (len(result.increments),len(points))
+        for i,(inc,data) in enumerate(result.iterate(output,True,constituents=constituent)):
+            assert np.array_equal(cur.mask[i],data.mask[points]) and \
+                   np.allclose(cur[i].filled(0),data[points].filled(0))
+
+    def test_time_series_invalid(self,res_path,tmp_path):
+        shutil.copy(res_path/'4grains2x4x3_compressionY.hdf5',tmp_path)
+        result = Result(tmp_path/'4grains2x4x3_compressionY.hdf5')
+        with pytest.raises(IndexError):
+            result.time_series('F',result.N_materialpoints)
+        assert result.time_series('non-existing',0) is None
+        result.add_calculation('#Delta_V#','F')
+        with pytest.raises(ValueError):
+            result.time_series('F',0)
+
+    @pytest.mark.parametrize('points',[[17,0,5,23],np.arange(24)%3 == 0,(slice(0,2),slice(1,3),slice(None))])
+    def test_view_points(self,res_path,points):
+        result = Result(res_path/'4grains2x4x3_compressionY.hdf5').view(increments=-1)
+        subset = result.view(points=points)
+        selected = subset._points
+        for output in ['F','O','Delta_V','u_p']:
+            full,cur = result.place(output,constituents=1),subset.place(output,constituents=1)
+            assert np.array_equal(np.ma.getmaskarray(cur),np.ma.getmaskarray(full)[selected]) and \
+                   np.array_equal(cur.filled(0),full[selected].filled(0))
+
+    def test_view_points_equivalent(self,res_path):
+        result = Result(res_path/'4grains2x4x3_compressionY.hdf5')
+        mask = np.zeros(result.cells,bool)
+        mask[1:,:2,1] = True
+        ref = result.view(points=(slice(1,None),slice(0,2),slice(1,2)))._points
+        assert np.array_equal(ref,result.view(points=mask)._points)
+        assert np.array_equal(ref,result.view(points=np.flatnonzero(mask.flatten(order='F'))[::-1])._points)
+        assert result.view(points=ref).view_all()._points is None
+
+    def test_view_points_get(self,res_path):
+        result = Result(res_path/'4grains2x4x3_compressionY.hdf5').view(increments=-1,phases='A',
+                                                                          homogenizations=False)
+        subset = result.view(points=[3,4,11])
+        full,cur = result.get('F'),subset.get('F')
+        rows = np.unique(np.concatenate([m['A'][np.isin(c['A'],[3,4,11])]
+                                         for c,m in zip(*result._mappings()[:2])]))
+        assert np.array_equal(cur,full[rows])
+
+    def test_view_points_add(self,res_path,tmp_path):
+        shutil.copy(res_path/'4grains2x4x3_compressionY.hdf5',tmp_path)
+        result = Result(tmp_path/'4grains2x4x3_compressionY.hdf5').view(increments=-1)
+        points = [0,1,2,12,13]
+        result.view(points=points).add_determinant('F')
+        cur = result.place('det(F)',constituents=0)
+        ref = np.linalg.det(result.place('F',constituents=0))
+        assert np.allclose(cur[points],ref[points])
+        assert np.all(np.isnan(np.delete(cur.filled(np.nan),points)))
+
+    @pytest.mark.parametrize('mode',['cell','point'])
+    def test_view_points_vtk(self,res_path,tmp_path,mode):
+        result = Result(res_path/'4grains2x4x3_compressionY.hdf5').view(increments=-1)
+        points = (slice(0,2),slice(1,3),slice(None))
+        for r,d in [(result,'full'),(result.view(points=points),'sub')]:
+            r.export_VTK('F',mode,constituents=0,target_dir=tmp_path/d,parallel=False)
+        full,sub = [VTK.load(next((tmp_path/d).iterdir())) for d in ['full','sub']]
+        label = 'phase/mechanical/F / 1'
+        selected = np.arange(result.N_materialpoints).reshape(result.cells,order='F')[points].flatten(order='F')
+        assert np.array_equal(sub.get(label),full.get(label)[selected])
+
+    def test_view_points_invalid(self,res_path,single_phase):
+        result = Result(res_path/'4grains2x4x3_compressionY.hdf5')
+        with pytest.raises(IndexError):
+            result.view(points=[result.N_materialpoints])
+        with pytest.raises(ValueError):
+            result.view(points=np.ones(3,bool))
+        with pytest.raises(ValueError):
+            result.view(points=(slice(None),slice(None)))
+        with pytest.raises(NotImplementedError):
+            result.view(points=[0]).get('F',lazy=True)
+        with pytest.raises(NotImplementedError):
+            single_phase.view(points=[0]).add_curl('F')
+
     def test_simulation_setup_files(self,default):
         assert set(default.simulation_setup_files) == set(['12grains6x7x8.vti',
                                                             'material.yaml',
@@ -694,3 +1295,42 @@ class TestResult:
         m = grid_filters.regrid(r.size,np.broadcast_to(np.eye(3),tuple(r.cells)+(3,3)),r.cells*2)
         r.export_DADF5(tmp_path/'regridded.hdf5',mapping=m)
         assert np.all(Result(tmp_path/'regridded.hdf5').cells == r.cells*2)
+
+    @pytest.mark.parametrize('workers',[1,2])
+    def test_export_DADF5_regrid_data(self,monkeypatch,res_path,tmp_path,workers):
+        monkeypatch.setattr('damask._result.chunk_size',64)                                         # several chunks
+        r = Result(res_path/'4grains2x4x3_compressionY.hdf5').view(increments=[0,4],homogenizations=False)
+        m = grid_filters.regrid(r.size,np.broadcast_to(np.eye(3),tuple(r.cells)+(3,3)),r.cells*[2,1,3])
+        r.export_DADF5(tmp_path/'regridded.hdf5',mapping=m,workers=workers)
+        r_exp = Result(tmp_path/'regridded.hdf5')
+        m_flat = m.flatten(order='F')
+        assert np.array_equal(r_exp.phase,r.phase[m_flat]) and np.array_equal(r_exp.homogenization,r.homogenization[m_flat])
+        for (inc,ref),(inc_exp,cur) in zip(r.iterate(['F','F_p'],placed=True),r_exp.iterate(['F','F_p'],placed=True)):
+            assert inc == inc_exp
+            for label in ref:
+                assert np.array_equal(cur[label].mask,ref[label][m_flat].mask) \
+                   and np.array_equal(cur[label].filled(0),ref[label][m_flat].filled(0))
+        assert len(os.listdir(tmp_path)) == 1
+
+    def test_export_DADF5_regrid_u_n(self,res_path,tmp_path):
+        r = Result(res_path/'12grains6x7x8_tensionY.hdf5').view(increments=-1)
+        cells = r.cells+np.array([3,1,2])
+        m = grid_filters.regrid(r.size,np.broadcast_to(np.eye(3),tuple(r.cells)+(3,3)),cells)
+        r.export_DADF5(tmp_path/'regridded.hdf5',mapping=m)
+        regridded = Result(tmp_path/'regridded.hdf5')
+        u_p = regridded.get('u_p')
+        assert np.array_equal(regridded.cells,cells) and np.array_equal(u_p,r.get('u_p')[m.flatten(order='F')])
+        delta = r.size/cells
+        interpolator = interpolate.RegularGridInterpolator([np.linspace(delta[i]/2,r.size[i]-delta[i]/2,cells[i])
+                                                            for i in range(3)],
+                                                           u_p.reshape(tuple(cells)+(3,),order='F'),
+                                                           bounds_error=False,fill_value=None)
+        u_n = interpolator(grid_filters.coordinates0_node(cells,r.size).reshape(-1,3,order='F'))
+        assert np.allclose(regridded.get('u_n'),u_n,rtol=1e-12,atol=1e-12*np.abs(u_p).max())
+
+    @pytest.mark.parametrize('workers',[2,3])
+    def test_export_DADF5_workers(self,res_path,tmp_path,workers):
+        r = Result(res_path/'12grains6x7x8_tensionY.hdf5')
+        r.export_DADF5(tmp_path/'serial.hdf5')
+        r.view(compression='lzf',chunks=64).export_DADF5(tmp_path/'parallel.hdf5',workers=workers)
+        assert str(Result(tmp_path/'serial.hdf5').get()) == str(Result(tmp_path/'parallel.hdf5').get())